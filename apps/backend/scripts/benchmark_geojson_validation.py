@@ -0,0 +1,100 @@
+"""Compare request-model validation of large GeoJSON geometries with a bulk NumPy check.
+
+The bulk column is a lower bound for any NumPy fast path: it only flattens the positions
+into one array and checks ranges and ring closure, without building models or errors.
+
+Run from apps/backend: python -m scripts.benchmark_geojson_validation [--vertices 50000]
+
+Measured with pydantic 2.10 / numpy 2.4, 50000 vertices, mean of 20 iterations over three runs:
+
+    LineString     models   8.2-12.6 ms   bulk  7.5-9.5 ms
+    Polygon        models   9.0-12.1 ms   bulk  7.0-8.7 ms
+    MultiPolygon   models   7.5-12.4 ms   bulk  8.5-9.1 ms
+
+The Field(ge=..., le=...) constraints already run inside pydantic-core, so the bulk check
+saves at most a few milliseconds, and only before it produces anything. A validator that
+also returned the same geometry models with the same errors measured 23-28 ms on these
+inputs. The request models are therefore kept as the only geometry validation path.
+"""
+
+import argparse
+import math
+import timeit
+from itertools import chain
+
+import numpy as np
+from pydantic import TypeAdapter
+
+from utility_service.use_cases.schemas.geojson.geojson import FeatureGeometry
+
+FEATURE_GEOMETRY_ADAPTER = TypeAdapter(FeatureGeometry)
+POSITION_LIST_DEPTHS = {"LineString": 1, "Polygon": 2, "MultiPolygon": 3}
+
+
+def build_ring(center_x: float, center_y: float, vertices: int) -> list[list[float]]:
+    ring = [
+        [
+            center_x + math.cos(2 * math.pi * i / vertices),
+            center_y + math.sin(2 * math.pi * i / vertices),
+        ]
+        for i in range(vertices)
+    ]
+    ring.append(ring[0])
+    return ring
+
+
+def build_geometries(vertices: int) -> dict[str, dict[str, object]]:
+    half = vertices // 2
+    return {
+        "LineString": {"type": "LineString", "coordinates": build_ring(0, 0, vertices)},
+        "Polygon": {"type": "Polygon", "coordinates": [build_ring(0, 0, vertices)]},
+        "MultiPolygon": {
+            "type": "MultiPolygon",
+            "coordinates": [[build_ring(0, 0, half)], [build_ring(10, 10, half)]],
+        },
+    }
+
+
+def collect_position_lists(coordinates: list, depth: int) -> list[list]:
+    if depth == 1:
+        return [coordinates]
+    return list(
+        chain.from_iterable(collect_position_lists(part, depth - 1) for part in coordinates)
+    )
+
+
+def bulk_check(geometry: dict[str, object]) -> bool:
+    lines = collect_position_lists(geometry["coordinates"], POSITION_LIST_DEPTHS[geometry["type"]])
+    values = list(chain.from_iterable(chain.from_iterable(lines)))
+    xy = np.fromiter(values, dtype=np.float64, count=len(values)).reshape(-1, 2)
+    x, y = xy[:, 0], xy[:, 1]
+    if not ((x >= -180) & (x <= 180) & (y >= -90) & (y <= 90)).all():
+        return False
+    if geometry["type"] == "LineString":
+        return True
+    ends = np.cumsum([len(line) for line in lines])
+    starts = ends - np.asarray([len(line) for line in lines])
+    return bool((xy[starts] == xy[ends - 1]).all())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, geometry in build_geometries(args.vertices).items():
+        FEATURE_GEOMETRY_ADAPTER.validate_python(geometry)
+        assert bulk_check(geometry)
+        models = timeit.timeit(
+            lambda: FEATURE_GEOMETRY_ADAPTER.validate_python(geometry), number=args.repeat
+        )
+        bulk = timeit.timeit(lambda: bulk_check(geometry), number=args.repeat)
+        print(
+            f"{name:<13} models {models / args.repeat * 1000:8.2f} ms"
+            f"   bulk {bulk / args.repeat * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+from shapely.geometry import Point, Polygon, mapping
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from utility_service.domain_services.spatial_filter import parse_spatial_filter
+from utility_service.infrastructure.postgresql.models.feature_point import FeaturePoint
+from utility_service.infrastructure.postgresql.repositories.layer_repository import (
+    FILTER_SUBDIVIDE_MAX_VERTICES,
+    LayerRepository,
+)
+from tests.integration_tests.network_db_support import run_in_rollback_transaction
+
+POINT_LAYER = SimpleNamespace(id=uuid4(), storage_table="feature_points")
+TEETH = FILTER_SUBDIVIDE_MAX_VERTICES
+TOOTH_STEP = 0.01
+
+
+def comb_polygon() -> Polygon:
+    # A comb has far more vertices than one subdivided piece may hold, so the filter is
+    # split into many pieces and the base strip is shared by several of them.
+    shell = [(0.0, 0.0)]
+    for tooth in range(TEETH):
+        x = tooth * TOOTH_STEP
+        shell += [(x, 1.0), (x + TOOTH_STEP / 2, 1.0), (x + TOOTH_STEP / 2, 0.1)]
+        shell += [(x + TOOTH_STEP, 0.1)]
+    shell += [(TEETH * TOOTH_STEP, 0.0)]
+    return Polygon(shell)
+
+
+def test_list_features_filter_matches_each_feature_once_across_polygon_pieces() -> None:
+    async def scenario(session: AsyncSession) -> None:
+        polygon = comb_polygon()
+        inside = [Point(tooth * TOOTH_STEP + 0.0025, 0.5) for tooth in range(0, TEETH, 40)]
+        inside += [Point(TEETH * TOOTH_STEP / 2, 0.05)]
+        outside = [Point(TOOTH_STEP * 0.75, 0.5), Point(-1.0, 0.5)]
+        ids = {}
+        for point in [*inside, *outside]:
+            ids[point.wkt] = uuid4()
+            await session.execute(
+                FeaturePoint.__table__.insert().values(
+                    id=ids[point.wkt],
+                    geom=func.ST_GeomFromText(point.wkt, 4326),
+                    properties={},
+                )
+            )
+        pieces = await session.scalar(
+            select(func.count()).select_from(
+                func.ST_Subdivide(
+                    func.ST_GeomFromText(polygon.wkt, 4326), FILTER_SUBDIVIDE_MAX_VERTICES
+                ).table_valued("geom")
+            )
+        )
+
+        rows, truncated, _ = await LayerRepository(session).list_features_filter(
+            POINT_LAYER, parse_spatial_filter(mapping(polygon), None), 1000
+        )
+
+        assert pieces > 1
+        assert truncated is False
+        returned = [row.id for row in rows if row.id in set(ids.values())]
+        assert len(returned) == len(set(returned))
+        assert set(returned) == {ids[point.wkt] for point in inside}
+
+    run_in_rollback_transaction(scenario)
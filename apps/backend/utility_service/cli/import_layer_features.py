@@ -0,0 +1,64 @@
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import get_args
+from uuid import UUID
+
+from utility_service.use_cases.schemas.feature.feature_import_out import FeatureImportOut
+from utility_service.use_cases.services.geojson_feature_stream import (
+    FeatureStreamFormat,
+    iter_stream_features,
+)
+
+READ_CHUNK_BYTES = 1024 * 1024
+NDJSON_SUFFIXES = {".ndjson", ".geojsonl", ".jsonl"}
+
+
+async def read_file_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := await asyncio.to_thread(file.read, READ_CHUNK_BYTES):
+            yield chunk
+
+
+def detect_stream_format(path: Path) -> FeatureStreamFormat:
+    return "ndjson" if path.suffix.lower() in NDJSON_SUFFIXES else "geojson"
+
+
+async def run_import(
+    layer_id: UUID, path: Path, stream_format: FeatureStreamFormat
+) -> FeatureImportOut:
+    from utility_service.infrastructure.postgresql.repositories.layer_repository import (
+        LayerRepository,
+    )
+    from utility_service.infrastructure.postgresql.session import SessionFactory, engine
+    from utility_service.use_cases.services.feature_import_service import FeatureImportService
+    from utility_service.utils.settings import settings
+
+    try:
+        async with SessionFactory() as session:
+            service = FeatureImportService(
+                session, LayerRepository(session), settings.feature_import_chunk_size
+            )
+            features = iter_stream_features(read_file_chunks(path), stream_format)
+            return await service.import_features(layer_id, features)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Импорт GeoJSON FeatureCollection или NDJSON в слой"
+    )
+    parser.add_argument("layer_id", type=UUID)
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=get_args(FeatureStreamFormat), default=None)
+    args = parser.parse_args(argv)
+
+    stream_format = args.format or detect_stream_format(args.path)
+    result = asyncio.run(run_import(args.layer_id, args.path, stream_format))
+    print(f"Импортировано объектов: {result.imported}, ревизия слоя: {result.revision}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import argparse
+import asyncio
+from uuid import UUID
+
+
+async def run_indexing(layer_id: UUID, keys: list[str]) -> list[str]:
+    from utility_service.infrastructure.postgresql.repositories.layer_repository import (
+        LayerRepository,
+    )
+    from utility_service.infrastructure.postgresql.repositories.property_index_repository import (
+        PropertyIndexRepository,
+    )
+    from utility_service.infrastructure.postgresql.session import SessionFactory, engine
+    from utility_service.use_cases.services.layer_service import LayerService
+    from utility_service.use_cases.services.property_index_service import PropertyIndexService
+
+    try:
+        async with SessionFactory() as session:
+            service = LayerService(session, LayerRepository(session))
+            keys = await service.set_indexed_properties(layer_id, keys)
+        # CREATE/DROP INDEX CONCURRENTLY does not block writes to the shared storage table,
+        # but cannot run inside a transaction.
+        async with engine.connect() as connection:
+            connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            await PropertyIndexService(PropertyIndexRepository(connection)).sync_property_indexes()
+        return keys
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Объявление индексируемых ключей свойств слоя и построение индексов"
+    )
+    parser.add_argument("layer_id", type=UUID)
+    parser.add_argument("keys", nargs="*")
+    args = parser.parse_args(argv)
+
+    keys = asyncio.run(run_indexing(args.layer_id, args.keys))
+    print(f"Индексируемые свойства слоя {args.layer_id}: {', '.join(keys) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
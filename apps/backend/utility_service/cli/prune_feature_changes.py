@@ -0,0 +1,38 @@
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+
+async def run_pruning(retention_days: int) -> int:
+    from utility_service.infrastructure.postgresql.repositories.layer_repository import (
+        LayerRepository,
+    )
+    from utility_service.infrastructure.postgresql.session import SessionFactory, engine
+
+    before = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    try:
+        async with SessionFactory() as session:
+            pruned = await LayerRepository(session).prune_feature_changes(before)
+            await session.commit()
+            return pruned
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    from utility_service.utils.settings import settings
+
+    parser = argparse.ArgumentParser(
+        description="Удаление устаревших записей журнала изменений объектов слоёв"
+    )
+    parser.add_argument("--days", type=int, default=settings.feature_changes_retention_days)
+    args = parser.parse_args(argv)
+    if args.days < 0:
+        parser.error("--days не может быть отрицательным")
+
+    pruned = asyncio.run(run_pruning(args.days))
+    print(f"Удалено записей журнала изменений: {pruned}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
 from dataclasses import dataclass
+from math import cos, radians
 
 from utility_service.use_cases.domain.exceptions.business_validation_exception import (
     BusinessValidationException,
 )
 
 
+# Lower bounds of the length of one degree on the WGS 84 ellipsoid, so a bbox expanded
+# with them always covers the whole distance.
+MIN_METERS_PER_LAT_DEGREE = 110_574.0
+MAX_METERS_PER_LON_DEGREE = 111_320.0
+
+
 @dataclass
 class Bbox:
     min_lon: float
@@ -38,3 +45,35 @@ def parse_bbox(bbox: str) -> Bbox:
         raise BusinessValidationException("Минимальная долгота должна быть меньше максимальной")
 
     return Bbox(min_lon, min_lat, max_lon, max_lat)
+
+
+def expand_bbox(bbox: Bbox, meters: float) -> Bbox:
+    lat_span = meters / MIN_METERS_PER_LAT_DEGREE
+    min_lat = max(bbox.min_lat - lat_span, -90.0)
+    max_lat = min(bbox.max_lat + lat_span, 90.0)
+    widest_lat = max(abs(min_lat), abs(max_lat))
+    if widest_lat >= 90.0:
+        return Bbox(-180.0, min_lat, 180.0, max_lat)
+    lon_span = meters / (MAX_METERS_PER_LON_DEGREE * cos(radians(widest_lat)))
+    if bbox.min_lon - lon_span < -180.0 or bbox.max_lon + lon_span > 180.0:
+        # The expanded area crosses the antimeridian, so the bbox keeps every longitude.
+        return Bbox(-180.0, min_lat, 180.0, max_lat)
+    return Bbox(bbox.min_lon - lon_span, min_lat, bbox.max_lon + lon_span, max_lat)
+
+
+def bboxes_intersect(left: Bbox, right: Bbox) -> bool:
+    return (
+        left.min_lon <= right.max_lon
+        and right.min_lon <= left.max_lon
+        and left.min_lat <= right.max_lat
+        and right.min_lat <= left.max_lat
+    )
+
+
+def union_bbox(bboxes: list[Bbox]) -> Bbox:
+    return Bbox(
+        min(bbox.min_lon for bbox in bboxes),
+        min(bbox.min_lat for bbox in bboxes),
+        max(bbox.max_lon for bbox in bboxes),
+        max(bbox.max_lat for bbox in bboxes),
+    )
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from math import floor
+
+from utility_service.domain_services.bbox import Bbox
+from utility_service.domain_services.geometry_rendering import tolerance_for_zoom
+from utility_service.domain_services.tile import MAX_TILE_ZOOM
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+AGGREGATE_CELL_PIXELS = 64
+MAX_AGGREGATE_CELLS = 16384
+GRID_ORIGIN_LON = -180.0
+GRID_ORIGIN_LAT = -90.0
+
+
+@dataclass(frozen=True)
+class AggregationGrid:
+    zoom: int
+    cell_size: float
+
+    def cell_span(self, bbox: Bbox) -> tuple[int, int]:
+        columns = floor((bbox.max_lon - GRID_ORIGIN_LON) / self.cell_size) - floor(
+            (bbox.min_lon - GRID_ORIGIN_LON) / self.cell_size
+        )
+        rows = floor((bbox.max_lat - GRID_ORIGIN_LAT) / self.cell_size) - floor(
+            (bbox.min_lat - GRID_ORIGIN_LAT) / self.cell_size
+        )
+        return (columns + 1, rows + 1)
+
+
+def aggregate_cell_size(zoom: int) -> float:
+    return tolerance_for_zoom(zoom) * AGGREGATE_CELL_PIXELS
+
+
+def parse_aggregation_grid(zoom: int, bbox: Bbox) -> AggregationGrid:
+    if not 0 <= zoom <= MAX_TILE_ZOOM:
+        raise BusinessValidationException(
+            f"Zoom должен принадлежать диапазону от 0 до {MAX_TILE_ZOOM}"
+        )
+
+    grid = AggregationGrid(zoom, aggregate_cell_size(zoom))
+    columns, rows = grid.cell_span(bbox)
+    if columns * rows > MAX_AGGREGATE_CELLS:
+        raise BusinessValidationException(
+            f"Bbox для масштаба {zoom} покрывает больше {MAX_AGGREGATE_CELLS} ячеек агрегации"
+        )
+    return grid
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+import math
+
+from utility_service.domain_services.bbox import Bbox
+
+# Mirrors getGridStepForZoom/getTilesForViewport in the frontend feature-grid.ts.
+GRID_STEPS = (0.2, 0.05, 0.01)
+MIN_LON = -180.0
+MAX_LON = 180.0
+MIN_LAT = -90.0
+MAX_LAT = 90.0
+GRID_EPS = 1e-9
+
+
+@dataclass(frozen=True)
+class GridCell:
+    step: float
+    x: int
+    y: int
+
+    @property
+    def bbox(self) -> Bbox:
+        min_lon = clamp(MIN_LON + self.x * self.step, MIN_LON, MAX_LON)
+        min_lat = clamp(MIN_LAT + self.y * self.step, MIN_LAT, MAX_LAT)
+        return Bbox(
+            min_lon,
+            min_lat,
+            clamp(min_lon + self.step, MIN_LON, MAX_LON),
+            clamp(min_lat + self.step, MIN_LAT, MAX_LAT),
+        )
+
+
+def match_grid_cell(bbox: Bbox) -> GridCell | None:
+    for step in GRID_STEPS:
+        x = round((bbox.min_lon - MIN_LON) / step)
+        y = round((bbox.min_lat - MIN_LAT) / step)
+        cell = GridCell(step, x, y)
+        if bboxes_match(cell.bbox, bbox):
+            return cell
+    return None
+
+
+def bboxes_match(left: Bbox, right: Bbox) -> bool:
+    return (
+        math.isclose(left.min_lon, right.min_lon, abs_tol=GRID_EPS)
+        and math.isclose(left.min_lat, right.min_lat, abs_tol=GRID_EPS)
+        and math.isclose(left.max_lon, right.max_lon, abs_tol=GRID_EPS)
+        and math.isclose(left.max_lat, right.max_lat, abs_tol=GRID_EPS)
+    )
+
+
+def clamp(value: float, min_value: float, max_value: float) -> float:
+    return min(max(value, min_value), max_value)
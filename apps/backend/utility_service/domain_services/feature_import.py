@@ -0,0 +1,104 @@
+import json
+import uuid
+from dataclasses import dataclass
+from uuid import UUID
+
+import shapely
+from shapely.errors import GEOSException
+
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+IMPORT_SRID = 4326
+
+
+@dataclass(frozen=True)
+class ImportedFeature:
+    id: UUID
+    geometry: bytes
+    extent: bytes
+    properties: str
+
+
+def to_imported_features(
+    features: list[object], geometry_type: str, first_index: int = 1
+) -> list[ImportedFeature]:
+    geometries_json: list[str] = []
+    properties_json: list[str] = []
+    for offset, feature in enumerate(features):
+        number = first_index + offset
+        if not isinstance(feature, dict) or feature.get("type") != "Feature":
+            raise BusinessValidationException(f"Объект №{number} не является GeoJSON Feature")
+        geometry = feature.get("geometry")
+        if not isinstance(geometry, dict) or geometry.get("type") != geometry_type:
+            raise BusinessValidationException(
+                f"Тип геометрии объекта №{number} не соответствует типу геометрии слоя"
+            )
+        properties = feature.get("properties")
+        if properties is None:
+            properties = {}
+        if not isinstance(properties, dict):
+            raise BusinessValidationException(f"Свойства объекта №{number} должны быть объектом")
+        geometries_json.append(json.dumps(geometry))
+        try:
+            properties_json.append(json.dumps(properties, allow_nan=False))
+        except (TypeError, ValueError) as e:
+            raise BusinessValidationException(
+                f"Свойства объекта №{number} содержат значения, недопустимые в JSON"
+            ) from e
+
+    geometries = parse_geometries(geometries_json, first_index)
+    empty = shapely.is_empty(geometries)
+    if empty.any():
+        raise BusinessValidationException(
+            f"Геометрия объекта №{first_index + int(empty.argmax())} пустая"
+        )
+    validate_geometries(geometries, first_index)
+    geometries = shapely.set_srid(geometries, IMPORT_SRID)
+    extents = shapely.set_srid(shapely.envelope(geometries), IMPORT_SRID)
+    return [
+        ImportedFeature(uuid.uuid4(), geometry, extent, properties)
+        for geometry, extent, properties in zip(
+            shapely.to_wkb(geometries, include_srid=True),
+            shapely.to_wkb(extents, include_srid=True),
+            properties_json,
+        )
+    ]
+
+
+def validate_geometries(geometries, first_index: int) -> None:
+    # Rejected here, before COPY, so the error names the feature instead of surfacing
+    # later as a failing PostGIS operation on stored data.
+    bounds = shapely.bounds(geometries)
+    out_of_range = (
+        (bounds[:, 0] < -180) | (bounds[:, 2] > 180) | (bounds[:, 1] < -90) | (bounds[:, 3] > 90)
+    )
+    if out_of_range.any():
+        raise BusinessValidationException(
+            f"Координаты объекта №{first_index + int(out_of_range.argmax())} "
+            "выходят за пределы EPSG:4326"
+        )
+    invalid = ~shapely.is_valid(geometries)
+    if invalid.any():
+        offset = int(invalid.argmax())
+        raise BusinessValidationException(
+            f"Невалидная геометрия у объекта №{first_index + offset}: "
+            f"{shapely.is_valid_reason(geometries[offset])}"
+        )
+
+
+def parse_geometries(geometries_json: list[str], first_index: int):
+    try:
+        return shapely.from_geojson(geometries_json)
+    except GEOSException:
+        # The vectorized parser does not say which element failed, so only the failing
+        # chunk is parsed again one geometry at a time to report its number.
+        for offset, geometry_json in enumerate(geometries_json):
+            try:
+                shapely.from_geojson(geometry_json)
+            except GEOSException as e:
+                raise BusinessValidationException(
+                    f"Некорректная геометрия у объекта №{first_index + offset}"
+                ) from e
+        raise
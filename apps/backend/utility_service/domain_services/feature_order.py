@@ -0,0 +1,59 @@
+import re
+from dataclasses import dataclass
+from typing import Literal
+from uuid import UUID
+
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+FeatureSort = Literal["id", "spatial"]
+SORT_KEY_LENGTH = 12
+# Empty geometries have an empty key and come first in spatial order.
+SORT_KEY_PATTERN = re.compile(rf"(?:[0123456789bcdefghjkmnpqrstuvwxyz]{{{SORT_KEY_LENGTH}}})?")
+
+
+@dataclass(frozen=True)
+class FeatureOrder:
+    sort: FeatureSort = "id"
+    after_key: str | None = None
+
+    @property
+    def spatial(self) -> bool:
+        return self.sort == "spatial"
+
+
+ID_ORDER = FeatureOrder()
+
+
+def format_feature_cursor(order: FeatureOrder, row) -> str:
+    if order.spatial:
+        return f"{row.sort_key}:{row.id}"
+    return str(row.id)
+
+
+def parse_feature_order(
+    sort: FeatureSort, after_id: UUID | None, after: str | None
+) -> tuple[FeatureOrder, UUID | None]:
+    if sort == "id":
+        if after is not None:
+            raise BusinessValidationException("Курсор after используется только с sort=spatial")
+        return ID_ORDER, after_id
+
+    if after_id is not None:
+        raise BusinessValidationException("Для sort=spatial продолжение задаётся параметром after")
+    if after is None:
+        return FeatureOrder("spatial"), None
+
+    sort_key, _, raw_id = after.partition(":")
+    try:
+        cursor_id = UUID(raw_id)
+    except ValueError as e:
+        raise BusinessValidationException(
+            "Курсор after должен иметь вид <ключ сортировки>:<идентификатор>"
+        ) from e
+    if not SORT_KEY_PATTERN.fullmatch(sort_key):
+        raise BusinessValidationException(
+            "Курсор after должен иметь вид <ключ сортировки>:<идентификатор>"
+        )
+    return FeatureOrder("spatial", sort_key), cursor_id
@@ -5,6 +5,9 @@ Created on Sat Jan 10 14:44:27 2026
 @author: dimon
 """
 
+from dataclasses import dataclass
+from uuid import UUID
+
 from utility_service.infrastructure.postgresql.models.feature_point import FeaturePoint
 from utility_service.infrastructure.postgresql.models.feature_polygon import FeaturePolygon
 from utility_service.infrastructure.postgresql.models.feature_line import FeatureLine
@@ -37,11 +40,36 @@ ALL_FEATURE_MODELS = [
 ]
 
 
+@dataclass(frozen=True)
+class LayerMetadata:
+    id: UUID
+    name: str
+    title: str
+    geometry_type: str
+    srid: int
+    storage_table: str
+    feature_model: type | None
+
+
+def to_layer_metadata(layer: Layer) -> LayerMetadata:
+    return LayerMetadata(
+        id=layer.id,
+        name=layer.name,
+        title=layer.title,
+        geometry_type=layer.geometry_type,
+        srid=layer.srid,
+        storage_table=layer.storage_table,
+        feature_model=FEATURE_MODELS_BY_TABLE.get(layer.storage_table),
+    )
+
+
 def resolve_feature_model(storage_table: str) -> type:
     if storage_table not in FEATURE_MODELS_BY_TABLE.keys():
         raise UnknownStorageTableError("Для данного слоя не найдена подходящая модель")
     return FEATURE_MODELS_BY_TABLE[storage_table]
 
 
-def get_layer_feature_model(layer: Layer) -> type:
+def get_layer_feature_model(layer: Layer | LayerMetadata) -> type:
+    if isinstance(layer, LayerMetadata) and layer.feature_model is not None:
+        return layer.feature_model
     return resolve_feature_model(layer.storage_table)
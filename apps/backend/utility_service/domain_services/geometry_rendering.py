@@ -0,0 +1,74 @@
+from dataclasses import dataclass, replace
+
+from utility_service.domain_services.tile import MAX_TILE_ZOOM
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+MAX_COORDINATE_PRECISION = 15
+MAX_PROJECTED_FIELDS = 32
+TILE_SIZE_PIXELS = 256
+
+
+@dataclass(frozen=True)
+class GeometryRendering:
+    tolerance: float | None = None
+    precision: int | None = None
+    geometry: bool = True
+    fields: tuple[str, ...] | None = None
+
+    @property
+    def simplified(self) -> bool:
+        return self.tolerance is not None or self.precision is not None
+
+    @property
+    def projected(self) -> bool:
+        return not self.geometry or self.fields is not None
+
+
+FULL_GEOMETRY = GeometryRendering()
+
+
+def tolerance_for_zoom(zoom: int) -> float:
+    return 360 / (TILE_SIZE_PIXELS * (1 << zoom))
+
+
+def parse_geometry_rendering(
+    zoom: int | None, tolerance: float | None, precision: int | None
+) -> GeometryRendering:
+    if zoom is not None and tolerance is not None:
+        raise BusinessValidationException("Нужно указать либо zoom, либо tolerance")
+
+    if zoom is not None:
+        if not 0 <= zoom <= MAX_TILE_ZOOM:
+            raise BusinessValidationException(
+                f"Zoom должен принадлежать диапазону от 0 до {MAX_TILE_ZOOM}"
+            )
+        tolerance = tolerance_for_zoom(zoom)
+
+    if tolerance is not None:
+        if tolerance < 0:
+            raise BusinessValidationException("Tolerance не может быть отрицательным")
+        if tolerance == 0:
+            tolerance = None
+
+    if precision is not None and not 0 <= precision <= MAX_COORDINATE_PRECISION:
+        raise BusinessValidationException(
+            f"Precision должен принадлежать диапазону от 0 до {MAX_COORDINATE_PRECISION}"
+        )
+
+    return GeometryRendering(tolerance=tolerance, precision=precision)
+
+
+def parse_feature_projection(
+    rendering: GeometryRendering, fields: str | None, geometry: bool
+) -> GeometryRendering:
+    projected_fields = None
+    if fields is not None:
+        # An empty fields= keeps the feature ids and geometries without any properties.
+        projected_fields = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        if len(projected_fields) > MAX_PROJECTED_FIELDS:
+            raise BusinessValidationException(
+                f"В fields можно перечислить не больше {MAX_PROJECTED_FIELDS} свойств"
+            )
+    return replace(rendering, geometry=geometry, fields=projected_fields)
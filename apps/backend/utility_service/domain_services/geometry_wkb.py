@@ -0,0 +1,19 @@
+import shapely
+from shapely.geometry import shape
+
+from utility_service.domain_services.bbox import Bbox
+
+
+def geometries_to_wkb(geometries: list[dict[str, object] | None]) -> list[bytes | None]:
+    # Shapes are built from the already validated GeoJSON coordinates, and the whole batch
+    # is serialized by one vectorized call; missing geometries stay None.
+    shapes = [shape(geometry) if geometry is not None else None for geometry in geometries]
+    return list(shapely.to_wkb(shapes))
+
+
+def geometry_to_wkb(geometry: dict[str, object]) -> bytes:
+    return geometries_to_wkb([geometry])[0]
+
+
+def wkb_to_bbox(wkb: bytes | str) -> Bbox:
+    return Bbox(*shapely.bounds(shapely.from_wkb(wkb)).tolist())
@@ -0,0 +1,53 @@
+from uuid import UUID
+
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+MAX_VIEWPORT_LAYERS = 32
+
+
+def parse_layer_ids(layer_ids: str) -> list[UUID]:
+    try:
+        parsed = [UUID(value.strip()) for value in layer_ids.split(",") if value.strip()]
+    except ValueError as e:
+        raise BusinessValidationException(
+            "layer_ids должен содержать идентификаторы слоев через запятую"
+        ) from e
+
+    if not parsed:
+        raise BusinessValidationException("Нужно указать хотя бы один слой")
+
+    unique = list(dict.fromkeys(parsed))
+    if len(unique) > MAX_VIEWPORT_LAYERS:
+        raise BusinessValidationException(
+            f"За один запрос можно получить не более {MAX_VIEWPORT_LAYERS} слоев"
+        )
+    return unique
+
+
+def parse_layer_cursors(cursors: list[str], layer_ids: list[UUID]) -> dict[UUID, UUID]:
+    after_ids: dict[UUID, UUID] = {}
+    for cursor in cursors:
+        layer_id, separator, after_id = cursor.partition(":")
+        try:
+            if not separator:
+                raise ValueError(cursor)
+            after_ids[UUID(layer_id)] = UUID(after_id)
+        except ValueError as e:
+            raise BusinessValidationException(
+                "Курсор должен иметь вид <layer_id>:<feature_id>"
+            ) from e
+
+    unknown = set(after_ids) - set(layer_ids)
+    if unknown:
+        raise BusinessValidationException(
+            f"Курсор указан для слоя, которого нет в layer_ids: {sorted(map(str, unknown))[0]}"
+        )
+    return after_ids
+
+
+def format_layer_cursor(layer_id: UUID, next_cursor: str | None) -> str | None:
+    # Cursors of a multi-layer page are sent back as after=<layer_id>:<feature_id>,
+    # so they are emitted in that form.
+    return f"{layer_id}:{next_cursor}" if next_cursor is not None else None
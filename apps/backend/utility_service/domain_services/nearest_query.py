@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+from utility_service.domain_services.bbox import Bbox, expand_bbox
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+DEFAULT_NEAREST_K = 10
+MAX_NEAREST_K = 100
+
+
+@dataclass(frozen=True)
+class NearestQuery:
+    lon: float
+    lat: float
+    k: int
+    max_distance: float | None = None
+
+    def search_bbox(self) -> Bbox | None:
+        if self.max_distance is None:
+            return None
+        return expand_bbox(Bbox(self.lon, self.lat, self.lon, self.lat), self.max_distance)
+
+
+def parse_nearest_query(
+    lon: float, lat: float, k: int | None, max_distance: float | None
+) -> NearestQuery:
+    if not -180 <= lon <= 180:
+        raise BusinessValidationException("Долгота должна принадлежать диапазону от -180 до 180")
+
+    if not -90 <= lat <= 90:
+        raise BusinessValidationException("Широта должна принадлежать диапазону от -90 до 90")
+
+    if k is None:
+        k = DEFAULT_NEAREST_K
+    if not 1 <= k <= MAX_NEAREST_K:
+        raise BusinessValidationException(
+            f"Количество ближайших объектов k должно принадлежать диапазону от 1 до {MAX_NEAREST_K}"
+        )
+
+    if max_distance is not None and not 0 < max_distance < float("inf"):
+        raise BusinessValidationException("max_distance должен быть положительным числом метров")
+
+    return NearestQuery(lon, lat, k, max_distance)
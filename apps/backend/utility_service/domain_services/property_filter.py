@@ -0,0 +1,88 @@
+import json
+import re
+from dataclasses import dataclass
+from math import isfinite
+
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+PropertyValue = str | int | float | bool | None
+
+EQUALITY_OPERATORS = ("eq", "in")
+RANGE_OPERATORS = ("gt", "gte", "lt", "lte")
+MAX_PROPERTY_FILTERS = 8
+MAX_IN_VALUES = 100
+MAX_PROPERTY_KEY_LENGTH = 64
+# Indexed keys become part of index names, which PostgreSQL limits to 63 bytes.
+INDEXED_PROPERTY_KEY_PATTERN = re.compile(r"[a-z][a-z0-9_]{0,31}")
+
+
+@dataclass(frozen=True)
+class PropertyFilter:
+    key: str
+    op: str
+    values: tuple[PropertyValue, ...]
+
+
+def parse_property_filters(raw_filters: list[str]) -> tuple[PropertyFilter, ...]:
+    if len(raw_filters) > MAX_PROPERTY_FILTERS:
+        raise BusinessValidationException(
+            f"Можно указать не больше {MAX_PROPERTY_FILTERS} фильтров по свойствам"
+        )
+    return tuple(parse_property_filter(raw_filter) for raw_filter in raw_filters)
+
+
+def parse_property_filter(raw_filter: str) -> PropertyFilter:
+    parts = raw_filter.split(":", 2)
+    if len(parts) != 3 or not parts[0] or len(parts[0]) > MAX_PROPERTY_KEY_LENGTH:
+        raise BusinessValidationException(
+            f"Фильтр по свойствам {raw_filter!r} должен иметь вид ключ:оператор:значение"
+        )
+    key, op, raw_value = parts
+
+    if op == "eq":
+        return PropertyFilter(key, op, (parse_property_value(raw_value),))
+
+    if op == "in":
+        raw_values = raw_value.split(",")
+        if len(raw_values) > MAX_IN_VALUES:
+            raise BusinessValidationException(
+                f"Фильтр in по свойству {key!r} допускает не больше {MAX_IN_VALUES} значений"
+            )
+        return PropertyFilter(key, op, tuple(parse_property_value(value) for value in raw_values))
+
+    if op in RANGE_OPERATORS:
+        value = parse_property_value(raw_value)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not isfinite(value):
+            raise BusinessValidationException(
+                f"Фильтр {op} по свойству {key!r} требует числового значения"
+            )
+        return PropertyFilter(key, op, (value,))
+
+    raise BusinessValidationException(
+        f"Неизвестный оператор фильтра {op!r}, допустимы: "
+        + ", ".join(EQUALITY_OPERATORS + RANGE_OPERATORS)
+    )
+
+
+def parse_property_value(raw_value: str) -> PropertyValue:
+    # Numbers, booleans and null are matched by their JSON type; anything that is not
+    # a JSON scalar is compared as a plain string.
+    try:
+        value = json.loads(raw_value)
+    except ValueError:
+        return raw_value
+    if isinstance(value, (dict, list)) or (isinstance(value, float) and not isfinite(value)):
+        return raw_value
+    return value
+
+
+def parse_indexed_property_keys(keys: list[str]) -> list[str]:
+    for key in keys:
+        if not INDEXED_PROPERTY_KEY_PATTERN.fullmatch(key):
+            raise BusinessValidationException(
+                f"Индексируемый ключ свойства {key!r} должен состоять из латинских букв "
+                "в нижнем регистре, цифр и подчёркиваний и быть не длиннее 32 символов"
+            )
+    return sorted(set(keys))
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+import shapely
+from shapely.geometry import shape
+
+from utility_service.domain_services.bbox import Bbox, expand_bbox
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+AREAL_GEOMETRY_TYPES = ("Polygon", "MultiPolygon")
+MAX_FILTER_BUFFER_METERS = 50_000.0
+
+
+@dataclass(frozen=True)
+class SpatialFilter:
+    geometry: bytes
+    buffer: float | None
+    bbox: Bbox
+
+
+def parse_spatial_filter(geometry: dict[str, object], buffer: float | None) -> SpatialFilter:
+    if buffer is not None and not 0 < buffer <= MAX_FILTER_BUFFER_METERS:
+        raise BusinessValidationException(
+            f"buffer должен принадлежать диапазону от 0 до {MAX_FILTER_BUFFER_METERS:g} метров"
+        )
+
+    if buffer is None and geometry["type"] not in AREAL_GEOMETRY_TYPES:
+        raise BusinessValidationException(
+            "Для фильтра по точке или линии нужно указать buffer в метрах"
+        )
+
+    filter_shape = shape(geometry)
+    # PostGIS refuses to subdivide or intersect invalid polygons, so they are rejected
+    # here instead of failing inside the query.
+    if not shapely.is_valid(filter_shape):
+        raise BusinessValidationException("Геометрия фильтра невалидна")
+
+    bbox = Bbox(*filter_shape.bounds)
+    if buffer is not None:
+        bbox = expand_bbox(bbox, buffer)
+    return SpatialFilter(shapely.to_wkb(filter_shape), buffer, bbox)
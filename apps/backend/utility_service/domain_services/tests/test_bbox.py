@@ -1,6 +1,6 @@
 import pytest
 
-from utility_service.domain_services.bbox import Bbox, parse_bbox
+from utility_service.domain_services.bbox import Bbox, expand_bbox, parse_bbox
 from utility_service.use_cases.domain.exceptions.business_validation_exception import (
     BusinessValidationException,
 )
@@ -27,3 +27,12 @@ def test_parse_bbox_raises_business_validation_for_invalid_input(
 ) -> None:
     with pytest.raises(BusinessValidationException, match=message):
         parse_bbox(raw_bbox)
+
+
+def test_expand_bbox_grows_every_side_by_at_least_the_distance() -> None:
+    bbox = expand_bbox(Bbox(min_lon=10.0, min_lat=-1.0, max_lon=11.0, max_lat=1.0), 1000.0)
+
+    assert bbox.min_lat == pytest.approx(-1.00904, abs=1e-5)
+    assert bbox.max_lat == pytest.approx(1.00904, abs=1e-5)
+    assert 10.0 - bbox.min_lon == pytest.approx(bbox.max_lon - 11.0)
+    assert bbox.max_lon - 11.0 > 1000.0 / 111_320.0
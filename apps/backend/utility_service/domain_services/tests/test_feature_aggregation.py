@@ -0,0 +1,43 @@
+import pytest
+
+from utility_service.domain_services.bbox import Bbox
+from utility_service.domain_services.feature_aggregation import (
+    AggregationGrid,
+    aggregate_cell_size,
+    parse_aggregation_grid,
+)
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+
+def test_aggregate_cell_size_covers_quarter_of_tile() -> None:
+    assert aggregate_cell_size(0) == pytest.approx(90.0)
+    assert aggregate_cell_size(8) == pytest.approx(360 / 1024)
+
+
+def test_cell_span_counts_cells_aligned_to_world_grid() -> None:
+    grid = AggregationGrid(zoom=2, cell_size=22.5)
+
+    assert grid.cell_span(Bbox(-180.0, -90.0, 180.0, 90.0)) == (17, 9)
+    assert grid.cell_span(Bbox(1.0, 1.0, 2.0, 2.0)) == (1, 1)
+
+
+def test_parse_aggregation_grid_returns_grid_for_zoom() -> None:
+    grid = parse_aggregation_grid(6, Bbox(30.0, 50.0, 40.0, 60.0))
+
+    assert grid == AggregationGrid(zoom=6, cell_size=aggregate_cell_size(6))
+
+
+@pytest.mark.parametrize(
+    ("zoom", "bbox", "message"),
+    [
+        (25, Bbox(0.0, 0.0, 1.0, 1.0), "Zoom должен принадлежать диапазону от 0 до 24"),
+        (12, Bbox(-180.0, -90.0, 180.0, 90.0), "покрывает больше 16384 ячеек агрегации"),
+    ],
+)
+def test_parse_aggregation_grid_raises_business_validation_for_invalid_input(
+    zoom: int, bbox: Bbox, message: str
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        parse_aggregation_grid(zoom, bbox)
@@ -0,0 +1,50 @@
+import pytest
+
+from utility_service.domain_services.bbox import Bbox
+from utility_service.domain_services.feature_grid import GridCell, bboxes_match, match_grid_cell
+
+
+@pytest.mark.parametrize(
+    ("bbox", "cell"),
+    [
+        (Bbox(37.6, 55.6, 37.8, 55.8), GridCell(0.2, 1088, 728)),
+        (
+            Bbox(
+                -180 + 4352 * 0.05,
+                -90 + 2912 * 0.05,
+                -180 + 4352 * 0.05 + 0.05,
+                -90 + 2912 * 0.05 + 0.05,
+            ),
+            GridCell(0.05, 4352, 2912),
+        ),
+        (
+            Bbox(
+                -180 + 21760 * 0.01,
+                -90 + 14560 * 0.01,
+                -180 + 21760 * 0.01 + 0.01,
+                -90 + 14560 * 0.01 + 0.01,
+            ),
+            GridCell(0.01, 21760, 14560),
+        ),
+    ],
+)
+def test_match_grid_cell_recognizes_frontend_tiles(bbox: Bbox, cell: GridCell) -> None:
+    assert match_grid_cell(bbox) == cell
+
+
+@pytest.mark.parametrize(
+    "bbox",
+    [
+        Bbox(37.6, 55.6, 37.9, 55.8),
+        Bbox(37.61, 55.6, 37.81, 55.8),
+        Bbox(37.6, 55.6, 38.0, 56.0),
+    ],
+)
+def test_match_grid_cell_ignores_arbitrary_bboxes(bbox: Bbox) -> None:
+    assert match_grid_cell(bbox) is None
+
+
+def test_grid_cell_bbox_is_clamped_to_world_edges() -> None:
+    cell = GridCell(0.2, 1799, 899)
+
+    assert bboxes_match(cell.bbox, Bbox(179.8, 89.8, 180.0, 90.0))
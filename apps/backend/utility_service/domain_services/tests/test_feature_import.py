@@ -0,0 +1,84 @@
+import json
+
+import pytest
+import shapely
+
+from utility_service.domain_services.feature_import import to_imported_features
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+
+def polygon_feature(properties: dict[str, object] | None = None) -> dict[str, object]:
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[10.0, 10.0], [20.0, 10.0], [20.0, 20.0], [10.0, 10.0]]],
+        },
+        "properties": properties,
+    }
+
+
+def test_to_imported_features_encodes_ewkb_with_srid_and_envelope() -> None:
+    features = to_imported_features(
+        [polygon_feature({"name": "A"}), polygon_feature(None)], "Polygon"
+    )
+
+    geometry = shapely.from_wkb(features[0].geometry)
+    assert shapely.get_srid(geometry) == 4326
+    assert geometry.geom_type == "Polygon"
+    assert shapely.from_wkb(features[0].extent).bounds == (10.0, 10.0, 20.0, 20.0)
+    assert json.loads(features[0].properties) == {"name": "A"}
+    assert features[1].properties == "{}"
+    assert features[0].id != features[1].id
+
+
+@pytest.mark.parametrize(
+    ("feature", "message"),
+    [
+        ({"type": "Point"}, "Объект №8 не является GeoJSON Feature"),
+        (
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [1.0, 2.0]}},
+            "Тип геометрии объекта №8 не соответствует типу геометрии слоя",
+        ),
+        ({**polygon_feature(), "properties": [1]}, "Свойства объекта №8 должны быть объектом"),
+        (
+            {"type": "Feature", "geometry": {"type": "Polygon", "coordinates": [[[1.0]]]}},
+            "Некорректная геометрия у объекта №8",
+        ),
+        (
+            {"type": "Feature", "geometry": {"type": "Polygon", "coordinates": []}},
+            "Геометрия объекта №8 пустая",
+        ),
+        (
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[0.0, 0.0], [2.0, 2.0], [2.0, 0.0], [0.0, 2.0], [0.0, 0.0]]],
+                },
+            },
+            "Невалидная геометрия у объекта №8: Self-intersection",
+        ),
+        (
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[170.0, 0.0], [190.0, 0.0], [190.0, 1.0], [170.0, 0.0]]],
+                },
+            },
+            "Координаты объекта №8 выходят за пределы EPSG:4326",
+        ),
+        (
+            {**polygon_feature(), "properties": {"depth": float("nan")}},
+            "Свойства объекта №8 содержат значения, недопустимые в JSON",
+        ),
+    ],
+)
+def test_to_imported_features_reports_number_of_rejected_feature(
+    feature: dict[str, object], message: str
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        to_imported_features([polygon_feature(), polygon_feature(), feature], "Polygon", 6)
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from utility_service.domain_services.feature_order import (
+    ID_ORDER,
+    FeatureOrder,
+    format_feature_cursor,
+    parse_feature_order,
+)
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+FEATURE_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def test_parse_feature_order_keeps_id_cursor_for_default_sort() -> None:
+    assert parse_feature_order("id", FEATURE_ID, None) == (ID_ORDER, FEATURE_ID)
+
+
+def test_parse_feature_order_splits_spatial_cursor() -> None:
+    order, after_id = parse_feature_order("spatial", None, f"ucfv0j7x2q9b:{FEATURE_ID}")
+
+    assert order == FeatureOrder("spatial", "ucfv0j7x2q9b")
+    assert after_id == FEATURE_ID
+
+
+def test_parse_feature_order_starts_spatial_order_without_cursor() -> None:
+    assert parse_feature_order("spatial", None, None) == (FeatureOrder("spatial"), None)
+
+
+@pytest.mark.parametrize(
+    ("sort", "after_id", "after", "message"),
+    [
+        ("id", None, f"ucfv0j7x2q9b:{FEATURE_ID}", "Курсор after используется только с"),
+        ("spatial", FEATURE_ID, None, "Для sort=spatial продолжение задаётся параметром after"),
+        ("spatial", None, "ucfv0j7x2q9b", "Курсор after должен иметь вид"),
+        ("spatial", None, f"ucfv0j7x2q9:{FEATURE_ID}", "Курсор after должен иметь вид"),
+        ("spatial", None, f"ucfv0j7x2qab:{FEATURE_ID}", "Курсор after должен иметь вид"),
+        ("spatial", None, "ucfv0j7x2q9b:not-a-uuid", "Курсор after должен иметь вид"),
+    ],
+)
+def test_parse_feature_order_raises_business_validation_for_invalid_cursor(
+    sort, after_id: UUID | None, after: str | None, message: str
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        parse_feature_order(sort, after_id, after)
+
+
+def test_format_feature_cursor_round_trips_through_parser() -> None:
+    row = SimpleNamespace(id=FEATURE_ID, sort_key="ucfv0j7x2q9b")
+    spatial = FeatureOrder("spatial")
+
+    assert format_feature_cursor(ID_ORDER, row) == str(FEATURE_ID)
+    assert parse_feature_order("spatial", None, format_feature_cursor(spatial, row)) == (
+        FeatureOrder("spatial", "ucfv0j7x2q9b"),
+        FEATURE_ID,
+    )
+
+
+def test_empty_geometry_cursor_round_trips_through_parser() -> None:
+    row = SimpleNamespace(id=FEATURE_ID, sort_key="")
+    spatial = FeatureOrder("spatial")
+
+    assert parse_feature_order("spatial", None, format_feature_cursor(spatial, row)) == (
+        FeatureOrder("spatial", ""),
+        FEATURE_ID,
+    )
@@ -0,0 +1,71 @@
+import pytest
+
+from utility_service.domain_services.geometry_rendering import (
+    FULL_GEOMETRY,
+    GeometryRendering,
+    parse_feature_projection,
+    parse_geometry_rendering,
+    tolerance_for_zoom,
+)
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+
+def test_parse_geometry_rendering_without_options_keeps_full_geometry() -> None:
+    rendering = parse_geometry_rendering(None, None, None)
+
+    assert rendering == FULL_GEOMETRY
+    assert rendering.simplified is False
+
+
+def test_parse_geometry_rendering_derives_tolerance_from_zoom() -> None:
+    rendering = parse_geometry_rendering(8, None, 6)
+
+    assert rendering == GeometryRendering(tolerance=tolerance_for_zoom(8), precision=6)
+    assert rendering.tolerance == pytest.approx(360 / (256 * 256))
+    assert rendering.simplified is True
+
+
+def test_parse_geometry_rendering_treats_zero_tolerance_as_full_resolution() -> None:
+    assert parse_geometry_rendering(None, 0.0, None) == FULL_GEOMETRY
+
+
+def test_precision_alone_marks_geometry_as_simplified() -> None:
+    assert parse_geometry_rendering(None, None, 5).simplified is True
+
+
+@pytest.mark.parametrize(
+    ("zoom", "tolerance", "precision", "message"),
+    [
+        (8, 0.01, None, "Нужно указать либо zoom, либо tolerance"),
+        (25, None, None, "Zoom должен принадлежать диапазону от 0 до 24"),
+        (None, -0.1, None, "Tolerance не может быть отрицательным"),
+        (None, None, 16, "Precision должен принадлежать диапазону от 0 до 15"),
+    ],
+)
+def test_parse_geometry_rendering_raises_business_validation_for_invalid_input(
+    zoom: int | None, tolerance: float | None, precision: int | None, message: str
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        parse_geometry_rendering(zoom, tolerance, precision)
+
+
+def test_parse_feature_projection_keeps_rendering_and_deduplicates_fields() -> None:
+    rendering = parse_feature_projection(GeometryRendering(precision=5), "name, dn,,name", False)
+
+    assert rendering == GeometryRendering(precision=5, geometry=False, fields=("name", "dn"))
+    assert rendering.projected is True
+
+
+def test_parse_feature_projection_without_options_is_not_projected() -> None:
+    assert parse_feature_projection(FULL_GEOMETRY, None, True) == FULL_GEOMETRY
+    assert FULL_GEOMETRY.projected is False
+    assert parse_feature_projection(FULL_GEOMETRY, "", True).fields == ()
+
+
+def test_parse_feature_projection_limits_field_count() -> None:
+    fields = ",".join(f"f{i}" for i in range(33))
+
+    with pytest.raises(BusinessValidationException, match="не больше 32 свойств"):
+        parse_feature_projection(FULL_GEOMETRY, fields, True)
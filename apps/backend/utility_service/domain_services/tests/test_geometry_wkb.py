@@ -0,0 +1,19 @@
+import shapely
+
+from utility_service.domain_services.geometry_wkb import geometries_to_wkb, geometry_to_wkb
+
+
+def test_geometry_to_wkb_round_trips_coordinates() -> None:
+    polygon = {"type": "Polygon", "coordinates": [[[0, 0], [2, 0], [2, 1], [0, 0]]]}
+
+    wkb = geometry_to_wkb(polygon)
+
+    assert isinstance(wkb, bytes)
+    assert list(shapely.from_wkb(wkb).exterior.coords) == [(0, 0), (2, 0), (2, 1), (0, 0)]
+
+
+def test_geometries_to_wkb_keeps_missing_geometries_in_place() -> None:
+    wkbs = geometries_to_wkb([None, {"type": "Point", "coordinates": [1.5, 2.5]}, None])
+
+    assert wkbs[0] is None and wkbs[2] is None
+    assert shapely.from_wkb(wkbs[1]).coords[0] == (1.5, 2.5)
@@ -0,0 +1,58 @@
+from uuid import uuid4
+
+import pytest
+
+from utility_service.domain_services.layer_selection import (
+    MAX_VIEWPORT_LAYERS,
+    format_layer_cursor,
+    parse_layer_cursors,
+    parse_layer_ids,
+)
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+
+def test_parse_layer_ids_keeps_order_and_drops_duplicates() -> None:
+    first, second = uuid4(), uuid4()
+
+    assert parse_layer_ids(f"{first}, {second},{first},") == [first, second]
+
+
+@pytest.mark.parametrize(
+    ("layer_ids", "message"),
+    [
+        ("", "Нужно указать хотя бы один слой"),
+        ("not-a-uuid", "layer_ids должен содержать идентификаторы слоев через запятую"),
+        (
+            ",".join(str(uuid4()) for _ in range(MAX_VIEWPORT_LAYERS + 1)),
+            f"не более {MAX_VIEWPORT_LAYERS} слоев",
+        ),
+    ],
+)
+def test_parse_layer_ids_raises_business_validation_for_invalid_input(
+    layer_ids: str, message: str
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        parse_layer_ids(layer_ids)
+
+
+def test_parse_layer_cursors_maps_layer_to_after_id() -> None:
+    layer_id, feature_id = uuid4(), uuid4()
+
+    assert parse_layer_cursors([f"{layer_id}:{feature_id}"], [layer_id]) == {layer_id: feature_id}
+
+
+def test_format_layer_cursor_round_trips_through_parser() -> None:
+    layer_id, feature_id = uuid4(), uuid4()
+
+    cursor = format_layer_cursor(layer_id, str(feature_id))
+
+    assert parse_layer_cursors([cursor], [layer_id]) == {layer_id: feature_id}
+    assert format_layer_cursor(layer_id, None) is None
+
+
+@pytest.mark.parametrize("cursor", ["no-separator", f"{uuid4()}:bad", f"{uuid4()}:{uuid4()}"])
+def test_parse_layer_cursors_raises_business_validation_for_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(BusinessValidationException):
+        parse_layer_cursors([cursor], [uuid4()])
@@ -0,0 +1,44 @@
+import pytest
+
+from utility_service.domain_services.nearest_query import NearestQuery, parse_nearest_query
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+
+def test_parse_nearest_query_uses_default_k() -> None:
+    assert parse_nearest_query(37.6, 55.7, None, None) == NearestQuery(37.6, 55.7, 10, None)
+
+
+@pytest.mark.parametrize(
+    ("lon", "lat", "k", "max_distance", "message"),
+    [
+        (181.0, 0.0, 1, None, "Долгота должна принадлежать диапазону от -180 до 180"),
+        (0.0, float("nan"), 1, None, "Широта должна принадлежать диапазону от -90 до 90"),
+        (0.0, 0.0, 0, None, "Количество ближайших объектов k должно принадлежать диапазону"),
+        (0.0, 0.0, 101, None, "Количество ближайших объектов k должно принадлежать диапазону"),
+        (0.0, 0.0, 1, 0.0, "max_distance должен быть положительным числом метров"),
+        (0.0, 0.0, 1, float("inf"), "max_distance должен быть положительным числом метров"),
+    ],
+)
+def test_parse_nearest_query_raises_business_validation_for_invalid_input(
+    lon: float, lat: float, k: int, max_distance: float | None, message: str
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        parse_nearest_query(lon, lat, k, max_distance)
+
+
+def test_search_bbox_covers_max_distance_in_both_directions() -> None:
+    bbox = NearestQuery(37.6, 55.7, 5, 1000.0).search_bbox()
+
+    # 1 km is ~0.009 degrees of latitude and ~0.016 degrees of longitude at 55.7N.
+    assert bbox.max_lat - 55.7 == pytest.approx(0.00904, abs=1e-4)
+    assert bbox.max_lon - 37.6 == pytest.approx(0.01597, abs=1e-4)
+    assert 55.7 - bbox.min_lat == pytest.approx(bbox.max_lat - 55.7)
+
+
+def test_search_bbox_keeps_every_longitude_near_poles_and_antimeridian() -> None:
+    polar = NearestQuery(0.0, 89.99, 5, 5000.0).search_bbox()
+    assert (polar.min_lon, polar.max_lon, polar.max_lat) == (-180.0, 180.0, 90.0)
+    assert NearestQuery(179.99, 0.0, 5, 5000.0).search_bbox().min_lon == -180.0
+    assert NearestQuery(0.0, 0.0, 5).search_bbox() is None
@@ -0,0 +1,54 @@
+import pytest
+
+from utility_service.domain_services.property_filter import (
+    PropertyFilter,
+    parse_indexed_property_keys,
+    parse_property_filters,
+)
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+
+def test_parse_property_filters_reads_json_scalars_and_plain_strings() -> None:
+    filters = parse_property_filters(
+        ["status:in:active,planned", "diameter:gte:100", "material:eq:ПЭ:100", "valid:eq:true"]
+    )
+
+    assert filters == (
+        PropertyFilter("status", "in", ("active", "planned")),
+        PropertyFilter("diameter", "gte", (100,)),
+        PropertyFilter("material", "eq", ("ПЭ:100",)),
+        PropertyFilter("valid", "eq", (True,)),
+    )
+
+
+@pytest.mark.parametrize(
+    ("raw_filter", "message"),
+    [
+        ("status", "должен иметь вид ключ:оператор:значение"),
+        (":eq:1", "должен иметь вид ключ:оператор:значение"),
+        ("status:like:a%", "Неизвестный оператор фильтра 'like'"),
+        ("diameter:gt:wide", "Фильтр gt по свойству 'diameter' требует числового значения"),
+        ("diameter:lt:NaN", "Фильтр lt по свойству 'diameter' требует числового значения"),
+        ("diameter:lte:true", "Фильтр lte по свойству 'diameter' требует числового значения"),
+        ("status:in:" + ",".join(["a"] * 101), "допускает не больше 100 значений"),
+    ],
+)
+def test_parse_property_filters_raises_business_validation_for_invalid_input(
+    raw_filter: str, message: str
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        parse_property_filters([raw_filter])
+
+
+def test_parse_property_filters_limits_filter_count() -> None:
+    with pytest.raises(BusinessValidationException, match="не больше 8 фильтров"):
+        parse_property_filters(["a:eq:1"] * 9)
+
+
+def test_parse_indexed_property_keys_deduplicates_and_rejects_unsafe_keys() -> None:
+    assert parse_indexed_property_keys(["status", "diameter", "status"]) == ["diameter", "status"]
+
+    with pytest.raises(BusinessValidationException, match="Индексируемый ключ свойства"):
+        parse_indexed_property_keys(["diameter'); DROP"])
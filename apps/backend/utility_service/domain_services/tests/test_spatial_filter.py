@@ -0,0 +1,51 @@
+import json
+
+import pytest
+import shapely
+
+from utility_service.domain_services.bbox import Bbox
+from utility_service.domain_services.spatial_filter import parse_spatial_filter
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+DISTRICT = {"type": "Polygon", "coordinates": [[[30, 50], [31, 50], [31, 52], [30, 50]]]}
+CORRIDOR = {"type": "LineString", "coordinates": [[30, 50], [32, 53]]}
+
+
+def test_parse_spatial_filter_keeps_polygon_bounds() -> None:
+    spatial_filter = parse_spatial_filter(DISTRICT, None)
+
+    assert spatial_filter.bbox == Bbox(30.0, 50.0, 31.0, 52.0)
+    assert spatial_filter.buffer is None
+    assert shapely.from_wkb(spatial_filter.geometry).equals(
+        shapely.from_geojson(json.dumps(DISTRICT))
+    )
+
+
+def test_parse_spatial_filter_expands_bounds_of_buffered_line() -> None:
+    spatial_filter = parse_spatial_filter(CORRIDOR, 500.0)
+
+    assert spatial_filter.buffer == 500.0
+    assert spatial_filter.bbox.min_lon < 30.0 and spatial_filter.bbox.max_lon > 32.0
+    assert spatial_filter.bbox.min_lat < 50.0 and spatial_filter.bbox.max_lat > 53.0
+
+
+@pytest.mark.parametrize(
+    ("geometry", "buffer", "message"),
+    [
+        (CORRIDOR, None, "Для фильтра по точке или линии нужно указать buffer в метрах"),
+        (CORRIDOR, 0.0, "buffer должен принадлежать диапазону от 0 до 50000 метров"),
+        (DISTRICT, 50_001.0, "buffer должен принадлежать диапазону от 0 до 50000 метров"),
+        (
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 1], [1, 0], [0, 1], [0, 0]]]},
+            None,
+            "Геометрия фильтра невалидна",
+        ),
+    ],
+)
+def test_parse_spatial_filter_raises_business_validation_for_invalid_input(
+    geometry, buffer, message
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        parse_spatial_filter(geometry, buffer)
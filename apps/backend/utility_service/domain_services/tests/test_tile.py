@@ -0,0 +1,33 @@
+import pytest
+
+from utility_service.domain_services.tile import TileCoordinates, parse_tile_coordinates
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+
+def test_parse_tile_coordinates_returns_tile_for_valid_input() -> None:
+    tile = parse_tile_coordinates(13, 5700, 2600)
+
+    assert tile == TileCoordinates(z=13, x=5700, y=2600)
+
+
+def test_tile_size_halves_with_each_zoom_level() -> None:
+    assert parse_tile_coordinates(1, 0, 0).size_meters == pytest.approx(20037508.342789244)
+    assert parse_tile_coordinates(2, 0, 0).size_meters == pytest.approx(10018754.171394622)
+
+
+@pytest.mark.parametrize(
+    ("z", "x", "y", "message"),
+    [
+        (-1, 0, 0, "Уровень масштаба тайла должен принадлежать диапазону от 0 до 24"),
+        (25, 0, 0, "Уровень масштаба тайла должен принадлежать диапазону от 0 до 24"),
+        (2, 4, 0, "Координаты тайла для масштаба 2 должны принадлежать диапазону от 0 до 3"),
+        (2, 0, -1, "Координаты тайла для масштаба 2 должны принадлежать диапазону от 0 до 3"),
+    ],
+)
+def test_parse_tile_coordinates_raises_business_validation_for_invalid_input(
+    z: int, x: int, y: int, message: str
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        parse_tile_coordinates(z, x, y)
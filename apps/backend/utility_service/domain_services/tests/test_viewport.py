@@ -0,0 +1,47 @@
+import pytest
+
+from utility_service.domain_services.bbox import Bbox
+from utility_service.domain_services.viewport import parse_viewport_message
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+
+def test_parse_viewport_message_reads_bbox() -> None:
+    message = {"type": "viewport", "bbox": [37.5, 55.7, 37.6, 55.8]}
+
+    assert parse_viewport_message(message) == [Bbox(37.5, 55.7, 37.6, 55.8)]
+
+
+def test_parse_viewport_message_reads_frontend_grid_cells() -> None:
+    message = {"type": "viewport", "tiles": [{"step": 0.2, "x": 1088, "y": 728}]}
+
+    (bbox,) = parse_viewport_message(message)
+
+    assert bbox.min_lon == pytest.approx(37.6)
+    assert bbox.min_lat == pytest.approx(55.6)
+    assert bbox.max_lon == pytest.approx(37.8)
+    assert bbox.max_lat == pytest.approx(55.8)
+
+
+def test_parse_viewport_message_resets_viewport_without_bbox() -> None:
+    assert parse_viewport_message({"type": "viewport", "bbox": None}) is None
+
+
+@pytest.mark.parametrize(
+    ("message", "error"),
+    [
+        ({"bbox": [0, 0, 1, 1], "tiles": []}, "либо bbox, либо tiles"),
+        ({"bbox": [0, 0, 1]}, "Bbox должен содержать 4 вещественных числа"),
+        ({"bbox": [0, 0, True, 1]}, "Bbox должен содержать 4 вещественных числа"),
+        ({"tiles": []}, "tiles должен быть непустым списком"),
+        ({"tiles": [{"step": 0.3, "x": 0, "y": 0}]}, "Шаг ячейки сетки"),
+        ({"tiles": [{"step": 0.2, "x": 1800, "y": 0}]}, "за пределы мира"),
+        ({"tiles": [{"step": 0.2, "x": 1.5, "y": 0}]}, "целыми числами"),
+        ({"tiles": [{"step": 0.2, "x": 0}]}, "должна содержать step, x и y"),
+        ({"tiles": [{"step": 0.01, "x": 0, "y": 0}] * 257}, "не более 256 ячеек"),
+    ],
+)
+def test_parse_viewport_message_raises_business_validation(message, error: str) -> None:
+    with pytest.raises(BusinessValidationException, match=error):
+        parse_viewport_message({"type": "viewport", **message})
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+MAX_TILE_ZOOM = 24
+WEB_MERCATOR_HALF_WORLD = 20037508.342789244
+
+
+@dataclass(frozen=True)
+class TileCoordinates:
+    z: int
+    x: int
+    y: int
+
+    @property
+    def size_meters(self) -> float:
+        return 2 * WEB_MERCATOR_HALF_WORLD / (1 << self.z)
+
+
+def parse_tile_coordinates(z: int, x: int, y: int) -> TileCoordinates:
+    if not 0 <= z <= MAX_TILE_ZOOM:
+        raise BusinessValidationException(
+            f"Уровень масштаба тайла должен принадлежать диапазону от 0 до {MAX_TILE_ZOOM}"
+        )
+
+    tiles_per_axis = 1 << z
+    if not 0 <= x < tiles_per_axis or not 0 <= y < tiles_per_axis:
+        raise BusinessValidationException(
+            f"Координаты тайла для масштаба {z} должны принадлежать диапазону "
+            f"от 0 до {tiles_per_axis - 1}"
+        )
+
+    return TileCoordinates(z, x, y)
@@ -0,0 +1,60 @@
+import math
+
+from utility_service.domain_services.bbox import Bbox, parse_bbox
+from utility_service.domain_services.feature_grid import GRID_STEPS, GridCell
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+MAX_VIEWPORT_TILES = 256
+
+
+def parse_viewport_message(message: dict[str, object]) -> list[Bbox] | None:
+    # None resets the viewport: the client receives events for the whole layer again.
+    bbox = message.get("bbox")
+    tiles = message.get("tiles")
+    if bbox is not None and tiles is not None:
+        raise BusinessValidationException("Область просмотра задаётся либо bbox, либо tiles")
+    if tiles is not None:
+        return parse_viewport_tiles(tiles)
+    if bbox is None:
+        return None
+    if not isinstance(bbox, list) or not all(
+        isinstance(value, (int, float)) and not isinstance(value, bool) for value in bbox
+    ):
+        raise BusinessValidationException("Bbox должен содержать 4 вещественных числа")
+    return [parse_bbox(",".join(str(value) for value in bbox))]
+
+
+def parse_viewport_tiles(tiles: object) -> list[Bbox]:
+    if not isinstance(tiles, list) or not tiles:
+        raise BusinessValidationException("tiles должен быть непустым списком ячеек сетки")
+    if len(tiles) > MAX_VIEWPORT_TILES:
+        raise BusinessValidationException(
+            f"Область просмотра может содержать не более {MAX_VIEWPORT_TILES} ячеек"
+        )
+    return [parse_viewport_tile(tile) for tile in tiles]
+
+
+def parse_viewport_tile(tile: object) -> Bbox:
+    # Tiles are the cells of the frontend feature grid: {"step": 0.05, "x": 4321, "y": 2915}.
+    if not isinstance(tile, dict) or tile.keys() != {"step", "x", "y"}:
+        raise BusinessValidationException("Ячейка сетки должна содержать step, x и y")
+    x, y = tile["x"], tile["y"]
+    step = next(
+        (
+            grid_step
+            for grid_step in GRID_STEPS
+            if isinstance(tile["step"], (int, float)) and math.isclose(tile["step"], grid_step)
+        ),
+        None,
+    )
+    if step is None:
+        raise BusinessValidationException(
+            f"Шаг ячейки сетки должен быть одним из значений: {', '.join(map(str, GRID_STEPS))}"
+        )
+    if type(x) is not int or type(y) is not int:
+        raise BusinessValidationException("Координаты ячейки сетки должны быть целыми числами")
+    if not 0 <= x < round(360 / step) or not 0 <= y < round(180 / step):
+        raise BusinessValidationException("Ячейка сетки выходит за пределы мира")
+    return GridCell(step, x, y).bbox
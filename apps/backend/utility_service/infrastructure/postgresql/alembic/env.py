@@ -17,6 +17,9 @@ if config.config_file_name is not None:
 
 # --- IMPORT MODELS HERE (важно для autogenerate) ---
 from utility_service.infrastructure.postgresql.models.base import Base  # noqa: E402
+from utility_service.infrastructure.postgresql.models.feature_change import (  # noqa: E402, F401
+    FeatureChange,
+)
 from utility_service.infrastructure.postgresql.models.feature_line import (  # noqa: E402, F401
     FeatureLine,
 )
@@ -39,6 +42,9 @@ from utility_service.infrastructure.postgresql.models.auth_session import (  # n
     AuthSession,
 )
 from utility_service.infrastructure.postgresql.models.layer import Layer  # noqa: E402, F401
+from utility_service.infrastructure.postgresql.models.realtime_event import (  # noqa: E402, F401
+    RealtimeEvent,
+)
 from utility_service.infrastructure.postgresql.models.user import User  # noqa: E402, F401
 from utility_service.infrastructure.postgresql.models.utility_network import (  # noqa: E402, F401
     AssociationType,
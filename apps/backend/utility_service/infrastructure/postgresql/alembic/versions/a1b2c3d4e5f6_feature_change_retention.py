@@ -0,0 +1,29 @@
+"""add feature change log retention
+
+Revision ID: a1b2c3d4e5f6
+Revises: f9a0b1c2d3e4
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a1b2c3d4e5f6"
+down_revision: Union[str, Sequence[str], None] = "f9a0b1c2d3e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "layers",
+        sa.Column("pruned_revision", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+    )
+    op.create_index("ix_feature_changes_changed_at", "feature_changes", ["changed_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_feature_changes_changed_at", table_name="feature_changes")
+    op.drop_column("layers", "pruned_revision")
@@ -0,0 +1,27 @@
+"""add layer revision
+
+Revision ID: b4d5e6f7a8c9
+Revises: f8a7b6c5d4e3
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b4d5e6f7a8c9"
+down_revision: Union[str, Sequence[str], None] = "f8a7b6c5d4e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "layers",
+        sa.Column("revision", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("layers", "revision")
@@ -0,0 +1,64 @@
+"""add feature change log
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4d5e6f7a8c9
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import geoalchemy2
+import sqlalchemy as sa
+
+
+revision: str = "c5d6e7f8a9b0"
+down_revision: Union[str, Sequence[str], None] = "b4d5e6f7a8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "feature_changes",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("layer_id", sa.UUID(), nullable=False),
+        sa.Column("feature_id", sa.UUID(), nullable=False),
+        sa.Column("revision", sa.BigInteger(), nullable=False),
+        sa.Column("change_type", sa.String(length=16), nullable=False),
+        sa.Column(
+            "extent",
+            geoalchemy2.Geometry(geometry_type="GEOMETRY", srid=4326, spatial_index=False),
+            nullable=False,
+        ),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["layer_id"], ["layers.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_feature_changes_layer_id_revision",
+        "feature_changes",
+        ["layer_id", "revision"],
+    )
+    op.create_index(
+        "ix_feature_changes_layer_id_changed_at",
+        "feature_changes",
+        ["layer_id", "changed_at"],
+    )
+    op.create_index(
+        "ix_feature_changes_extent",
+        "feature_changes",
+        ["extent"],
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_feature_changes_extent", table_name="feature_changes")
+    op.drop_index("ix_feature_changes_layer_id_changed_at", table_name="feature_changes")
+    op.drop_index("ix_feature_changes_layer_id_revision", table_name="feature_changes")
+    op.drop_table("feature_changes")
@@ -0,0 +1,52 @@
+"""index feature properties
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "d6e7f8a9b0c1"
+down_revision: Union[str, Sequence[str], None] = "c5d6e7f8a9b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FEATURE_TABLES = (
+    "feature_points",
+    "feature_polygons",
+    "feature_lines",
+    "feature_multipoints",
+    "feature_multipolygons",
+    "feature_multilines",
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "layers",
+        sa.Column(
+            "indexed_properties",
+            postgresql.ARRAY(sa.String(length=32)),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        ),
+    )
+    for table in FEATURE_TABLES:
+        op.create_index(
+            f"ix_{table}_properties",
+            table,
+            ["properties"],
+            postgresql_using="gin",
+            postgresql_ops={"properties": "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for table in FEATURE_TABLES:
+        op.drop_index(f"ix_{table}_properties", table_name=table)
+    op.drop_column("layers", "indexed_properties")
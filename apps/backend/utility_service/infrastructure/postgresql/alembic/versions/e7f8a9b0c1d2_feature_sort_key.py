@@ -0,0 +1,129 @@
+"""add spatial sort key to feature tables
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+
+The key is kept by a trigger rather than a stored generated column: adding a generated
+column rewrites the whole table under ACCESS EXCLUSIVE. Here every step only takes short
+locks, so feature reads and writes keep running while it is applied:
+
+- the nullable column and the trigger are added in one quick transaction;
+- existing rows are backfilled in batches of BACKFILL_BATCH_SIZE, each committed on its own;
+- the (sort_key, id) index is built with CREATE INDEX CONCURRENTLY;
+- NOT NULL is proven by a NOT VALID check validated without blocking writes.
+
+Empty geometries get an empty key, and so does any geometry PostGIS cannot find a point
+on; they sort before all others instead of aborting the migration.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e7f8a9b0c1d2"
+down_revision: Union[str, Sequence[str], None] = "d6e7f8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FEATURE_TABLES = (
+    "feature_points",
+    "feature_polygons",
+    "feature_lines",
+    "feature_multipoints",
+    "feature_multipolygons",
+    "feature_multilines",
+)
+BACKFILL_BATCH_SIZE = 5000
+FIRST_ID = "00000000-0000-0000-0000-000000000000"
+
+CREATE_SORT_KEY_FUNCTIONS = """
+CREATE FUNCTION feature_sort_key(geom geometry) RETURNS varchar
+LANGUAGE plpgsql IMMUTABLE AS $$
+BEGIN
+    IF geom IS NULL OR ST_IsEmpty(geom) THEN
+        RETURN '';
+    END IF;
+    RETURN ST_GeoHash(ST_PointOnSurface(geom), 12);
+EXCEPTION WHEN OTHERS THEN
+    RETURN '';
+END
+$$;
+
+CREATE FUNCTION set_feature_sort_key() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.sort_key := feature_sort_key(NEW.geom);
+    RETURN NEW;
+END
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.execute(sa.text(CREATE_SORT_KEY_FUNCTIONS))
+    for table in FEATURE_TABLES:
+        op.add_column(table, sa.Column("sort_key", sa.String(length=12, collation="C")))
+        op.execute(
+            sa.text(
+                f"CREATE TRIGGER {table}_sort_key BEFORE INSERT OR UPDATE OF geom ON {table} "
+                "FOR EACH ROW EXECUTE FUNCTION set_feature_sort_key()"
+            )
+        )
+
+    with op.get_context().autocommit_block():
+        for table in FEATURE_TABLES:
+            backfill_sort_keys(table)
+            op.create_index(
+                f"ix_{table}_sort_key",
+                table,
+                ["sort_key", "id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.execute(
+                sa.text(
+                    f"ALTER TABLE {table} ADD CONSTRAINT ck_{table}_sort_key_not_null "
+                    "CHECK (sort_key IS NOT NULL) NOT VALID"
+                )
+            )
+            op.execute(
+                sa.text(f"ALTER TABLE {table} VALIDATE CONSTRAINT ck_{table}_sort_key_not_null")
+            )
+            # The validated check lets SET NOT NULL skip its own scan of the table.
+            op.alter_column(table, "sort_key", nullable=False)
+            op.drop_constraint(f"ck_{table}_sort_key_not_null", table, type_="check")
+
+
+def backfill_sort_keys(table: str) -> None:
+    # Walks the primary key in id order, so every batch is an index range scan and
+    # rows written meanwhile are already covered by the trigger.
+    connection = op.get_bind()
+    batch = sa.text(
+        f"""
+        WITH batch AS (
+            SELECT id FROM {table} WHERE id > CAST(:after_id AS uuid) ORDER BY id LIMIT :size
+        ),
+        updated AS (
+            UPDATE {table} SET sort_key = feature_sort_key({table}.geom)
+            FROM batch
+            WHERE {table}.id = batch.id AND {table}.sort_key IS NULL
+        )
+        SELECT id FROM batch ORDER BY id DESC LIMIT 1
+        """
+    )
+    after_id = FIRST_ID
+    while after_id is not None:
+        after_id = connection.execute(
+            batch, {"after_id": after_id, "size": BACKFILL_BATCH_SIZE}
+        ).scalar_one_or_none()
+
+
+def downgrade() -> None:
+    for table in FEATURE_TABLES:
+        op.drop_index(f"ix_{table}_sort_key", table_name=table)
+        op.execute(sa.text(f"DROP TRIGGER {table}_sort_key ON {table}"))
+        op.drop_column(table, "sort_key")
+    op.execute(sa.text("DROP FUNCTION set_feature_sort_key()"))
+    op.execute(sa.text("DROP FUNCTION feature_sort_key(geometry)"))
@@ -0,0 +1,38 @@
+"""add realtime event frames passed by reference
+
+Revision ID: f9a0b1c2d3e4
+Revises: e7f8a9b0c1d2
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "f9a0b1c2d3e4"
+down_revision: Union[str, Sequence[str], None] = "e7f8a9b0c1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "realtime_events",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("layer_id", sa.UUID(), nullable=False),
+        sa.Column("frame", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_realtime_events_created_at", "realtime_events", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_realtime_events_created_at", table_name="realtime_events")
+    op.drop_table("realtime_events")
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from geoalchemy2 import Geometry
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class FeatureChange(Base):
+    __tablename__ = "feature_changes"
+    __table_args__ = (
+        Index("ix_feature_changes_layer_id_revision", "layer_id", "revision"),
+        Index("ix_feature_changes_layer_id_changed_at", "layer_id", "changed_at"),
+        Index("ix_feature_changes_changed_at", "changed_at"),
+        Index("ix_feature_changes_extent", "extent", postgresql_using="gist"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    layer_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), ForeignKey("layers.id", ondelete="CASCADE"), nullable=False
+    )
+    feature_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    revision: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    change_type: Mapped[str] = mapped_column(String(16), nullable=False)
+    extent: Mapped[object] = mapped_column(
+        Geometry(geometry_type="GEOMETRY", srid=4326, spatial_index=False), nullable=False
+    )
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -9,7 +9,7 @@ import uuid
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.orm import mapped_column, Mapped
-from sqlalchemy import Integer, DateTime, text, func
+from sqlalchemy import FetchedValue, Index, Integer, DateTime, String, text, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.dialects.postgresql import JSONB
 from geoalchemy2 import Geometry
@@ -18,11 +18,27 @@ from .base import Base
 
 class FeatureMultiPoint(Base):
     __tablename__ = "feature_multipoints"
+    __table_args__ = (
+        Index(
+            "ix_feature_multipoints_properties",
+            "properties",
+            postgresql_using="gin",
+            postgresql_ops={"properties": "jsonb_path_ops"},
+        ),
+        Index("ix_feature_multipoints_sort_key", "sort_key", "id"),
+    )
     id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     geom: Mapped[object] = mapped_column(
         Geometry(geometry_type="MultiPoint", srid=4326), nullable=False
     )
     properties: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    sort_key: Mapped[str] = mapped_column(
+        String(12, collation="C"),
+        nullable=False,
+        # Set by the feature_sort_key trigger from the geometry.
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+    )
     version: Mapped[int] = mapped_column(
         Integer, nullable=False, server_default=text("1"), default=1
     )
@@ -8,8 +8,8 @@ Created on Tue Jan  6 23:31:46 2026
 from uuid import UUID
 import uuid
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy import String, Integer, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy import BigInteger, String, Integer, text
 from .base import Base
 
 
@@ -23,3 +23,14 @@ class Layer(Base):
         Integer, nullable=False, server_default=text("4326"), default=4326
     )
     storage_table: Mapped[str] = mapped_column(String(200), nullable=False)
+    revision: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0"), default=0
+    )
+    # Highest revision whose change log entries were pruned; delta sync from an older
+    # revision can no longer be answered from feature_changes.
+    pruned_revision: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0"), default=0
+    )
+    indexed_properties: Mapped[list[str]] = mapped_column(
+        ARRAY(String(32)), nullable=False, server_default=text("'{}'"), default=list
+    )
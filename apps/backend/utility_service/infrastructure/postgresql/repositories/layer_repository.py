@@ -1,22 +1,190 @@
 import json
+import operator
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Identity,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    bindparam,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+    values,
+)
+from geoalchemy2 import Geography, Geometry
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.schema import CreateTable
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from utility_service.domain_services.feature_aggregation import (
+    GRID_ORIGIN_LAT,
+    GRID_ORIGIN_LON,
+    AggregationGrid,
+)
+from utility_service.domain_services.feature_import import ImportedFeature
+from utility_service.domain_services.feature_order import (
+    ID_ORDER,
+    FeatureOrder,
+    format_feature_cursor,
+)
 from utility_service.domain_services.feature_registry import get_layer_feature_model
+from utility_service.domain_services.geometry_rendering import FULL_GEOMETRY, GeometryRendering
+from utility_service.domain_services.geometry_wkb import geometries_to_wkb, geometry_to_wkb
+from utility_service.domain_services.nearest_query import NearestQuery
+from utility_service.domain_services.property_filter import EQUALITY_OPERATORS, PropertyFilter
+from utility_service.domain_services.spatial_filter import SpatialFilter
+from utility_service.domain_services.tile import TileCoordinates
+from utility_service.infrastructure.postgresql.models.feature_change import FeatureChange
 from utility_service.infrastructure.postgresql.models.layer import Layer
 from utility_service.use_cases.schemas.geojson.geojson import FeatureProperties
 
+MVT_EXTENT = 4096
+MVT_BUFFER = 64
+FILTER_SUBDIVIDE_MAX_VERTICES = 256
+RANGE_COMPARATORS = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+WGS84_GEOGRAPHY = Geography(srid=4326)
+# ST_DWithin and ST_Distance may differ in the last bits; the radius of the exact nearest
+# pass is widened by a millimetre so the k-th candidate itself is never lost.
+NEAREST_DISTANCE_MARGIN = 0.001
+
+FEATURE_CREATED = "created"
+FEATURE_UPDATED = "updated"
+FEATURE_DELETED = "deleted"
+
+# Change log entries of a running import are staged here and get their revisions only
+# when the import finishes, so the layer row is locked for that last statement only.
+IMPORTED_CHANGES = Table(
+    "imported_feature_changes",
+    MetaData(),
+    Column("ordinal", BigInteger, Identity(start=1), primary_key=True),
+    Column("feature_id", PG_UUID(as_uuid=True), nullable=False),
+    Column("extent", Geometry(srid=4326, spatial_index=False), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
 
 class LayerRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
     async def list_features_bbox(
-        self, layer: Layer, bbox, limit_value: int, after_id: UUID | None = None
+        self,
+        layer: Layer,
+        bbox,
+        limit_value: int,
+        after_id: UUID | None = None,
+        rendering: GeometryRendering = FULL_GEOMETRY,
+        property_filters: tuple[PropertyFilter, ...] = (),
+        order: FeatureOrder = ID_ORDER,
+    ):
+        stmt = self.select_features_bbox(
+            layer, bbox, limit_value, after_id, rendering, property_filters, order
+        )
+        res = await self.session.execute(stmt)
+        return self.to_features_page(res.all(), limit_value, order)
+
+    async def list_features_filter(
+        self,
+        layer: Layer,
+        spatial_filter: SpatialFilter,
+        limit_value: int,
+        after_id: UUID | None = None,
+        rendering: GeometryRendering = FULL_GEOMETRY,
+        property_filters: tuple[PropertyFilter, ...] = (),
+    ):
+        stmt = self.select_features_filter(
+            layer, spatial_filter, limit_value, after_id, rendering, property_filters
+        )
+        res = await self.session.execute(stmt)
+        return self.to_features_page(res.all(), limit_value)
+
+    async def stream_layer_features(self, layer: Layer, fetch_rows: int) -> AsyncIterator[list]:
+        model_type = get_layer_feature_model(layer)
+        stmt = (
+            select(
+                model_type.id.label("id"),
+                self.get_feature_json_expr(model_type).label("feature_json"),
+            )
+            .order_by(model_type.id.asc())
+            .execution_options(yield_per=fetch_rows)
+        )
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    async def list_layers_features_bbox(
+        self,
+        layers: list[Layer],
+        bbox,
+        limit_value: int,
+        after_ids: dict[UUID, UUID],
+        rendering: GeometryRendering = FULL_GEOMETRY,
+    ):
+        # Every layer keeps its own limit and cursor, while the whole viewport is read
+        # in one round-trip on one pooled connection.
+        pages = [
+            self.select_features_bbox(layer, bbox, limit_value, after_ids.get(layer.id), rendering)
+            .add_columns(literal(layer.id, postgresql.UUID(as_uuid=True)).label("layer_id"))
+            .subquery(f"layer_{index}")
+            for index, layer in enumerate(layers)
+        ]
+        stmt = union_all(
+            *(select(page.c.layer_id, page.c.id, page.c.feature_json) for page in pages)
+        )
+        res = await self.session.execute(stmt)
+        rows_by_layer = {layer.id: [] for layer in layers}
+        for row in res.all():
+            rows_by_layer[row.layer_id].append(row)
+        # UNION ALL does not promise to keep the order of its branches, so the id order
+        # that cursors rely on is restored per layer here.
+        return {
+            layer_id: self.to_features_page(sorted(rows, key=lambda row: row.id), limit_value)
+            for layer_id, rows in rows_by_layer.items()
+        }
+
+    def select_features_bbox(
+        self,
+        layer: Layer,
+        bbox,
+        limit_value: int,
+        after_id: UUID | None,
+        rendering: GeometryRendering,
+        property_filters: tuple[PropertyFilter, ...] = (),
+        order: FeatureOrder = ID_ORDER,
     ):
         model_type = get_layer_feature_model(layer)
         envelope = func.ST_MakeEnvelope(
@@ -25,9 +193,7 @@ class LayerRepository:
         stmt = (
             select(
                 model_type.id.label("id"),
-                model_type.version.label("version"),
-                model_type.properties.label("properties"),
-                func.ST_AsGeoJSON(model_type.geom).cast(postgresql.JSONB).label("geometry_data"),
+                self.get_feature_json_expr(model_type, rendering).label("feature_json"),
             )
             .where(model_type.geom.op("&&")(envelope))
             .where(
@@ -37,22 +203,425 @@ class LayerRepository:
                 )
             )
         )
+        return self.page_features(stmt, model_type, limit_value, after_id, property_filters, order)
+
+    def select_features_filter(
+        self,
+        layer: Layer,
+        spatial_filter: SpatialFilter,
+        limit_value: int,
+        after_id: UUID | None,
+        rendering: GeometryRendering,
+        property_filters: tuple[PropertyFilter, ...] = (),
+    ):
+        model_type = get_layer_feature_model(layer)
+        filter_geom = func.ST_GeomFromWKB(literal(spatial_filter.geometry, LargeBinary), 4326)
+        if spatial_filter.buffer is not None:
+            filter_geom = cast(
+                func.ST_Buffer(cast(filter_geom, WGS84_GEOGRAPHY), spatial_filter.buffer),
+                Geometry(srid=4326),
+            )
+        # A long corridor or a detailed district is split into small pieces, so the
+        # index pre-filter compares features with tight boxes instead of one huge one.
+        # The pieces drive a join that probes the feature GiST index once per piece; a
+        # feature touching several pieces is collapsed by the IN semi-join.
+        pieces = select(
+            func.ST_Subdivide(filter_geom, FILTER_SUBDIVIDE_MAX_VERTICES).label("geom")
+        ).cte("filter_pieces")
+        matched = aliased(model_type, name="matched")
+        matched_ids = select(matched.id).select_from(
+            pieces.join(
+                matched,
+                and_(
+                    matched.geom.op("&&")(pieces.c.geom),
+                    func.ST_Intersects(matched.geom, pieces.c.geom),
+                ),
+            )
+        )
+        stmt = select(
+            model_type.id.label("id"),
+            self.get_feature_json_expr(model_type, rendering).label("feature_json"),
+        ).where(model_type.id.in_(matched_ids))
+        return self.page_features(stmt, model_type, limit_value, after_id, property_filters)
+
+    def page_features(
+        self,
+        stmt,
+        model_type: type,
+        limit_value: int,
+        after_id: UUID | None,
+        property_filters: tuple[PropertyFilter, ...] = (),
+        order: FeatureOrder = ID_ORDER,
+    ):
+        for property_filter in property_filters:
+            stmt = stmt.where(self.get_property_filter_expr(model_type, property_filter))
+        if order.spatial:
+            # Pages follow the geohash of each feature's representative point, continued
+            # by a row comparison that is a range scan of the (sort_key, id) index.
+            if after_id is not None:
+                stmt = stmt.where(
+                    tuple_(model_type.sort_key, model_type.id) > tuple_(order.after_key, after_id)
+                )
+            return (
+                stmt.add_columns(model_type.sort_key.label("sort_key"))
+                .order_by(model_type.sort_key.asc(), model_type.id.asc())
+                .limit(limit_value + 1)
+            )
         if after_id is not None:
             stmt = stmt.where(model_type.id > after_id)
-        stmt = stmt.order_by(model_type.id.asc()).limit(limit_value + 1)
-        res = await self.session.execute(stmt)
-        rows = res.all()
+        return stmt.order_by(model_type.id.asc()).limit(limit_value + 1)
+
+    def to_features_page(self, rows, limit_value: int, order: FeatureOrder = ID_ORDER):
         truncated = len(rows) > limit_value
         if truncated:
             rows = rows[:limit_value]
-        next_cursor = str(rows[-1].id) if truncated and rows else None
+        next_cursor = format_feature_cursor(order, rows[-1]) if truncated and rows else None
         return (rows, truncated, next_cursor)
 
+    async def aggregate_features_bbox(self, layer: Layer, bbox, grid: AggregationGrid):
+        model_type = get_layer_feature_model(layer)
+        envelope = func.ST_MakeEnvelope(
+            bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat, 4326
+        )
+        # Every feature is counted once, in the cell of its representative point, so
+        # neighbouring viewports never count the same feature twice.
+        located = (
+            select(
+                func.ST_PointOnSurface(model_type.geom).label("point"),
+                model_type.geom.label("geom"),
+            )
+            .where(model_type.geom.op("&&")(envelope))
+            .subquery("located")
+        )
+        cell_x = func.floor((func.ST_X(located.c.point) - GRID_ORIGIN_LON) / grid.cell_size)
+        cell_y = func.floor((func.ST_Y(located.c.point) - GRID_ORIGIN_LAT) / grid.cell_size)
+        extent = func.ST_Extent(located.c.geom)
+        stmt = (
+            select(
+                cast(cell_x, Integer).label("x"),
+                cast(cell_y, Integer).label("y"),
+                func.count().label("count"),
+                func.ST_XMin(extent).label("min_lon"),
+                func.ST_YMin(extent).label("min_lat"),
+                func.ST_XMax(extent).label("max_lon"),
+                func.ST_YMax(extent).label("max_lat"),
+                func.avg(func.ST_X(located.c.point)).label("lon"),
+                func.avg(func.ST_Y(located.c.point)).label("lat"),
+            )
+            .where(func.ST_Intersects(located.c.point, envelope))
+            .group_by(cell_x, cell_y)
+            .order_by(cell_y, cell_x)
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
+
+    async def list_nearest_features(self, layer: Layer, query: NearestQuery):
+        model_type = get_layer_feature_model(layer)
+        point = func.ST_SetSRID(func.ST_MakePoint(query.lon, query.lat), 4326)
+        # The first pass takes k candidates in index order of the planar <-> distance,
+        # which lets the GiST index stop after k rows. Degrees are not meters away from
+        # the equator, so the true k nearest can lie outside it; the distance in meters
+        # to the k-th candidate bounds them, and the second pass reads everything within
+        # that radius ordered by meters.
+        stmt = self.select_nearest_features(model_type, point, query)
+        candidates = (
+            stmt.order_by(model_type.geom.op("<->")(point)).limit(query.k).subquery("candidates")
+        )
+        res = await self.session.execute(
+            select(candidates).order_by(candidates.c.distance.asc(), candidates.c.id.asc())
+        )
+        rows = res.all()
+        if len(rows) < query.k:
+            return rows
+
+        radius = rows[-1].distance + NEAREST_DISTANCE_MARGIN
+        stmt = (
+            self.select_nearest_features(model_type, point, replace(query, max_distance=radius))
+            .order_by(literal_column("distance").asc(), model_type.id.asc())
+            .limit(query.k)
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
+
+    def select_nearest_features(self, model_type, point, query: NearestQuery):
+        distance = func.ST_Distance(
+            cast(model_type.geom, WGS84_GEOGRAPHY), cast(point, WGS84_GEOGRAPHY)
+        )
+        stmt = select(
+            model_type.id.label("id"),
+            self.get_feature_json_expr(model_type).label("feature_json"),
+            distance.label("distance"),
+        )
+        search_bbox = query.search_bbox()
+        if search_bbox is None:
+            return stmt
+        envelope = func.ST_MakeEnvelope(
+            search_bbox.min_lon,
+            search_bbox.min_lat,
+            search_bbox.max_lon,
+            search_bbox.max_lat,
+            4326,
+        )
+        return stmt.where(model_type.geom.op("&&")(envelope)).where(
+            func.ST_DWithin(
+                cast(model_type.geom, WGS84_GEOGRAPHY),
+                cast(point, WGS84_GEOGRAPHY),
+                query.max_distance,
+            )
+        )
+
+    async def create_import_staging(self) -> None:
+        await self.session.execute(CreateTable(IMPORTED_CHANGES))
+
+    async def copy_features(self, layer: Layer, features: list[ImportedFeature]) -> None:
+        model_type = get_layer_feature_model(layer)
+        async with self.copy_connection() as connection:
+            await connection.copy_records_to_table(
+                model_type.__tablename__,
+                records=[
+                    (feature.id, feature.geometry, feature.properties) for feature in features
+                ],
+                columns=["id", "geom", "properties"],
+            )
+            await connection.copy_records_to_table(
+                IMPORTED_CHANGES.name,
+                records=[(feature.id, feature.extent) for feature in features],
+                columns=["feature_id", "extent"],
+            )
+
+    async def record_imported_feature_changes(self, layer_id: UUID, imported: int) -> int:
+        # Staged rows are numbered from 1 in import order and become consecutive revisions
+        # ending at the bumped layer revision.
+        bumped = (
+            update(Layer)
+            .where(Layer.id == layer_id)
+            .values(revision=Layer.revision + imported)
+            .returning(Layer.revision)
+            .cte("bumped")
+        )
+        logged = (
+            insert(FeatureChange)
+            .from_select(
+                ["layer_id", "feature_id", "revision", "change_type", "extent"],
+                select(
+                    literal(layer_id, PG_UUID(as_uuid=True)),
+                    IMPORTED_CHANGES.c.feature_id,
+                    bumped.c.revision - imported + IMPORTED_CHANGES.c.ordinal,
+                    literal(FEATURE_CREATED),
+                    IMPORTED_CHANGES.c.extent,
+                ).select_from(IMPORTED_CHANGES.join(bumped, true())),
+            )
+            .returning(FeatureChange.id)
+            .cte("logged")
+        )
+        stmt = select(bumped.c.revision).add_cte(logged)
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
+
+    @asynccontextmanager
+    async def copy_connection(self):
+        # Binary COPY needs a wire codec for PostGIS geometry; EWKB is its binary format.
+        # The codec is dropped afterwards so pooled connections keep the default text form.
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        await driver_connection.set_type_codec(
+            "geometry", schema="public", encoder=bytes, decoder=bytes, format="binary"
+        )
+        try:
+            yield driver_connection
+        finally:
+            await driver_connection.reset_type_codec("geometry", schema="public")
+
+    async def get_layer_tile(self, layer: Layer, tile: TileCoordinates) -> bytes:
+        model_type = get_layer_feature_model(layer)
+        tile_envelope = func.ST_TileEnvelope(tile.z, tile.x, tile.y)
+        buffered_envelope = func.ST_Transform(
+            func.ST_Expand(tile_envelope, tile.size_meters * MVT_BUFFER / MVT_EXTENT), 4326
+        )
+        tile_features = (
+            select(
+                func.ST_AsMVTGeom(
+                    func.ST_Transform(model_type.geom, 3857),
+                    tile_envelope,
+                    MVT_EXTENT,
+                    MVT_BUFFER,
+                    True,
+                ).label("geom"),
+                cast(model_type.id, String).label("id"),
+                model_type.version.label("version"),
+                model_type.properties.label("properties"),
+            )
+            .where(model_type.geom.op("&&")(buffered_envelope))
+            .subquery("tile_features")
+        )
+        stmt = select(func.ST_AsMVT(tile_features.table_valued(), layer.name, MVT_EXTENT, "geom"))
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none() or b""
+
     async def get_layer_by_id(self, layer_id: UUID) -> Layer:
         stmt = select(Layer).where(Layer.id == layer_id)
         res = await self.session.execute(stmt)
         return res.scalars().one_or_none()
 
+    async def get_layer_revision(self, layer_id: UUID) -> int | None:
+        stmt = select(Layer.revision).where(Layer.id == layer_id)
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
+
+    async def get_layer_revisions(self, layer_ids: list[UUID]) -> dict[UUID, int]:
+        stmt = select(Layer.id, Layer.revision).where(Layer.id.in_(layer_ids))
+        res = await self.session.execute(stmt)
+        return {row.id: row.revision for row in res.all()}
+
+    async def set_indexed_properties(self, layer: Layer, keys: list[str]) -> None:
+        # Only the declaration is stored here; the indexes themselves are built by
+        # PropertyIndexRepository outside the transaction.
+        await self.session.execute(
+            update(Layer).where(Layer.id == layer.id).values(indexed_properties=keys)
+        )
+
+    async def bump_layer_revision(self, layer_id: UUID, increment: int = 1) -> int:
+        stmt = (
+            update(Layer)
+            .where(Layer.id == layer_id)
+            .values(revision=Layer.revision + increment)
+            .returning(Layer.revision)
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
+
+    async def record_feature_change(
+        self, layer_id: UUID, feature_id: UUID, change_type: str, extent
+    ) -> int:
+        return await self.record_feature_changes(layer_id, [(feature_id, change_type, extent)])
+
+    async def record_feature_changes(
+        self, layer_id: UUID, changes: list[tuple[UUID, str, object]]
+    ) -> int:
+        # Every logged change gets its own revision, so revisions stay a total order
+        # that delta sync can page through.
+        revision = await self.bump_layer_revision(layer_id, len(changes))
+        first_revision = revision - len(changes) + 1
+        stmt = insert(FeatureChange).values(
+            [
+                {
+                    "layer_id": layer_id,
+                    "feature_id": feature_id,
+                    "revision": first_revision + offset,
+                    "change_type": change_type,
+                    "extent": extent,
+                }
+                for offset, (feature_id, change_type, extent) in enumerate(changes)
+            ]
+        )
+        await self.session.execute(stmt)
+        return revision
+
+    async def get_pruned_revision(self, layer_id: UUID) -> int | None:
+        stmt = select(Layer.pruned_revision).where(Layer.id == layer_id)
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
+
+    async def prune_feature_changes(self, before: datetime) -> int:
+        # Pruned rows need not be a prefix of a layer's revisions (changed_at is the
+        # transaction start), so the highest pruned revision is recorded and delta sync
+        # refuses anything older than it.
+        pruned = (
+            delete(FeatureChange)
+            .where(FeatureChange.changed_at < before)
+            .returning(FeatureChange.layer_id, FeatureChange.revision)
+            .cte("pruned")
+        )
+        pruned_layers = (
+            select(pruned.c.layer_id, func.max(pruned.c.revision).label("revision"))
+            .group_by(pruned.c.layer_id)
+            .subquery("pruned_layers")
+        )
+        marked = (
+            update(Layer)
+            .where(Layer.id == pruned_layers.c.layer_id)
+            .values(pruned_revision=func.greatest(Layer.pruned_revision, pruned_layers.c.revision))
+            .returning(Layer.id)
+            .cte("marked")
+        )
+        stmt = select(func.count()).select_from(pruned).add_cte(marked)
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
+
+    async def get_revision_at(self, layer_id: UUID, moment: datetime) -> int:
+        stmt = select(func.coalesce(func.max(FeatureChange.revision), 0)).where(
+            FeatureChange.layer_id == layer_id, FeatureChange.changed_at <= moment
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
+
+    async def has_feature_changes_bbox(
+        self, layer: Layer, bbox, after_revision: int, up_to_revision: int
+    ) -> bool:
+        envelope = func.ST_MakeEnvelope(
+            bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat, 4326
+        )
+        # Once the log was pruned past after_revision the changes can no longer be ruled
+        # out, so the bbox counts as changed.
+        stmt = select(
+            or_(
+                select(FeatureChange.id)
+                .where(
+                    FeatureChange.layer_id == layer.id,
+                    FeatureChange.revision > after_revision,
+                    FeatureChange.revision <= up_to_revision,
+                    FeatureChange.extent.op("&&")(envelope),
+                )
+                .exists(),
+                select(Layer.id)
+                .where(Layer.id == layer.id, Layer.pruned_revision > after_revision)
+                .exists(),
+            )
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one()
+
+    async def list_feature_changes_bbox(
+        self, layer: Layer, bbox, since_revision: int, limit_value: int
+    ):
+        model_type = get_layer_feature_model(layer)
+        envelope = func.ST_MakeEnvelope(
+            bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat, 4326
+        )
+        changes = (
+            select(
+                FeatureChange.feature_id.label("feature_id"),
+                func.max(FeatureChange.revision).label("revision"),
+            )
+            .where(
+                FeatureChange.layer_id == layer.id,
+                FeatureChange.revision > since_revision,
+                FeatureChange.extent.op("&&")(envelope),
+            )
+            .group_by(FeatureChange.feature_id)
+            .subquery("changes")
+        )
+        stmt = (
+            select(
+                changes.c.feature_id.label("id"),
+                changes.c.revision.label("revision"),
+                case(
+                    (model_type.id.is_not(None), self.get_feature_json_expr(model_type)),
+                    else_=None,
+                ).label("feature_json"),
+            )
+            .select_from(changes.outerjoin(model_type, model_type.id == changes.c.feature_id))
+            .order_by(changes.c.revision.asc())
+            .limit(limit_value + 1)
+        )
+        res = await self.session.execute(stmt)
+        rows = res.all()
+        truncated = len(rows) > limit_value
+        if truncated:
+            rows = rows[:limit_value]
+        return (rows, truncated)
+
     async def create_feature(
         self, layer: Layer, geometry: dict[str, object], properties: FeatureProperties
     ):
@@ -64,10 +633,65 @@ class LayerRepository:
             .returning(
                 model_type.id.label("id"),
                 model_type.version.label("version"),
+                func.ST_Envelope(model_type.geom).label("extent"),
             )
         )
         res = await self.session.execute(stmt)
-        return res.one_or_none()
+        row = res.one_or_none()
+        if row is not None:
+            await self.record_feature_change(layer.id, row.id, FEATURE_CREATED, row.extent)
+        return row
+
+    async def create_features(
+        self, layer: Layer, features: list[tuple[dict[str, object], FeatureProperties]]
+    ):
+        model_type = get_layer_feature_model(layer)
+        feature_ids = [uuid.uuid4() for _ in features]
+        # The batch is bound as three arrays and unnested server-side, so the statement
+        # keeps three parameters however many features it carries.
+        batch = (
+            func.unnest(
+                literal(feature_ids, postgresql.ARRAY(postgresql.UUID(as_uuid=True))),
+                literal(
+                    geometries_to_wkb([geometry for geometry, _ in features]),
+                    postgresql.ARRAY(LargeBinary),
+                ),
+                literal(
+                    [json.dumps(properties) for _, properties in features], postgresql.ARRAY(Text)
+                ),
+            )
+            .table_valued(
+                column("id", postgresql.UUID(as_uuid=True)),
+                column("geometry", LargeBinary),
+                column("properties", Text),
+            )
+            .render_derived(name="batch")
+        )
+        stmt = (
+            insert(model_type)
+            .from_select(
+                ["id", "version", "properties", "geom"],
+                select(
+                    batch.c.id,
+                    literal(1, Integer),
+                    cast(batch.c.properties, postgresql.JSONB),
+                    func.ST_GeomFromWKB(batch.c.geometry, 4326),
+                ),
+            )
+            .returning(
+                model_type.id.label("id"),
+                model_type.version.label("version"),
+                func.ST_Envelope(model_type.geom).label("extent"),
+            )
+        )
+        res = await self.session.execute(stmt)
+        positions = {feature_id: position for position, feature_id in enumerate(feature_ids)}
+        rows = sorted(res.all(), key=lambda row: positions[row.id])
+        if rows:
+            await self.record_feature_changes(
+                layer.id, [(row.id, FEATURE_CREATED, row.extent) for row in rows]
+            )
+        return rows
 
     async def update_feature_if_version_matches(
         self,
@@ -77,47 +701,183 @@ class LayerRepository:
         properties: FeatureProperties | None,
         expected_version: int,
     ):
-        if geometry:
-            geom_expr = self.get_geom_expr(geometry)
         model_type = get_layer_feature_model(layer)
-        update_stmt = update(model_type).where(
-            model_type.id == feature_id, model_type.version == expected_version
+        # The previous row is read in the same statement: it tells a version conflict from
+        # a missing feature and lets the change extent cover the area a moved feature left.
+        # It is locked, so a writer committing concurrently is waited for and a conflict
+        # reports the version that writer left, never the client's stale one.
+        previous = (
+            select(model_type.id, model_type.version, model_type.geom)
+            .where(model_type.id == feature_id)
+            .with_for_update()
+            .cte("previous")
         )
-        if geometry is None and properties is not None:
-            update_stmt = update_stmt.values(
-                properties=properties, version=model_type.version + 1, updated_at=func.now()
+        changes = {"version": model_type.version + 1, "updated_at": func.now()}
+        if geometry is not None:
+            changes["geom"] = self.get_geom_expr(geometry)
+        if properties is not None:
+            changes["properties"] = properties
+        updated = (
+            update(model_type)
+            .where(model_type.id == previous.c.id, model_type.version == expected_version)
+            .values(**changes)
+            .returning(
+                model_type.id.label("id"),
+                model_type.version.label("version"),
+                model_type.properties.label("properties"),
+                func.ST_AsGeoJSON(model_type.geom).cast(postgresql.JSONB).label("geometry_data"),
+                func.ST_Envelope(func.ST_Collect(previous.c.geom, model_type.geom)).label("extent"),
             )
-        elif properties is None and geometry is not None:
-            update_stmt = update_stmt.values(
-                geom=geom_expr, version=model_type.version + 1, updated_at=func.now()
+            .cte("updated")
+        )
+        stmt = (
+            select(
+                previous.c.version.label("current_version"),
+                updated.c.id,
+                updated.c.version,
+                updated.c.properties,
+                updated.c.geometry_data,
+                updated.c.extent,
             )
-        else:
-            update_stmt = update_stmt.values(
-                geom=geom_expr,
-                properties=properties,
+            .select_from(previous.outerjoin(updated, updated.c.id == previous.c.id))
+            .add_cte(*self.get_change_log_ctes(layer.id, updated, FEATURE_UPDATED))
+        )
+        res = await self.session.execute(stmt)
+        return res.one_or_none()
+
+    async def delete_feature_if_version_matches(
+        self, layer: Layer, feature_id: UUID, expected_version: int
+    ):
+        model_type = get_layer_feature_model(layer)
+        previous = (
+            select(model_type.id, model_type.version)
+            .where(model_type.id == feature_id)
+            .with_for_update()
+            .cte("previous")
+        )
+        deleted = (
+            delete(model_type)
+            .where(model_type.id == previous.c.id, model_type.version == expected_version)
+            .returning(model_type.id.label("id"), func.ST_Envelope(model_type.geom).label("extent"))
+            .cte("deleted")
+        )
+        stmt = (
+            select(previous.c.version.label("current_version"), deleted.c.id, deleted.c.extent)
+            .select_from(previous.outerjoin(deleted, deleted.c.id == previous.c.id))
+            .add_cte(*self.get_change_log_ctes(layer.id, deleted, FEATURE_DELETED))
+        )
+        res = await self.session.execute(stmt)
+        return res.one_or_none()
+
+    def get_change_log_ctes(self, layer_id: UUID, changed, change_type: str):
+        # Bumps the layer revision and logs the change inside the write statement itself;
+        # both stay no-ops when the write matched no row.
+        bumped = (
+            update(Layer)
+            .where(Layer.id == layer_id, select(changed.c.id).exists())
+            .values(revision=Layer.revision + 1)
+            .returning(Layer.revision.label("revision"))
+            .cte("bumped")
+        )
+        logged = (
+            insert(FeatureChange)
+            .from_select(
+                ["layer_id", "feature_id", "revision", "change_type", "extent"],
+                select(
+                    literal(layer_id, postgresql.UUID(as_uuid=True)),
+                    changed.c.id,
+                    bumped.c.revision,
+                    literal(change_type, String),
+                    changed.c.extent,
+                ),
+            )
+            .returning(FeatureChange.id)
+            .cte("logged")
+        )
+        return (bumped, logged)
+
+    async def update_features_if_versions_match(
+        self,
+        layer: Layer,
+        features: list[tuple[UUID, int, dict[str, object] | None, FeatureProperties | None]],
+    ):
+        model_type = get_layer_feature_model(layer)
+        batch = values(
+            column("id", postgresql.UUID(as_uuid=True)),
+            column("expected_version", Integer),
+            column("geometry", LargeBinary),
+            column("properties", postgresql.JSONB(none_as_null=True)),
+            name="batch",
+        ).data(
+            [
+                (feature_id, expected_version, geometry_wkb, properties)
+                for (feature_id, expected_version, _, properties), geometry_wkb in zip(
+                    features, geometries_to_wkb([feature[2] for feature in features])
+                )
+            ]
+        )
+        previous = (
+            select(model_type.id, model_type.geom)
+            .where(model_type.id.in_([feature[0] for feature in features]))
+            .subquery("previous")
+        )
+        # Missing geometry or properties keep the stored value, so partial updates
+        # of many features still fit in a single UPDATE.
+        stmt = (
+            update(model_type)
+            .where(
+                model_type.id == batch.c.id,
+                model_type.version == batch.c.expected_version,
+                previous.c.id == batch.c.id,
+            )
+            .values(
+                geom=func.coalesce(
+                    func.ST_GeomFromWKB(cast(batch.c.geometry, LargeBinary), 4326),
+                    model_type.geom,
+                ),
+                properties=func.coalesce(
+                    cast(batch.c.properties, postgresql.JSONB), model_type.properties
+                ),
                 version=model_type.version + 1,
                 updated_at=func.now(),
             )
-        update_stmt = update_stmt.returning(
-            model_type.id.label("id"),
-            model_type.version.label("version"),
+            .returning(
+                model_type.id.label("id"),
+                model_type.version.label("version"),
+                model_type.properties.label("properties"),
+                func.ST_AsGeoJSON(model_type.geom).cast(postgresql.JSONB).label("geometry_data"),
+                func.ST_Envelope(func.ST_Collect(previous.c.geom, model_type.geom)).label("extent"),
+            )
         )
-        update_stmt = update_stmt
-        res = await self.session.execute(update_stmt)
-        return (res.one_or_none(), model_type)
+        res = await self.session.execute(stmt)
+        rows = res.all()
+        if rows:
+            await self.record_feature_changes(
+                layer.id, [(row.id, FEATURE_UPDATED, row.extent) for row in rows]
+            )
+        return (rows, model_type)
 
-    async def delete_feature_if_version_matches(
-        self, layer: Layer, feature_id: UUID, expected_version: int
-    ) -> tuple[bool, type]:
+    async def delete_features_if_versions_match(
+        self, layer: Layer, features: list[tuple[UUID, int]]
+    ):
         model_type = get_layer_feature_model(layer)
+        batch = values(
+            column("id", postgresql.UUID(as_uuid=True)),
+            column("expected_version", Integer),
+            name="batch",
+        ).data(features)
         stmt = (
             delete(model_type)
-            .where(model_type.id == feature_id, model_type.version == expected_version)
-            .returning(model_type.id)
+            .where(model_type.id == batch.c.id, model_type.version == batch.c.expected_version)
+            .returning(model_type.id, func.ST_Envelope(model_type.geom).label("extent"))
         )
         res = await self.session.execute(stmt)
-        deleted_id = res.scalar_one_or_none()
-        return (deleted_id is not None, model_type)
+        rows = res.all()
+        if rows:
+            await self.record_feature_changes(
+                layer.id, [(row.id, FEATURE_DELETED, row.extent) for row in rows]
+            )
+        return (rows, model_type)
 
     async def get_feature(self, layer: Layer, feature_id: UUID):
         model_type = get_layer_feature_model(layer)
@@ -130,16 +890,83 @@ class LayerRepository:
         res = await self.session.execute(stmt)
         return res.one_or_none()
 
+    async def get_feature_json(
+        self, layer: Layer, feature_id: UUID, rendering: GeometryRendering
+    ) -> str | None:
+        model_type = get_layer_feature_model(layer)
+        stmt = select(self.get_feature_json_expr(model_type, rendering)).where(
+            model_type.id == feature_id
+        )
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
+
     async def get_layers(self):
         stmt = select(Layer)
         res = await self.session.execute(stmt)
         return res.scalars().all()
 
-    async def get_current_version(self, model_type: type, feature_id: UUID):
-        stmt = select(model_type.version.label("version")).where(model_type.id == feature_id)
+    async def get_current_versions(self, model_type: type, feature_ids: list[UUID]):
+        stmt = select(model_type.id, model_type.version).where(model_type.id.in_(feature_ids))
         res = await self.session.execute(stmt)
-        return res.one_or_none()
+        return {row.id: row.version for row in res.all()}
+
+    def get_feature_json_expr(self, model_type: type, rendering: GeometryRendering = FULL_GEOMETRY):
+        geometry_json = null()
+        if rendering.geometry:
+            geom = model_type.geom
+            if rendering.tolerance is not None:
+                geom = func.ST_SimplifyPreserveTopology(geom, rendering.tolerance)
+            geometry_json = cast(
+                (
+                    func.ST_AsGeoJSON(geom)
+                    if rendering.precision is None
+                    else func.ST_AsGeoJSON(geom, rendering.precision)
+                ),
+                postgresql.JSON,
+            )
+        properties = model_type.properties
+        if rendering.fields is not None:
+            # Requested keys that a feature does not have are returned as null.
+            properties = func.jsonb_build_object(
+                *(
+                    item
+                    for field in rendering.fields
+                    for item in (field, model_type.properties[field])
+                )
+            )
+        return cast(
+            func.json_build_object(
+                "id",
+                model_type.id,
+                "type",
+                "Feature",
+                "version",
+                model_type.version,
+                "geometry",
+                geometry_json,
+                "properties",
+                properties,
+            ),
+            Text,
+        )
+
+    def get_property_filter_expr(self, model_type: type, property_filter: PropertyFilter):
+        key = property_filter.key
+        if property_filter.op in EQUALITY_OPERATORS:
+            # Containment is answered by the GIN jsonb_path_ops index on properties.
+            return or_(
+                *(model_type.properties.contains({key: value}) for value in property_filter.values)
+            )
+        # The key is inlined so the comparison matches the per-key expression index even
+        # when the statement is prepared with a generic plan.
+        value = model_type.properties.op("->", return_type=postgresql.JSONB)(
+            bindparam(None, key, String, literal_execute=True)
+        )
+        bound = literal(property_filter.values[0], postgresql.JSONB)
+        return and_(
+            func.jsonb_typeof(value) == "number",
+            RANGE_COMPARATORS[property_filter.op](value, bound),
+        )
 
     def get_geom_expr(self, geometry: dict[str, object]):
-        geometry_str = json.dumps(geometry)
-        return func.ST_SetSRID(func.ST_GeomFromGeoJSON(geometry_str), 4326)
+        return func.ST_GeomFromWKB(literal(geometry_to_wkb(geometry), LargeBinary), 4326)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from sqlalchemy import Index, bindparam, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from utility_service.infrastructure.postgresql.models.layer import Layer
+
+PROPERTY_INDEXES_SQL = text(
+    """
+    SELECT index_class.relname AS name, pg_index.indisvalid AS valid
+    FROM pg_index
+    JOIN pg_class AS index_class ON index_class.oid = pg_index.indexrelid
+    JOIN pg_class AS table_class ON table_class.oid = pg_index.indrelid
+    WHERE table_class.relname = :table_name AND starts_with(index_class.relname, :prefix)
+    """
+).bindparams(bindparam("table_name"), bindparam("prefix"))
+
+
+# Expression indexes live on the storage tables shared by every layer of a geometry type,
+# so they are built from the keys of all those layers, outside any request transaction.
+# The connection must be in AUTOCOMMIT: CONCURRENTLY cannot run inside a transaction.
+class PropertyIndexRepository:
+    def __init__(self, connection: AsyncConnection):
+        self.connection = connection
+
+    async def get_indexed_property_keys(self, model_type: type) -> set[str]:
+        keys = func.unnest(Layer.indexed_properties)
+        stmt = select(keys).where(Layer.storage_table == model_type.__tablename__).distinct()
+        res = await self.connection.execute(stmt)
+        return set(res.scalars().all())
+
+    async def get_property_indexes(self, model_type: type) -> dict[str, bool]:
+        prefix = get_property_index_prefix(model_type)
+        res = await self.connection.execute(
+            PROPERTY_INDEXES_SQL, {"table_name": model_type.__tablename__, "prefix": prefix}
+        )
+        return {row.name[len(prefix) :]: row.valid for row in res.all()}
+
+    async def create_property_index(self, model_type: type, key: str) -> None:
+        index = get_property_index(model_type, key)
+        await self.connection.execute(CreateIndex(index, if_not_exists=True))
+
+    async def drop_property_index(self, model_type: type, key: str) -> None:
+        index = get_property_index(model_type, key)
+        await self.connection.execute(DropIndex(index, if_exists=True))
+
+
+def get_property_index_prefix(model_type: type) -> str:
+    return f"ix_{model_type.__tablename__}_prop_"
+
+
+def get_property_index(model_type: type, key: str) -> Index:
+    # Range filters compare properties -> key, so this is the expression they can use.
+    return Index(
+        f"{get_property_index_prefix(model_type)}{key}",
+        model_type.properties[key],
+        postgresql_concurrently=True,
+    )
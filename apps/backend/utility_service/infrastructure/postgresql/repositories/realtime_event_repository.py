@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from utility_service.infrastructure.postgresql.models.realtime_event import RealtimeEvent
+
+
+class RealtimeEventRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add_event_frame(self, layer_id: UUID, frame: str) -> int:
+        stmt = (
+            insert(RealtimeEvent).values(layer_id=layer_id, frame=frame).returning(RealtimeEvent.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def get_event_frame(self, event_id: int) -> str | None:
+        stmt = select(RealtimeEvent.frame).where(RealtimeEvent.id == event_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def delete_event_frames_before(self, created_before: datetime) -> None:
+        await self.session.execute(
+            delete(RealtimeEvent).where(RealtimeEvent.created_at < created_before)
+        )
+
+    async def notify(self, channel: str, payload: str) -> None:
+        await self.session.execute(select(func.pg_notify(channel, payload)))
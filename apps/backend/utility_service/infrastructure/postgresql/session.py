@@ -1,5 +1,11 @@
 from collections.abc import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 from utility_service.utils.settings import settings
 
 engine = create_async_engine(
@@ -9,6 +15,11 @@ engine = create_async_engine(
 SessionFactory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def create_unpooled_engine() -> AsyncEngine:
+    # For long-lived connections (LISTEN) that must not hold a slot of the request pool.
+    return create_async_engine(settings.database_url, echo=False, poolclass=NullPool)
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with SessionFactory() as session:
         try:
@@ -0,0 +1,653 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import shapely
+
+from sqlalchemy.dialects import postgresql
+
+from utility_service.domain_services.bbox import Bbox
+from utility_service.domain_services.feature_aggregation import AggregationGrid
+from utility_service.domain_services.feature_import import ImportedFeature
+from utility_service.domain_services.feature_order import FeatureOrder
+from utility_service.domain_services.geometry_rendering import GeometryRendering
+from utility_service.domain_services.nearest_query import NearestQuery
+from utility_service.domain_services.property_filter import parse_property_filters
+from utility_service.domain_services.spatial_filter import parse_spatial_filter
+from utility_service.domain_services.tile import TileCoordinates
+from utility_service.infrastructure.postgresql.repositories.layer_repository import (
+    LayerRepository,
+)
+
+
+POINT_LAYER = SimpleNamespace(id=uuid4(), name="points", storage_table="feature_points")
+
+
+class _ExecuteResult:
+    def __init__(self, scalar=None, rows=None, row=None):
+        self.scalar = scalar
+        self.rows = rows or []
+        self.row = row
+
+    def one_or_none(self):
+        return self.row
+
+    def scalar_one_or_none(self):
+        return self.scalar
+
+    def scalar_one(self):
+        return self.scalar
+
+    def all(self):
+        return self.rows
+
+
+def batch_array(statement, item_type):
+    params = statement.compile(dialect=postgresql.dialect()).params
+    return next(
+        value
+        for value in params.values()
+        if isinstance(value, list) and value and isinstance(value[0], item_type)
+    )
+
+
+class CapturingSession:
+    def __init__(self, result: _ExecuteResult | None = None) -> None:
+        self.statement = None
+        self.statements = []
+        self.result = result or _ExecuteResult()
+
+    async def execute(self, statement):
+        self.statement = statement
+        self.statements.append(statement)
+        return self.result
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_list_layers_features_bbox_reads_all_layers_with_one_union_all() -> None:
+    polygon_layer = SimpleNamespace(id=uuid4(), storage_table="feature_polygons")
+    cursor = uuid4()
+    point_rows = [
+        SimpleNamespace(layer_id=POINT_LAYER.id, id=feature_id, feature_json="{}")
+        for feature_id in sorted((uuid4(), uuid4()), reverse=True)
+    ]
+    session = CapturingSession(_ExecuteResult(rows=point_rows))
+    repository = LayerRepository(session)
+
+    pages = asyncio.run(
+        repository.list_layers_features_bbox(
+            [POINT_LAYER, polygon_layer],
+            Bbox(10.0, 20.0, 30.0, 40.0),
+            1,
+            {polygon_layer.id: cursor},
+        )
+    )
+
+    assert len(session.statements) == 1
+    sql = compile_sql(session.statement)
+    assert sql.count("UNION ALL") == 1
+    assert "FROM feature_points" in sql
+    assert "feature_polygons.id > " in sql
+    assert sql.count("LIMIT ") == 2
+    assert pages[POINT_LAYER.id] == ([point_rows[1]], True, str(point_rows[1].id))
+    assert pages[polygon_layer.id] == ([], False, None)
+
+
+def test_aggregate_features_bbox_groups_representative_points_by_grid_cell() -> None:
+    session = CapturingSession(_ExecuteResult(rows=[SimpleNamespace(x=1, y=2, count=3)]))
+    repository = LayerRepository(session)
+
+    rows = asyncio.run(
+        repository.aggregate_features_bbox(
+            POINT_LAYER, Bbox(10.0, 20.0, 30.0, 40.0), AggregationGrid(zoom=6, cell_size=1.5)
+        )
+    )
+
+    assert rows == session.result.rows
+    sql = compile_sql(session.statement)
+    assert "ST_PointOnSurface(feature_points.geom) AS point" in sql
+    assert "feature_points.geom && ST_MakeEnvelope(" in sql
+    assert "ST_Intersects(located.point, ST_MakeEnvelope(" in sql
+    assert "count(*) AS count" in sql
+    assert "ST_XMin(ST_Extent(located.geom)) AS min_lon" in sql
+    assert "avg(ST_X(located.point)) AS lon" in sql
+    assert "GROUP BY floor((ST_X(located.point)" in sql
+
+
+class CopyConnection:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, object]] = []
+
+    async def set_type_codec(self, name, **kwargs):
+        self.calls.append(("set_type_codec", name, kwargs["format"]))
+
+    async def reset_type_codec(self, name, **kwargs):
+        self.calls.append(("reset_type_codec", name))
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        self.calls.append(("copy", table, records, columns))
+
+
+def test_copy_features_copies_rows_and_stages_change_log_without_touching_layer() -> None:
+    copy_connection = CopyConnection()
+    session = CapturingSession()
+
+    async def connection():
+        return SimpleNamespace(
+            get_raw_connection=AsyncMock(
+                return_value=SimpleNamespace(driver_connection=copy_connection)
+            )
+        )
+
+    session.connection = connection
+    repository = LayerRepository(session)
+    features = [ImportedFeature(uuid4(), b"G%d" % n, b"E%d" % n, "{}") for n in range(3)]
+
+    asyncio.run(repository.copy_features(POINT_LAYER, features))
+
+    assert session.statements == []
+    codec, feature_copy, change_copy, reset = copy_connection.calls
+    assert codec == ("set_type_codec", "geometry", "binary")
+    assert feature_copy[1] == "feature_points"
+    assert feature_copy[2] == [(feature.id, feature.geometry, "{}") for feature in features]
+    assert change_copy[1] == "imported_feature_changes"
+    assert change_copy[2] == [(feature.id, feature.extent) for feature in features]
+    assert reset == ("reset_type_codec", "geometry")
+
+
+def test_create_import_staging_creates_temporary_table_dropped_on_commit() -> None:
+    session = CapturingSession()
+    repository = LayerRepository(session)
+
+    asyncio.run(repository.create_import_staging())
+
+    sql = compile_sql(session.statement)
+    assert sql.strip().startswith("CREATE TEMPORARY TABLE imported_feature_changes")
+    assert "GENERATED BY DEFAULT AS IDENTITY (START WITH 1)" in sql
+    assert sql.rstrip().endswith("ON COMMIT DROP")
+
+
+def test_record_imported_feature_changes_bumps_revision_and_logs_in_one_statement() -> None:
+    session = CapturingSession(_ExecuteResult(12))
+    repository = LayerRepository(session)
+
+    revision = asyncio.run(repository.record_imported_feature_changes(POINT_LAYER.id, 3))
+
+    assert revision == 12
+    assert len(session.statements) == 1
+    sql = compile_sql(session.statement)
+    assert "WITH bumped AS \n(UPDATE layers SET revision=(layers.revision + " in sql
+    assert (
+        "INSERT INTO feature_changes (layer_id, feature_id, revision, change_type, extent)" in sql
+    )
+    assert "(bumped.revision - %(revision_1)s) + imported_feature_changes.ordinal" in sql
+    assert "FROM imported_feature_changes JOIN bumped ON true" in sql
+
+
+def test_stream_layer_features_reads_whole_table_in_id_order_with_server_side_cursor() -> None:
+    partitions = [
+        [SimpleNamespace(id=1, feature_json="{}")],
+        [SimpleNamespace(id=2, feature_json="{}")],
+    ]
+    session = CapturingSession()
+
+    async def stream(statement):
+        session.statement = statement
+
+        async def partitions_iter():
+            for partition in partitions:
+                yield partition
+
+        return SimpleNamespace(partitions=partitions_iter)
+
+    session.stream = stream
+    repository = LayerRepository(session)
+
+    async def collect():
+        return [rows async for rows in repository.stream_layer_features(POINT_LAYER, 500)]
+
+    assert asyncio.run(collect()) == partitions
+    assert session.statement.get_execution_options()["yield_per"] == 500
+    sql = compile_sql(session.statement)
+    assert "FROM feature_points ORDER BY feature_points.id ASC" in sql
+    assert "WHERE" not in sql
+
+
+def test_get_layer_tile_builds_tile_with_st_asmvt_in_one_query() -> None:
+    session = CapturingSession(_ExecuteResult(b"\x1a\x02"))
+    repository = LayerRepository(session)
+
+    result = asyncio.run(repository.get_layer_tile(POINT_LAYER, TileCoordinates(13, 5700, 2600)))
+
+    assert result == b"\x1a\x02"
+    sql = compile_sql(session.statement)
+    assert "ST_AsMVT(tile_features" in sql
+    assert "ST_AsMVTGeom(ST_Transform(feature_points.geom" in sql
+    assert "ST_TileEnvelope(" in sql
+    assert "feature_points.geom && ST_Transform(ST_Expand(ST_TileEnvelope(" in sql
+    assert "CAST(feature_points.id AS VARCHAR) AS id" in sql
+    assert "LIMIT" not in sql
+
+
+def test_get_layer_tile_returns_empty_bytes_for_empty_tile() -> None:
+    repository = LayerRepository(CapturingSession())
+
+    result = asyncio.run(repository.get_layer_tile(POINT_LAYER, TileCoordinates(0, 0, 0)))
+
+    assert result == b""
+
+
+def test_list_features_bbox_selects_feature_json_built_by_postgis() -> None:
+    rows = [SimpleNamespace(id=uuid4(), feature_json="{}") for _ in range(3)]
+    session = CapturingSession(_ExecuteResult(rows=rows))
+    repository = LayerRepository(session)
+
+    result_rows, truncated, next_cursor = asyncio.run(
+        repository.list_features_bbox(POINT_LAYER, Bbox(10.0, 20.0, 30.0, 40.0), 2)
+    )
+
+    assert result_rows == rows[:2]
+    assert truncated is True
+    assert next_cursor == str(rows[1].id)
+    sql = compile_sql(session.statement)
+    assert "CAST(json_build_object(" in sql
+    assert "CAST(ST_AsGeoJSON(feature_points.geom) AS JSON)" in sql
+    assert "AS TEXT) AS feature_json" in sql
+    assert "feature_points.geom && ST_MakeEnvelope(" in sql
+    assert "ORDER BY feature_points.id ASC" in sql
+    assert "ST_SimplifyPreserveTopology" not in sql
+
+
+def test_list_features_bbox_pages_by_geohash_sort_key_in_spatial_order() -> None:
+    rows = [
+        SimpleNamespace(id=uuid4(), sort_key=f"ucfv0j7x2q9{i}", feature_json="{}") for i in range(3)
+    ]
+    session = CapturingSession(_ExecuteResult(rows=rows))
+    repository = LayerRepository(session)
+    after_id = uuid4()
+
+    _, truncated, next_cursor = asyncio.run(
+        repository.list_features_bbox(
+            POINT_LAYER,
+            Bbox(10.0, 20.0, 30.0, 40.0),
+            2,
+            after_id,
+            order=FeatureOrder("spatial", "ucfv0j7x2q8z"),
+        )
+    )
+
+    assert truncated is True
+    assert next_cursor == f"ucfv0j7x2q91:{rows[1].id}"
+    sql = compile_sql(session.statement)
+    assert "feature_points.sort_key AS sort_key" in sql
+    assert "(feature_points.sort_key, feature_points.id) > (" in sql
+    assert "ORDER BY feature_points.sort_key ASC, feature_points.id ASC" in sql
+
+
+def test_list_features_bbox_simplifies_geometry_and_limits_precision() -> None:
+    session = CapturingSession()
+    repository = LayerRepository(session)
+    rendering = GeometryRendering(tolerance=0.0001, precision=6)
+
+    asyncio.run(
+        repository.list_features_bbox(
+            POINT_LAYER, Bbox(10.0, 20.0, 30.0, 40.0), 10, None, rendering
+        )
+    )
+
+    compiled = session.statement.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "ST_AsGeoJSON(ST_SimplifyPreserveTopology(feature_points.geom, " in sql
+    assert 0.0001 in compiled.params.values()
+    assert 6 in compiled.params.values()
+
+
+def test_delete_feature_logs_change_in_the_same_statement() -> None:
+    feature_id = uuid4()
+    row = SimpleNamespace(current_version=3, id=feature_id)
+    session = CapturingSession(_ExecuteResult(row=row))
+    repository = LayerRepository(session)
+
+    result = asyncio.run(repository.delete_feature_if_version_matches(POINT_LAYER, feature_id, 3))
+
+    assert result is row
+    assert len(session.statements) == 1
+    compiled = session.statement.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "DELETE FROM feature_points USING previous" in sql
+    assert "::UUID FOR UPDATE), " in sql
+    assert "RETURNING feature_points.id AS id, ST_Envelope(feature_points.geom) AS extent" in sql
+    assert "UPDATE layers SET revision=(layers.revision + " in sql
+    assert "EXISTS (SELECT deleted.id" in sql
+    assert "INSERT INTO feature_changes" in sql
+    assert "FROM deleted, bumped" in sql
+    assert "SELECT previous.version AS current_version, deleted.id" in sql
+    assert "FROM previous LEFT OUTER JOIN deleted ON deleted.id = previous.id" in sql
+    assert "deleted" in compiled.params.values()
+
+
+def test_update_feature_returns_post_update_state_and_logs_change_in_one_statement() -> None:
+    session = CapturingSession()
+    repository = LayerRepository(session)
+
+    asyncio.run(
+        repository.update_feature_if_version_matches(POINT_LAYER, uuid4(), None, {"a": 1}, 2)
+    )
+
+    assert len(session.statements) == 1
+    sql = compile_sql(session.statement)
+    assert "WITH previous AS" in sql
+    assert "::UUID FOR UPDATE), " in sql
+    assert "SET properties=" in sql
+    assert "geom=" not in sql.split("FROM previous WHERE")[0]
+    assert "CAST(ST_AsGeoJSON(feature_points.geom) AS JSONB) AS geometry_data" in sql
+    assert "ST_Envelope(ST_Collect(previous.geom, feature_points.geom)) AS extent" in sql
+    assert "FROM updated, bumped" in sql
+    assert "FROM previous LEFT OUTER JOIN updated ON updated.id = previous.id" in sql
+
+
+def test_list_feature_changes_bbox_reads_latest_change_per_feature_from_log() -> None:
+    rows = [
+        SimpleNamespace(id=uuid4(), revision=revision, feature_json=None) for revision in (4, 6)
+    ]
+    session = CapturingSession(_ExecuteResult(rows=rows))
+    repository = LayerRepository(session)
+
+    result_rows, truncated = asyncio.run(
+        repository.list_feature_changes_bbox(POINT_LAYER, Bbox(10.0, 20.0, 30.0, 40.0), 3, 1)
+    )
+
+    assert result_rows == rows[:1]
+    assert truncated is True
+    sql = compile_sql(session.statement)
+    assert "max(feature_changes.revision) AS revision" in sql
+    assert "feature_changes.revision > " in sql
+    assert "feature_changes.extent && ST_MakeEnvelope(" in sql
+    assert "GROUP BY feature_changes.feature_id" in sql
+    assert "LEFT OUTER JOIN feature_points ON feature_points.id = changes.feature_id" in sql
+    assert "ORDER BY changes.revision ASC" in sql
+
+
+def test_list_features_filter_subdivides_buffered_line_and_pages_by_id() -> None:
+    session = CapturingSession(_ExecuteResult(rows=[]))
+    repository = LayerRepository(session)
+    corridor = parse_spatial_filter(
+        {"type": "LineString", "coordinates": [[30.0, 50.0], [32.0, 53.0]]}, 250.0
+    )
+
+    page = asyncio.run(repository.list_features_filter(POINT_LAYER, corridor, 10, uuid4()))
+
+    assert page == ([], False, None)
+    sql = compile_sql(session.statement)
+    assert "WITH filter_pieces AS" in sql
+    assert "ST_Subdivide(CAST(ST_Buffer(CAST(ST_GeomFromWKB(" in sql
+    assert "AS geography(GEOMETRY,4326)), %(ST_Buffer_1)s) AS geometry(GEOMETRY,4326))" in sql
+    assert "WHERE feature_points.id IN (SELECT matched.id" in sql
+    assert (
+        "FROM filter_pieces JOIN feature_points AS matched ON (matched.geom && filter_pieces.geom) "
+        "AND ST_Intersects(matched.geom, filter_pieces.geom))"
+    ) in sql
+    assert "feature_points.id > " in sql
+    assert "ORDER BY feature_points.id ASC" in sql
+
+
+def test_list_features_filter_uses_polygon_without_buffer() -> None:
+    session = CapturingSession(_ExecuteResult(rows=[]))
+    repository = LayerRepository(session)
+    district = parse_spatial_filter(
+        {"type": "Polygon", "coordinates": [[[30, 50], [31, 50], [31, 52], [30, 50]]]}, None
+    )
+
+    asyncio.run(repository.list_features_filter(POINT_LAYER, district, 10))
+
+    sql = compile_sql(session.statement)
+    assert "ST_Subdivide(ST_GeomFromWKB(" in sql
+    assert "ST_Buffer" not in sql
+
+
+def test_list_features_bbox_projects_fields_and_drops_geometry() -> None:
+    session = CapturingSession(_ExecuteResult(rows=[]))
+    repository = LayerRepository(session)
+    rendering = GeometryRendering(geometry=False, fields=("name", "dn"))
+
+    asyncio.run(
+        repository.list_features_bbox(POINT_LAYER, Bbox(10.0, 20.0, 30.0, 40.0), 2, None, rendering)
+    )
+
+    sql = compile_sql(session.statement)
+    select_list = sql.split("FROM feature_points")[0]
+    assert "ST_AsGeoJSON" not in select_list
+    assert ", NULL, " in select_list
+    assert (
+        "jsonb_build_object(%(jsonb_build_object_1)s, feature_points.properties -> "
+        "%(properties_1)s, %(jsonb_build_object_2)s, feature_points.properties -> "
+        "%(properties_2)s)"
+    ) in select_list
+
+
+def test_get_feature_json_selects_single_projected_feature() -> None:
+    session = CapturingSession(_ExecuteResult('{"id":"x"}'))
+    repository = LayerRepository(session)
+    feature_id = uuid4()
+
+    feature_json = asyncio.run(
+        repository.get_feature_json(POINT_LAYER, feature_id, GeometryRendering(fields=()))
+    )
+
+    assert feature_json == '{"id":"x"}'
+    sql = compile_sql(session.statement)
+    assert "jsonb_build_object()" in sql
+    assert "CAST(ST_AsGeoJSON(feature_points.geom) AS JSON)" in sql
+    assert "WHERE feature_points.id = " in sql
+
+
+def test_list_features_bbox_pushes_property_filters_down_to_sql() -> None:
+    session = CapturingSession(_ExecuteResult(rows=[]))
+    repository = LayerRepository(session)
+    property_filters = parse_property_filters(["status:in:active,planned", "diameter:gte:100"])
+
+    asyncio.run(
+        repository.list_features_bbox(
+            POINT_LAYER, Bbox(10.0, 20.0, 30.0, 40.0), 2, property_filters=property_filters
+        )
+    )
+
+    compiled = session.statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True}
+    )
+    sql = str(compiled)
+    assert "((feature_points.properties @> %(properties_1)s::JSONB) OR " in sql
+    assert "jsonb_typeof(feature_points.properties -> 'diameter') = " in sql
+    assert "(feature_points.properties -> 'diameter') >= %(param_2)s::JSONB" in sql
+    assert compiled.params["properties_1"] == {"status": "active"}
+    assert compiled.params["properties_2"] == {"status": "planned"}
+    assert compiled.params["param_2"] == 100
+
+
+def test_set_indexed_properties_only_stores_declared_keys() -> None:
+    session = CapturingSession()
+    repository = LayerRepository(session)
+    layer = SimpleNamespace(
+        id=uuid4(), storage_table="feature_points", indexed_properties=["status", "diameter"]
+    )
+
+    asyncio.run(repository.set_indexed_properties(layer, ["diameter", "pressure"]))
+
+    assert len(session.statements) == 1
+    assert compile_sql(session.statement).startswith("UPDATE layers SET indexed_properties=")
+
+
+def test_list_nearest_features_orders_candidates_by_knn_then_meters() -> None:
+    session = CapturingSession(_ExecuteResult(rows=["row"]))
+    repository = LayerRepository(session)
+
+    rows = asyncio.run(
+        repository.list_nearest_features(POINT_LAYER, NearestQuery(37.6, 55.7, 5, 1000.0))
+    )
+
+    assert rows == ["row"]
+    sql = compile_sql(session.statement)
+    assert "ORDER BY feature_points.geom <-> ST_SetSRID(ST_MakePoint(" in sql
+    assert "LIMIT %(param_1)s) AS candidates ORDER BY candidates.distance ASC" in sql
+    assert "feature_points.geom && ST_MakeEnvelope(" in sql
+    assert "ST_DWithin(CAST(feature_points.geom AS geography(GEOMETRY,4326))" in sql
+    params = session.statement.compile(dialect=postgresql.dialect()).params
+    assert params["param_1"] == 5
+    assert params["ST_DWithin_1"] == 1000.0
+
+
+def test_list_nearest_features_rereads_k_nearest_within_meters_of_kth_candidate() -> None:
+    rows = [SimpleNamespace(id=uuid4(), feature_json="{}", distance=d) for d in (40.0, 250.0)]
+    session = CapturingSession(_ExecuteResult(rows=rows))
+    repository = LayerRepository(session)
+
+    result = asyncio.run(repository.list_nearest_features(POINT_LAYER, NearestQuery(37.6, 65.7, 2)))
+
+    assert result == rows
+    knn, exact = session.statements
+    assert "<->" in compile_sql(knn)
+    sql = compile_sql(exact)
+    assert "<->" not in sql
+    assert "feature_points.geom && ST_MakeEnvelope(" in sql
+    assert "ST_DWithin(CAST(feature_points.geom AS geography(GEOMETRY,4326))" in sql
+    assert "ORDER BY distance ASC, feature_points.id ASC" in sql
+    params = exact.compile(dialect=postgresql.dialect()).params
+    assert params["ST_DWithin_1"] == 250.001
+    assert params["param_1"] == 2
+
+
+def test_list_nearest_features_without_max_distance_has_no_filter() -> None:
+    session = CapturingSession(_ExecuteResult(rows=[]))
+    repository = LayerRepository(session)
+
+    asyncio.run(repository.list_nearest_features(POINT_LAYER, NearestQuery(37.6, 55.7, 5)))
+
+    sql = compile_sql(session.statement)
+    assert "WHERE" not in sql
+    assert "<->" in sql
+
+
+def test_has_feature_changes_bbox_checks_revision_window_with_exists() -> None:
+    session = CapturingSession(_ExecuteResult(True))
+    repository = LayerRepository(session)
+
+    changed = asyncio.run(
+        repository.has_feature_changes_bbox(POINT_LAYER, Bbox(10.0, 20.0, 30.0, 40.0), 3, 7)
+    )
+
+    assert changed is True
+    sql = compile_sql(session.statement)
+    assert "SELECT (EXISTS (SELECT feature_changes.id" in sql
+    assert "feature_changes.revision > " in sql
+    assert "feature_changes.revision <= " in sql
+    assert "feature_changes.extent && ST_MakeEnvelope(" in sql
+    assert "layers.pruned_revision > " in sql
+
+
+def test_prune_feature_changes_deletes_old_rows_and_marks_pruned_revision() -> None:
+    session = CapturingSession(_ExecuteResult(17))
+    repository = LayerRepository(session)
+
+    pruned = asyncio.run(
+        repository.prune_feature_changes(datetime(2026, 1, 1, tzinfo=timezone.utc))
+    )
+
+    assert pruned == 17
+    sql = compile_sql(session.statement)
+    assert "WITH pruned AS" in sql
+    assert "DELETE FROM feature_changes WHERE feature_changes.changed_at < " in sql
+    assert "RETURNING feature_changes.layer_id, feature_changes.revision" in sql
+    assert "UPDATE layers SET pruned_revision=greatest(layers.pruned_revision" in sql
+    assert "GROUP BY pruned.layer_id" in sql
+    assert sql.rstrip().endswith("FROM pruned")
+
+
+def test_create_feature_binds_geometry_as_wkb() -> None:
+    session = CapturingSession(_ExecuteResult())
+    repository = LayerRepository(session)
+
+    asyncio.run(
+        repository.create_feature(POINT_LAYER, {"type": "Point", "coordinates": [3.0, 4.0]}, {})
+    )
+
+    sql = compile_sql(session.statement)
+    assert "ST_GeomFromWKB(%(param_1)s, " in sql
+    assert "ST_GeomFromGeoJSON" not in sql
+    wkb = session.statement.compile(dialect=postgresql.dialect()).params["param_1"]
+    assert shapely.from_wkb(wkb).coords[0] == (3.0, 4.0)
+
+
+def test_create_features_inserts_all_rows_in_one_statement_and_logs_each_revision() -> None:
+    session = CapturingSession(_ExecuteResult(12))
+    repository = LayerRepository(session)
+    features = [({"type": "Point", "coordinates": [1.0, 2.0]}, {"n": n}) for n in range(3)]
+
+    async def execute(statement):
+        session.statements.append(statement)
+        if len(session.statements) == 1:
+            ids = [batch_array(statement, UUID)[n] for n in (2, 0, 1)]
+            return _ExecuteResult(rows=[SimpleNamespace(id=i, version=1, extent="E") for i in ids])
+        return _ExecuteResult(12)
+
+    session.execute = execute
+
+    rows = asyncio.run(repository.create_features(POINT_LAYER, features))
+
+    insert_sql = compile_sql(session.statements[0])
+    assert [row.id for row in rows] == batch_array(session.statements[0], UUID)
+    assert "INSERT INTO feature_points" in insert_sql
+    assert (
+        "::UUID[], %(param_3)s::BYTEA[], %(param_4)s::TEXT[]) AS batch(id, geometry" in insert_sql
+    )
+    assert "ST_GeomFromWKB(batch.geometry, " in insert_sql
+    wkbs = batch_array(session.statements[0], bytes)
+    assert [shapely.from_wkb(wkb).coords[0] for wkb in wkbs] == [(1.0, 2.0)] * 3
+    assert "revision=(layers.revision + " in compile_sql(session.statements[1])
+    assert session.statements[1].compile(dialect=postgresql.dialect()).params["revision_1"] == 3
+    log_params = session.statements[2].compile(dialect=postgresql.dialect()).params
+    assert [log_params[f"revision_m{n}"] for n in range(3)] == [10, 11, 12]
+    assert len(session.statements) == 3
+
+
+def test_update_features_joins_batch_values_and_keeps_missing_fields() -> None:
+    session = CapturingSession()
+    repository = LayerRepository(session)
+
+    rows, _ = asyncio.run(
+        repository.update_features_if_versions_match(
+            POINT_LAYER,
+            [
+                (uuid4(), 2, {"type": "Point", "coordinates": [1.0, 2.0]}, None),
+                (uuid4(), 5, None, {"name": "Renamed"}),
+            ],
+        )
+    )
+
+    assert rows == []
+    assert len(session.statements) == 1
+    sql = compile_sql(session.statement)
+    assert "FROM (VALUES (" in sql
+    assert "AS batch (id, expected_version, geometry, properties)" in sql
+    assert "feature_points.version = batch.expected_version" in sql
+    assert "coalesce(ST_GeomFromWKB(CAST(batch.geometry AS BYTEA), " in sql
+    assert "properties=coalesce(CAST(batch.properties AS JSONB), feature_points.properties)" in sql
+
+
+def test_delete_features_uses_single_delete_with_batch_values() -> None:
+    deleted_id = uuid4()
+    session = CapturingSession(_ExecuteResult(4, rows=[SimpleNamespace(id=deleted_id, extent="E")]))
+    repository = LayerRepository(session)
+
+    rows, _ = asyncio.run(
+        repository.delete_features_if_versions_match(POINT_LAYER, [(deleted_id, 1), (uuid4(), 2)])
+    )
+
+    assert [row.id for row in rows] == [deleted_id]
+    sql = compile_sql(session.statements[0])
+    assert sql.startswith("DELETE FROM feature_points USING (VALUES (")
+    assert "feature_points.version = batch.expected_version" in sql
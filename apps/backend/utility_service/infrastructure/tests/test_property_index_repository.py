@@ -0,0 +1,79 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from utility_service.infrastructure.postgresql.models.feature_point import FeaturePoint
+from utility_service.infrastructure.postgresql.repositories.property_index_repository import (
+    PropertyIndexRepository,
+)
+
+
+class _ExecuteResult:
+    def __init__(self, rows=None) -> None:
+        self.rows = rows or []
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return self
+
+
+class CapturingConnection:
+    def __init__(self, result: _ExecuteResult | None = None) -> None:
+        self.statements = []
+        self.params = []
+        self.result = result or _ExecuteResult()
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        self.params.append(params)
+        return self.result
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect())).strip()
+
+
+def test_property_indexes_are_created_and_dropped_concurrently() -> None:
+    connection = CapturingConnection()
+    repository = PropertyIndexRepository(connection)
+
+    asyncio.run(repository.create_property_index(FeaturePoint, "diameter"))
+    asyncio.run(repository.drop_property_index(FeaturePoint, "status"))
+
+    assert [compile_sql(statement) for statement in connection.statements] == [
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_feature_points_prop_diameter "
+        "ON feature_points ((properties -> 'diameter'))",
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_feature_points_prop_status",
+    ]
+
+
+def test_indexed_property_keys_are_collected_from_every_layer_of_the_table() -> None:
+    connection = CapturingConnection(_ExecuteResult(["status", "diameter"]))
+    repository = PropertyIndexRepository(connection)
+
+    keys = asyncio.run(repository.get_indexed_property_keys(FeaturePoint))
+
+    assert keys == {"status", "diameter"}
+    sql = compile_sql(connection.statements[0])
+    assert sql.startswith("SELECT DISTINCT unnest(layers.indexed_properties)")
+    assert "WHERE layers.storage_table = " in sql
+
+
+def test_property_indexes_are_read_with_their_validity() -> None:
+    rows = [
+        SimpleNamespace(name="ix_feature_points_prop_status", valid=True),
+        SimpleNamespace(name="ix_feature_points_prop_diameter", valid=False),
+    ]
+    connection = CapturingConnection(_ExecuteResult(rows))
+    repository = PropertyIndexRepository(connection)
+
+    indexes = asyncio.run(repository.get_property_indexes(FeaturePoint))
+
+    assert indexes == {"status": True, "diameter": False}
+    assert connection.params[0] == {
+        "table_name": "feature_points",
+        "prefix": "ix_feature_points_prop_",
+    }
@@ -0,0 +1,45 @@
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from utility_service.infrastructure.postgresql.repositories.realtime_event_repository import (
+    RealtimeEventRepository,
+)
+
+
+class _ExecuteResult:
+    def scalar_one(self):
+        return 1
+
+
+class CapturingSession:
+    def __init__(self) -> None:
+        self.statement = None
+
+    async def execute(self, statement):
+        self.statement = statement
+        return _ExecuteResult()
+
+
+def test_add_event_frame_returns_generated_id() -> None:
+    session = CapturingSession()
+    repository = RealtimeEventRepository(session)
+
+    event_id = asyncio.run(repository.add_event_frame(uuid4(), '{"type":"features_batch"}'))
+
+    assert event_id == 1
+    sql = str(session.statement.compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO realtime_events (layer_id, frame)" in sql
+    assert "RETURNING realtime_events.id" in sql
+
+
+def test_notify_sends_payload_with_pg_notify() -> None:
+    session = CapturingSession()
+    repository = RealtimeEventRepository(session)
+
+    asyncio.run(repository.notify("realtime_events", "payload"))
+
+    compiled = session.statement.compile(dialect=postgresql.dialect())
+    assert str(compiled).startswith("SELECT pg_notify(")
+    assert sorted(compiled.params.values()) == ["payload", "realtime_events"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import Depends, Request, WebSocket
+from fastapi.requests import HTTPConnection
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from utility_service.infrastructure.postgresql.repositories.auth_session_repository import (
@@ -20,20 +21,36 @@ from utility_service.infrastructure.postgresql.repositories.websocket_ticket_rep
 from utility_service.infrastructure.postgresql.repositories.work_order_repository import (
     WorkOrderRepository,
 )
-from utility_service.infrastructure.postgresql.session import engine, get_session
+from utility_service.infrastructure.postgresql.session import (
+    SessionFactory,
+    create_unpooled_engine,
+    engine,
+    get_session,
+)
 from utility_service.use_cases.services.auth_session_service import AuthSessionService
 from utility_service.use_cases.services.auth_service import AuthService
 from utility_service.use_cases.services.edit_version_service import EditVersionService
+from utility_service.use_cases.services.feature_export_service import FeatureExportService
+from utility_service.use_cases.services.feature_import_service import FeatureImportService
+from utility_service.use_cases.services.feature_event_coalescer import FeatureEventCoalescer
 from utility_service.use_cases.services.feature_realtime_publisher import FeatureRealtimePublisher
+from utility_service.use_cases.services.feature_response_cache import FeatureResponseCache
 from utility_service.use_cases.services.feature_service import FeatureService
+from utility_service.use_cases.services.layer_registry import LayerRegistry
 from utility_service.use_cases.services.layer_service import LayerService
 from utility_service.use_cases.services.realtime_connection_manager import (
     WebSocketConnectionManager,
 )
+from utility_service.use_cases.services.realtime_event_bus import (
+    LocalRealtimeEventBus,
+    PostgresRealtimeEventBus,
+    RealtimeEventBus,
+)
 from utility_service.use_cases.services.utility_network_service import UtilityNetworkService
 from utility_service.use_cases.services.websocket_ticket_service import WebSocketTicketService
 from utility_service.use_cases.services.work_order_service import WorkOrderService
 from utility_service.use_cases.services.workspace_service import WorkspaceService
+from utility_service.utils.settings import settings
 
 
 def get_auth_service(session: AsyncSession = Depends(get_session)) -> AuthService:
@@ -51,29 +68,59 @@ def get_auth_session_service(
 
 
 def get_feature_realtime_publisher(request: Request) -> FeatureRealtimePublisher:
-    connection_manager = request.app.state.websocket_connection_manager
-    return FeatureRealtimePublisher(connection_manager)
+    return FeatureRealtimePublisher(
+        request.app.state.realtime_event_bus, request.app.state.feature_event_coalescer
+    )
+
+
+def get_layer_registry(connection: HTTPConnection) -> LayerRegistry | None:
+    return getattr(connection.app.state, "layer_registry", None)
+
+
+def get_feature_import_service(
+    session: AsyncSession = Depends(get_session),
+) -> FeatureImportService:
+    return FeatureImportService(
+        session, LayerRepository(session), settings.feature_import_chunk_size
+    )
+
+
+def get_feature_export_service() -> FeatureExportService:
+    return FeatureExportService(SessionFactory)
+
+
+def get_feature_response_cache(connection: HTTPConnection) -> FeatureResponseCache | None:
+    return getattr(connection.app.state, "feature_response_cache", None)
 
 
 def get_feature_service(
     session: AsyncSession = Depends(get_session),
     realtime_publisher: FeatureRealtimePublisher = Depends(get_feature_realtime_publisher),
+    layer_registry: LayerRegistry | None = Depends(get_layer_registry),
+    response_cache: FeatureResponseCache | None = Depends(get_feature_response_cache),
 ) -> FeatureService:
-    return FeatureService(session, LayerRepository(session), realtime_publisher)
+    return FeatureService(
+        session, LayerRepository(session), realtime_publisher, layer_registry, response_cache
+    )
 
 
-def get_layer_service(session: AsyncSession = Depends(get_session)) -> LayerService:
-    return LayerService(session, LayerRepository(session))
+def get_layer_service(
+    session: AsyncSession = Depends(get_session),
+    layer_registry: LayerRegistry | None = Depends(get_layer_registry),
+) -> LayerService:
+    return LayerService(session, LayerRepository(session), layer_registry)
 
 
 def get_websocket_ticket_service(
     session: AsyncSession = Depends(get_session),
+    layer_registry: LayerRegistry | None = Depends(get_layer_registry),
 ) -> WebSocketTicketService:
     return WebSocketTicketService(
         session,
         WebSocketTicketRepository(session),
         LayerRepository(session),
         UserRepository(session),
+        layer_registry=layer_registry,
     )
 
 
@@ -121,5 +168,40 @@ def get_websocket_connection_manager(websocket: WebSocket) -> WebSocketConnectio
     return websocket.app.state.websocket_connection_manager
 
 
+def create_layer_registry() -> LayerRegistry:
+    return LayerRegistry(settings.layer_registry_ttl_seconds, settings.layer_registry_max_size)
+
+
+def create_feature_response_cache() -> FeatureResponseCache | None:
+    if settings.feature_response_cache_max_bytes <= 0:
+        return None
+    return FeatureResponseCache(settings.feature_response_cache_max_bytes)
+
+
+def create_websocket_connection_manager() -> WebSocketConnectionManager:
+    return WebSocketConnectionManager(settings.websocket_send_queue_size)
+
+
+def create_realtime_event_bus(
+    connection_manager: WebSocketConnectionManager,
+) -> RealtimeEventBus:
+    if settings.realtime_event_bus == "postgres":
+        return PostgresRealtimeEventBus(create_unpooled_engine(), connection_manager)
+    return LocalRealtimeEventBus(connection_manager)
+
+
+def create_feature_event_coalescer(event_bus: RealtimeEventBus) -> FeatureEventCoalescer | None:
+    if settings.realtime_coalesce_window_ms <= 0:
+        return None
+    return FeatureEventCoalescer(
+        FeatureRealtimePublisher(event_bus), settings.realtime_coalesce_window_ms / 1000
+    )
+
+
+async def preload_layer_registry(layer_registry: LayerRegistry) -> None:
+    async with SessionFactory() as session:
+        layer_registry.replace_all(await LayerRepository(session).get_layers())
+
+
 async def close_runtime_resources() -> None:
     await engine.dispose()
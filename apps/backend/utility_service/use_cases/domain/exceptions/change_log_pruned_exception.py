@@ -0,0 +1,9 @@
+from uuid import UUID
+
+
+class ChangeLogPrunedException(Exception):
+    def __init__(self, layer_id: UUID, pruned_revision: int, message: str):
+        super().__init__(message)
+        self.layer_id = layer_id
+        self.pruned_revision = pruned_revision
+        self.message = message
@@ -0,0 +1,63 @@
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from utility_service.use_cases.schemas.geojson.geojson import FeatureGeometry, FeatureProperties
+
+MAX_BATCH_OPERATIONS = 2000
+
+
+class BatchCreateOperation(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    op: Literal["create"]
+    geometry: FeatureGeometry
+    properties: FeatureProperties = Field(default_factory=dict)
+
+
+class BatchUpdateOperation(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    op: Literal["update"]
+    id: UUID
+    version: int
+    geometry: FeatureGeometry | None = None
+    properties: FeatureProperties | None = None
+
+    @model_validator(mode="after")
+    def ensure_has_changes(self):
+        if self.geometry is None and self.properties is None:
+            raise ValueError("Должны быть предоставлены или геометрия или properties")
+        return self
+
+    @field_validator("version")
+    @classmethod
+    def validate_version(cls, version: int) -> int:
+        if version < 1:
+            raise ValueError("Версия должна быть >= 1")
+        return version
+
+
+class BatchDeleteOperation(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    op: Literal["delete"]
+    id: UUID
+    version: int
+
+    @field_validator("version")
+    @classmethod
+    def validate_version(cls, version: int) -> int:
+        if version < 1:
+            raise ValueError("Версия должна быть >= 1")
+        return version
+
+
+BatchFeatureOperation = Annotated[
+    BatchCreateOperation | BatchUpdateOperation | BatchDeleteOperation,
+    Field(discriminator="op"),
+]
+
+
+class BatchFeaturesRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    atomic: bool = False
+    operations: list[BatchFeatureOperation] = Field(min_length=1, max_length=MAX_BATCH_OPERATIONS)
@@ -0,0 +1,24 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from .feature_out import FeatureOut
+from .patch_feature_conflict_response import PatchFeatureConflictResponse
+
+
+class BatchFeatureResult(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    index: int
+    op: Literal["create", "update", "delete"]
+    status: Literal["applied", "conflict", "not_found"]
+    featureId: UUID | None = None
+    feature: FeatureOut | None = None
+    conflict: PatchFeatureConflictResponse | None = None
+
+
+class BatchFeaturesResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    applied: int
+    failed: int
+    results: list[BatchFeatureResult]
@@ -0,0 +1,28 @@
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+
+class FeatureAggregateCellOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    x: int
+    y: int
+    count: int
+    extent: tuple[float, float, float, float]
+    point: tuple[float, float]
+
+
+class FeatureAggregateMetaOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    bbox: tuple[float, float, float, float]
+    zoom: int
+    cell_size: float
+    cells: int
+    features: int
+
+
+class FeatureAggregateOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    type: Literal["FeatureAggregate"] = "FeatureAggregate"
+    cells: list[FeatureAggregateCellOut]
+    meta: FeatureAggregateMetaOut
@@ -0,0 +1,24 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from .feature_out import FeatureOut
+
+
+class FeatureChangesMetaOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    bbox: tuple[float, float, float, float]
+    limit: int
+    returned: int
+    truncated: bool
+    since_revision: int
+    revision: int
+
+
+class FeatureChangesOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    type: Literal["FeatureCollection"] = "FeatureCollection"
+    features: list[FeatureOut]
+    deleted: list[UUID]
+    meta: FeatureChangesMetaOut
@@ -16,8 +16,13 @@ class FeatureCollectionMetaOut(BaseModel):
     limit: int
     returned: int
     truncated: bool
-    sort: Literal["id:asc"] = "id:asc"
+    sort: Literal["id:asc", "spatial:asc"] = "id:asc"
     next_cursor: str | None = None
+    simplified: bool = False
+    tolerance: float | None = None
+    precision: int | None = None
+    geometry: bool = True
+    fields: list[str] | None = None
 
 
 class FeatureCollectionOut(BaseModel):
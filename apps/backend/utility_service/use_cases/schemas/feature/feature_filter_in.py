@@ -0,0 +1,9 @@
+from pydantic import BaseModel, ConfigDict
+
+from utility_service.use_cases.schemas.geojson.geojson import FeatureGeometry
+
+
+class FeatureFilterIn(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    geometry: FeatureGeometry
+    buffer: float | None = None
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class FeatureImportOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    imported: int
+    revision: int
@@ -0,0 +1,22 @@
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+from .feature_out import FeatureOut
+
+
+class FeatureNearestMetaOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    point: tuple[float, float]
+    k: int
+    returned: int
+    max_distance: float | None = None
+    sort: Literal["distance:asc"] = "distance:asc"
+    distances: list[float]
+
+
+class FeatureNearestOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    type: Literal["FeatureCollection"] = "FeatureCollection"
+    features: list[FeatureOut]
+    meta: FeatureNearestMetaOut
@@ -0,0 +1,12 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from .feature_collection_out import FeatureCollectionOut
+
+
+class LayerFeatureCollectionsOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    type: Literal["LayerFeatureCollections"] = "LayerFeatureCollections"
+    layers: dict[UUID, FeatureCollectionOut]
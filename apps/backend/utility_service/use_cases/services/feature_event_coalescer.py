@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from utility_service.domain_services.bbox import Bbox, union_bbox
+from utility_service.use_cases.schemas.feature.feature_out import FeatureOut
+
+if TYPE_CHECKING:
+    from utility_service.use_cases.services.feature_realtime_publisher import (
+        FeatureRealtimePublisher,
+    )
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingFeatureEvents:
+    created: dict[UUID, FeatureOut] = field(default_factory=dict)
+    updated: dict[UUID, FeatureOut] = field(default_factory=dict)
+    deleted: dict[UUID, None] = field(default_factory=dict)
+    extents: list[Bbox | None] = field(default_factory=list)
+
+    def add(
+        self,
+        created: list[FeatureOut],
+        updated: list[FeatureOut],
+        deleted: list[UUID],
+        extent: Bbox | None,
+    ) -> None:
+        for feature in created:
+            self.created[feature.id] = feature
+        for feature in updated:
+            # A feature created in the same window is still sent as created, with its
+            # latest state; otherwise only the latest update survives.
+            if feature.id in self.created:
+                self.created[feature.id] = feature
+            else:
+                self.updated[feature.id] = feature
+        for feature_id in deleted:
+            self.updated.pop(feature_id, None)
+            if self.created.pop(feature_id, None) is None:
+                self.deleted[feature_id] = None
+        self.extents.append(extent)
+
+    @property
+    def extent(self) -> Bbox | None:
+        if any(extent is None for extent in self.extents):
+            return None
+        return union_bbox(self.extents)
+
+
+class FeatureEventCoalescer:
+    # Feature events of a layer are held for a short window and sent as a single
+    # features_batch, so a burst of edits (bulk operations, vertex drags) reaches clients
+    # as one frame with only the latest state of every feature.
+    def __init__(self, publisher: FeatureRealtimePublisher, window_seconds: float):
+        self.publisher = publisher
+        self.window_seconds = window_seconds
+        self._pending: dict[UUID, PendingFeatureEvents] = {}
+        self._flushes: dict[UUID, asyncio.Task] = {}
+
+    def add(
+        self,
+        layer_id: UUID,
+        created: Sequence[FeatureOut] = (),
+        updated: Sequence[FeatureOut] = (),
+        deleted: Sequence[UUID] = (),
+        extent: Bbox | None = None,
+    ) -> None:
+        pending = self._pending.get(layer_id)
+        if pending is None:
+            pending = self._pending[layer_id] = PendingFeatureEvents()
+            self._flushes[layer_id] = asyncio.create_task(self._flush_later(layer_id))
+        pending.add(list(created), list(updated), list(deleted), extent)
+
+    async def flush(self, layer_id: UUID) -> None:
+        pending = self._pending.pop(layer_id, None)
+        self._flushes.pop(layer_id, None)
+        if pending is None or not (pending.created or pending.updated or pending.deleted):
+            return
+        await self.publisher.publish_features_batch(
+            layer_id,
+            list(pending.created.values()),
+            list(pending.updated.values()),
+            list(pending.deleted),
+            pending.extent,
+        )
+
+    async def close(self) -> None:
+        for layer_id in list(self._pending):
+            task = self._flushes.get(layer_id)
+            if task is not None:
+                task.cancel()
+            await self.flush(layer_id)
+
+    async def _flush_later(self, layer_id: UUID) -> None:
+        await asyncio.sleep(self.window_seconds)
+        try:
+            await self.flush(layer_id)
+        except Exception:
+            _logger.warning(
+                "Не удалось отправить накопленные события слоя %s", layer_id, exc_info=True
+            )
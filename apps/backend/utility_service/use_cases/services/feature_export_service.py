@@ -0,0 +1,56 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from utility_service.infrastructure.postgresql.models.layer import Layer
+from utility_service.infrastructure.postgresql.repositories.layer_repository import LayerRepository
+from utility_service.use_cases.domain.exceptions.layer_not_found_exception import (
+    LayerNotFoundException,
+)
+
+FeatureExportFormat = Literal["ndjson"]
+EXPORT_FETCH_ROWS = 1000
+
+
+@dataclass(frozen=True)
+class FeatureExport:
+    layer_name: str
+    revision: int
+    content: AsyncIterator[bytes]
+    close: Callable[[], Awaitable[None]]
+
+
+class FeatureExportService:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        fetch_rows: int = EXPORT_FETCH_ROWS,
+    ):
+        self.session_factory = session_factory
+        self.fetch_rows = fetch_rows
+
+    async def export_features(self, layer_id: UUID) -> FeatureExport:
+        # The body is sent after the request scope has ended, so the export reads through
+        # its own session, which the caller closes once the response is done. The revision
+        # and the rows come from one REPEATABLE READ snapshot: a client resuming delta sync
+        # from that revision neither misses nor replays a write made during the export.
+        session = self.session_factory()
+        try:
+            await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            layer = await LayerRepository(session).get_layer_by_id(layer_id)
+            if layer is None:
+                raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        except BaseException:
+            await session.close()
+            raise
+        return FeatureExport(
+            layer.name, layer.revision, self.stream_ndjson(session, layer), session.close
+        )
+
+    async def stream_ndjson(self, session: AsyncSession, layer: Layer) -> AsyncIterator[bytes]:
+        repository = LayerRepository(session)
+        async for rows in repository.stream_layer_features(layer, self.fetch_rows):
+            yield "".join(f"{row.feature_json}\n" for row in rows).encode()
@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from utility_service.domain_services.feature_import import to_imported_features
+from utility_service.infrastructure.postgresql.repositories.layer_repository import LayerRepository
+from utility_service.use_cases.domain.exceptions.layer_not_found_exception import (
+    LayerNotFoundException,
+)
+from utility_service.use_cases.schemas.feature.feature_import_out import FeatureImportOut
+from utility_service.use_cases.services.geojson_feature_stream import iter_feature_chunks
+
+
+class FeatureImportService:
+    def __init__(self, session: AsyncSession, layer_repository: LayerRepository, chunk_size: int):
+        self.session = session
+        self.layer_repository = layer_repository
+        self.chunk_size = chunk_size
+
+    async def import_features(
+        self, layer_id: UUID, features: AsyncIterable[object]
+    ) -> FeatureImportOut:
+        async with self.session.begin():
+            layer = await self.layer_repository.get_layer_by_id(layer_id)
+            if layer is None:
+                raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+            imported = 0
+            revision = layer.revision
+            # Only one chunk is held in memory at a time; the whole import still runs in
+            # one transaction, so a rejected feature leaves the layer untouched. The layer
+            # row is locked only by the final revision bump, not while rows are copied.
+            async for chunk in iter_feature_chunks(features, self.chunk_size):
+                records = to_imported_features(chunk, layer.geometry_type, imported + 1)
+                if not imported:
+                    await self.layer_repository.create_import_staging()
+                await self.layer_repository.copy_features(layer, records)
+                imported += len(records)
+            if imported:
+                revision = await self.layer_repository.record_imported_feature_changes(
+                    layer.id, imported
+                )
+        return FeatureImportOut(imported=imported, revision=revision)
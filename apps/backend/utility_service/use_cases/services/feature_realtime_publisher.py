@@ -3,18 +3,24 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
+from utility_service.domain_services.bbox import Bbox
 from utility_service.use_cases.schemas.feature.feature_out import FeatureOut
-from utility_service.use_cases.services.realtime_connection_manager import (
-    WebSocketConnectionManager,
-)
+from utility_service.use_cases.services.feature_event_coalescer import FeatureEventCoalescer
+from utility_service.use_cases.services.realtime_event_bus import RealtimeEventBus
 
 
 class FeatureRealtimePublisher:
-    def __init__(self, connection_manager: WebSocketConnectionManager):
-        self.connection_manager = connection_manager
+    def __init__(self, event_bus: RealtimeEventBus, coalescer: FeatureEventCoalescer | None = None):
+        self.event_bus = event_bus
+        self.coalescer = coalescer
 
-    async def publish_feature_created(self, layer_id: UUID, feature: FeatureOut) -> None:
-        await self.connection_manager.broadcast_to_layer(
+    async def publish_feature_created(
+        self, layer_id: UUID, feature: FeatureOut, extent: Bbox | None = None
+    ) -> None:
+        if self.coalescer is not None:
+            self.coalescer.add(layer_id, created=[feature], extent=extent)
+            return
+        await self.event_bus.broadcast_to_layer(
             layer_id,
             {
                 "type": "feature_created",
@@ -23,10 +29,16 @@ class FeatureRealtimePublisher:
                 "layerId": str(layer_id),
                 "feature": feature.model_dump(mode="json"),
             },
+            extent,
         )
 
-    async def publish_feature_updated(self, layer_id: UUID, feature: FeatureOut) -> None:
-        await self.connection_manager.broadcast_to_layer(
+    async def publish_feature_updated(
+        self, layer_id: UUID, feature: FeatureOut, extent: Bbox | None = None
+    ) -> None:
+        if self.coalescer is not None:
+            self.coalescer.add(layer_id, updated=[feature], extent=extent)
+            return
+        await self.event_bus.broadcast_to_layer(
             layer_id,
             {
                 "type": "feature_updated",
@@ -35,10 +47,16 @@ class FeatureRealtimePublisher:
                 "layerId": str(layer_id),
                 "feature": feature.model_dump(mode="json"),
             },
+            extent,
         )
 
-    async def publish_feature_deleted(self, layer_id: UUID, feature_id: UUID) -> None:
-        await self.connection_manager.broadcast_to_layer(
+    async def publish_feature_deleted(
+        self, layer_id: UUID, feature_id: UUID, extent: Bbox | None = None
+    ) -> None:
+        if self.coalescer is not None:
+            self.coalescer.add(layer_id, deleted=[feature_id], extent=extent)
+            return
+        await self.event_bus.broadcast_to_layer(
             layer_id,
             {
                 "type": "feature_deleted",
@@ -47,6 +65,32 @@ class FeatureRealtimePublisher:
                 "layerId": str(layer_id),
                 "featureId": str(feature_id),
             },
+            extent,
+        )
+
+    async def publish_features_batch(
+        self,
+        layer_id: UUID,
+        created: list[FeatureOut],
+        updated: list[FeatureOut],
+        deleted: list[UUID],
+        extent: Bbox | None = None,
+    ) -> None:
+        if self.coalescer is not None:
+            self.coalescer.add(layer_id, created, updated, deleted, extent)
+            return
+        await self.event_bus.broadcast_to_layer(
+            layer_id,
+            {
+                "type": "features_batch",
+                "eventId": self._generate_event_id(),
+                "occurredAt": self._generate_occurred_at(),
+                "layerId": str(layer_id),
+                "created": [feature.model_dump(mode="json") for feature in created],
+                "updated": [feature.model_dump(mode="json") for feature in updated],
+                "deleted": [str(feature_id) for feature_id in deleted],
+            },
+            extent,
         )
 
     def _generate_event_id(self) -> str:
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from utility_service.domain_services.feature_grid import GridCell
+from utility_service.domain_services.feature_order import ID_ORDER, FeatureOrder
+from utility_service.domain_services.geometry_rendering import GeometryRendering
+from utility_service.domain_services.property_filter import PropertyFilter
+
+
+@dataclass(frozen=True)
+class FeatureResponseKey:
+    layer_id: UUID
+    cell: GridCell
+    limit: int
+    after_id: UUID | None
+    rendering: GeometryRendering
+    property_filters: tuple[PropertyFilter, ...] = ()
+    order: FeatureOrder = ID_ORDER
+
+
+@dataclass(frozen=True)
+class CachedFeatureResponse:
+    revision: int
+    content: bytes
+
+
+class FeatureResponseCache:
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: OrderedDict[FeatureResponseKey, CachedFeatureResponse] = OrderedDict()
+
+    def get(self, key: FeatureResponseKey) -> CachedFeatureResponse | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: FeatureResponseKey, revision: int, content: bytes) -> None:
+        self.discard(key)
+        if len(content) > self.max_bytes:
+            return
+        self._entries[key] = CachedFeatureResponse(revision, content)
+        self.size_bytes += len(content)
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted.content)
+
+    def discard(self, key: FeatureResponseKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= len(entry.content)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,11 +1,28 @@
+import json
+from datetime import datetime
 from uuid import UUID
 
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from utility_service.domain_services.bbox import Bbox, union_bbox
+from utility_service.domain_services.feature_aggregation import AggregationGrid
+from utility_service.domain_services.feature_grid import match_grid_cell
+from utility_service.domain_services.feature_order import ID_ORDER, FeatureOrder
+from utility_service.domain_services.feature_registry import LayerMetadata
+from utility_service.domain_services.geometry_rendering import FULL_GEOMETRY, GeometryRendering
+from utility_service.domain_services.geometry_wkb import wkb_to_bbox
+from utility_service.domain_services.layer_selection import format_layer_cursor
+from utility_service.domain_services.nearest_query import NearestQuery
+from utility_service.domain_services.property_filter import PropertyFilter
+from utility_service.domain_services.spatial_filter import SpatialFilter
+from utility_service.domain_services.tile import TileCoordinates
 from utility_service.use_cases.domain.exceptions.business_validation_exception import (
     BusinessValidationException,
 )
+from utility_service.use_cases.domain.exceptions.change_log_pruned_exception import (
+    ChangeLogPrunedException,
+)
 from utility_service.use_cases.domain.exceptions.feature_not_found_exception import (
     FeatureNotFoundException,
 )
@@ -17,20 +34,44 @@ from utility_service.use_cases.domain.exceptions.version_mismatch_exception impo
 )
 from utility_service.infrastructure.postgresql.models.layer import Layer
 from utility_service.infrastructure.postgresql.repositories.layer_repository import LayerRepository
+from utility_service.use_cases.schemas.feature.batch_features_request import (
+    BatchCreateOperation,
+    BatchDeleteOperation,
+    BatchFeaturesRequest,
+    BatchUpdateOperation,
+)
+from utility_service.use_cases.schemas.feature.batch_features_response import (
+    BatchFeatureResult,
+    BatchFeaturesResponse,
+)
 from utility_service.use_cases.schemas.feature.create_feature_in import CreateFeatureIn
 from utility_service.use_cases.schemas.feature.delete_feature_request import DeleteFeatureRequest
 from utility_service.use_cases.schemas.feature.delete_feature_response import DeleteFeatureResponse
+from utility_service.use_cases.schemas.feature.feature_aggregate_out import (
+    FeatureAggregateCellOut,
+    FeatureAggregateMetaOut,
+    FeatureAggregateOut,
+)
+from utility_service.use_cases.schemas.feature.feature_changes_out import FeatureChangesMetaOut
 from utility_service.use_cases.schemas.feature.feature_collection_out import (
     FeatureCollectionMetaOut,
-    FeatureCollectionOut,
 )
+from utility_service.use_cases.schemas.feature.feature_nearest_out import FeatureNearestMetaOut
 from utility_service.use_cases.schemas.feature.feature_out import FeatureOut
+from utility_service.use_cases.schemas.feature.patch_feature_conflict_response import (
+    PatchFeatureConflictResponse,
+)
 from utility_service.use_cases.schemas.geojson.geojson import (
     FeatureProperties,
     dump_feature_geometry,
 )
 from utility_service.use_cases.schemas.feature.patch_feature_request import PatchFeatureRequest
 from utility_service.use_cases.services.feature_realtime_publisher import FeatureRealtimePublisher
+from utility_service.use_cases.services.feature_response_cache import (
+    FeatureResponseCache,
+    FeatureResponseKey,
+)
+from utility_service.use_cases.services.layer_registry import LayerRegistry
 
 
 class FeatureService:
@@ -39,10 +80,21 @@ class FeatureService:
         session: AsyncSession,
         layer_repository: LayerRepository,
         realtime_publisher: FeatureRealtimePublisher | None = None,
+        layer_registry: LayerRegistry | None = None,
+        response_cache: FeatureResponseCache | None = None,
     ):
         self.session = session
         self.layer_repository = layer_repository
         self.realtime_publisher = realtime_publisher
+        self.layer_registry = layer_registry
+        self.response_cache = response_cache
+
+    async def get_layer(self, layer_id: UUID) -> Layer | LayerMetadata | None:
+        if self.layer_registry is None:
+            return await self.layer_repository.get_layer_by_id(layer_id)
+        return await self.layer_registry.get_or_load(
+            layer_id, self.layer_repository.get_layer_by_id
+        )
 
     def to_feature_out(
         self,
@@ -67,34 +119,36 @@ class FeatureService:
                 f"У Feature с идентификатором {feature_id} невалидная геометрия: {e}"
             ) from e
 
-    def to_feature_collection_out(
+    def to_feature_collection_json(
         self,
         rows,
         bbox,
         limit_value: int,
         truncated: bool,
         next_cursor: str | None,
-    ) -> FeatureCollectionOut:
-        features = []
-        for row in rows:
-            features.append(
-                self.to_feature_out(
-                    feature_id=row.id,
-                    version=row.version,
-                    properties=row.properties,
-                    geometry_data=row.geometry_data,
-                )
-            )
-        return FeatureCollectionOut(
-            features=features,
-            meta=FeatureCollectionMetaOut(
-                bbox=(bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat),
-                limit=limit_value,
-                returned=len(features),
-                truncated=truncated,
-                next_cursor=next_cursor,
-            ),
+        rendering: GeometryRendering = FULL_GEOMETRY,
+        order: FeatureOrder = ID_ORDER,
+    ) -> bytes:
+        meta = FeatureCollectionMetaOut(
+            bbox=(bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat),
+            limit=limit_value,
+            returned=len(rows),
+            truncated=truncated,
+            next_cursor=next_cursor,
+            sort="spatial:asc" if order.spatial else "id:asc",
+            simplified=rendering.simplified,
+            tolerance=rendering.tolerance,
+            precision=rendering.precision,
+            geometry=rendering.geometry,
+            fields=rendering.fields,
         )
+        # Features are assembled by PostGIS from already stored geometry, so they are
+        # spliced in as-is instead of being revalidated through FeatureOut.
+        features_json = ",".join(row.feature_json for row in rows)
+        return (
+            f'{{"type":"FeatureCollection","features":[{features_json}],'
+            f'"meta":{meta.model_dump_json()}}}'
+        ).encode()
 
     async def get_features_from_bbox(
         self,
@@ -102,20 +156,242 @@ class FeatureService:
         bbox,
         limit_value: int | None,
         after_id: UUID | None = None,
-    ) -> FeatureCollectionOut:
+        rendering: GeometryRendering = FULL_GEOMETRY,
+        revision: int | None = None,
+        property_filters: tuple[PropertyFilter, ...] = (),
+        order: FeatureOrder = ID_ORDER,
+    ) -> bytes:
         limit_value = self.normalize_limit(limit_value)
-        layer = await self.layer_repository.get_layer_by_id(layer_id)
+        layer = await self.get_layer(layer_id)
         if layer is None:
             raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        cell = match_grid_cell(bbox) if self.response_cache is not None else None
+        if cell is None:
+            return await self.read_features_from_bbox(
+                layer, bbox, limit_value, after_id, rendering, property_filters, order
+            )
+
+        if revision is None:
+            revision = await self.get_layer_revision(layer_id)
+        key = FeatureResponseKey(
+            layer_id, cell, limit_value, after_id, rendering, property_filters, order
+        )
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            if cached.revision == revision:
+                return cached.content
+            # A newer layer revision only invalidates the tile when one of the changes
+            # since the cached revision touched its bbox.
+            if cached.revision < revision and not (
+                await self.layer_repository.has_feature_changes_bbox(
+                    layer, bbox, cached.revision, revision
+                )
+            ):
+                self.response_cache.put(key, revision, cached.content)
+                return cached.content
+
+        content = await self.read_features_from_bbox(
+            layer, bbox, limit_value, after_id, rendering, property_filters, order
+        )
+        self.response_cache.put(key, revision, content)
+        return content
+
+    async def get_layers_features_from_bbox(
+        self,
+        layer_ids: list[UUID],
+        bbox,
+        limit_value: int | None,
+        after_ids: dict[UUID, UUID] | None = None,
+        rendering: GeometryRendering = FULL_GEOMETRY,
+    ) -> bytes:
+        limit_value = self.normalize_limit(limit_value)
+        layers = []
+        for layer_id in layer_ids:
+            layer = await self.get_layer(layer_id)
+            if layer is None:
+                raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+            layers.append(layer)
+        pages = await self.layer_repository.list_layers_features_bbox(
+            layers, bbox, limit_value, after_ids or {}, rendering
+        )
+        collections_json = ",".join(
+            f'"{layer_id}":'
+            + self.to_feature_collection_json(
+                rows,
+                bbox,
+                limit_value,
+                truncated,
+                format_layer_cursor(layer_id, next_cursor),
+                rendering,
+            ).decode()
+            for layer_id, (rows, truncated, next_cursor) in pages.items()
+        )
+        return f'{{"type":"LayerFeatureCollections","layers":{{{collections_json}}}}}'.encode()
+
+    async def read_features_from_bbox(
+        self,
+        layer: Layer | LayerMetadata,
+        bbox,
+        limit_value: int,
+        after_id: UUID | None,
+        rendering: GeometryRendering,
+        property_filters: tuple[PropertyFilter, ...] = (),
+        order: FeatureOrder = ID_ORDER,
+    ) -> bytes:
         rows, truncated, next_cursor = await self.layer_repository.list_features_bbox(
-            layer, bbox, limit_value, after_id
+            layer, bbox, limit_value, after_id, rendering, property_filters, order
+        )
+        return self.to_feature_collection_json(
+            rows, bbox, limit_value, truncated, next_cursor, rendering, order
+        )
+
+    async def get_features_in_filter(
+        self,
+        layer_id: UUID,
+        spatial_filter: SpatialFilter,
+        limit_value: int | None,
+        after_id: UUID | None = None,
+        rendering: GeometryRendering = FULL_GEOMETRY,
+        property_filters: tuple[PropertyFilter, ...] = (),
+    ) -> bytes:
+        limit_value = self.normalize_limit(limit_value)
+        layer = await self.get_layer(layer_id)
+        if layer is None:
+            raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        rows, truncated, next_cursor = await self.layer_repository.list_features_filter(
+            layer, spatial_filter, limit_value, after_id, rendering, property_filters
+        )
+        return self.to_feature_collection_json(
+            rows, spatial_filter.bbox, limit_value, truncated, next_cursor, rendering
+        )
+
+    async def get_nearest_features(self, layer_id: UUID, query: NearestQuery) -> bytes:
+        layer = await self.get_layer(layer_id)
+        if layer is None:
+            raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        rows = await self.layer_repository.list_nearest_features(layer, query)
+        meta = FeatureNearestMetaOut(
+            point=(query.lon, query.lat),
+            k=query.k,
+            returned=len(rows),
+            max_distance=query.max_distance,
+            distances=[row.distance for row in rows],
+        )
+        features_json = ",".join(row.feature_json for row in rows)
+        return (
+            f'{{"type":"FeatureCollection","features":[{features_json}],'
+            f'"meta":{meta.model_dump_json()}}}'
+        ).encode()
+
+    def to_feature_changes_json(
+        self,
+        rows,
+        bbox,
+        limit_value: int,
+        truncated: bool,
+        since_revision: int,
+        revision: int,
+    ) -> bytes:
+        features = [row.feature_json for row in rows if row.feature_json is not None]
+        deleted = [str(row.id) for row in rows if row.feature_json is None]
+        meta = FeatureChangesMetaOut(
+            bbox=(bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat),
+            limit=limit_value,
+            returned=len(rows),
+            truncated=truncated,
+            since_revision=since_revision,
+            revision=rows[-1].revision if truncated else revision,
+        )
+        return (
+            f'{{"type":"FeatureCollection","features":[{",".join(features)}],'
+            f'"deleted":{json.dumps(deleted)},"meta":{meta.model_dump_json()}}}'
+        ).encode()
+
+    async def get_feature_changes(
+        self,
+        layer_id: UUID,
+        bbox,
+        since_revision: int | None,
+        since: datetime | None,
+        limit_value: int | None,
+    ) -> bytes:
+        if (since_revision is None) == (since is None):
+            raise BusinessValidationException("Нужно указать либо since_revision, либо since")
+        if since_revision is not None and since_revision < 0:
+            raise BusinessValidationException("since_revision не может быть отрицательным")
+        limit_value = self.normalize_limit(limit_value)
+        layer = await self.get_layer(layer_id)
+        if layer is None:
+            raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        revision = await self.get_layer_revision(layer_id)
+        if since_revision is None:
+            since_revision = await self.layer_repository.get_revision_at(layer_id, since)
+        pruned_revision = await self.layer_repository.get_pruned_revision(layer_id)
+        if pruned_revision and since_revision < pruned_revision:
+            raise ChangeLogPrunedException(
+                layer_id,
+                pruned_revision,
+                f"Журнал изменений слоя {layer_id} очищен до ревизии {pruned_revision}, "
+                "нужна полная перезагрузка данных",
+            )
+        rows, truncated = await self.layer_repository.list_feature_changes_bbox(
+            layer, bbox, since_revision, limit_value
+        )
+        return self.to_feature_changes_json(
+            rows, bbox, limit_value, truncated, since_revision, revision
         )
-        return self.to_feature_collection_out(rows, bbox, limit_value, truncated, next_cursor)
+
+    async def get_layer_revision(self, layer_id: UUID) -> int:
+        revision = await self.layer_repository.get_layer_revision(layer_id)
+        if revision is None:
+            raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        return revision
+
+    async def get_layer_revisions(self, layer_ids: list[UUID]) -> dict[UUID, int]:
+        revisions = await self.layer_repository.get_layer_revisions(layer_ids)
+        for layer_id in layer_ids:
+            if layer_id not in revisions:
+                raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        return revisions
+
+    async def get_feature_aggregate(
+        self, layer_id: UUID, bbox, grid: AggregationGrid
+    ) -> FeatureAggregateOut:
+        layer = await self.get_layer(layer_id)
+        if layer is None:
+            raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        rows = await self.layer_repository.aggregate_features_bbox(layer, bbox, grid)
+        cells = [
+            FeatureAggregateCellOut(
+                x=row.x,
+                y=row.y,
+                count=row.count,
+                extent=(row.min_lon, row.min_lat, row.max_lon, row.max_lat),
+                point=(row.lon, row.lat),
+            )
+            for row in rows
+        ]
+        return FeatureAggregateOut(
+            cells=cells,
+            meta=FeatureAggregateMetaOut(
+                bbox=(bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat),
+                zoom=grid.zoom,
+                cell_size=grid.cell_size,
+                cells=len(cells),
+                features=sum(cell.count for cell in cells),
+            ),
+        )
+
+    async def get_layer_tile(self, layer_id: UUID, tile: TileCoordinates) -> bytes:
+        layer = await self.get_layer(layer_id)
+        if layer is None:
+            raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        return await self.layer_repository.get_layer_tile(layer, tile)
 
     async def create_feature(self, layer_id: UUID, request: CreateFeatureIn) -> FeatureOut:
         feature: FeatureOut
         async with self.session.begin():
-            layer = await self.layer_repository.get_layer_by_id(layer_id)
+            layer = await self.get_layer(layer_id)
             if layer is None:
                 raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
             if not self.check_geometry_type_match(request, layer):
@@ -131,7 +407,8 @@ class FeatureService:
                 properties=request.properties,
                 geometry=request.geometry,
             )
-        await self.publish_feature_created(layer_id, feature)
+            extent = self.to_extent_bbox([row])
+        await self.publish_feature_created(layer_id, feature, extent)
         return feature
 
     async def update_feature(
@@ -139,44 +416,32 @@ class FeatureService:
     ) -> FeatureOut:
         feature: FeatureOut
         async with self.session.begin():
-            layer = await self.layer_repository.get_layer_by_id(layer_id)
+            layer = await self.get_layer(layer_id)
             if layer is None:
                 raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
             if request.geometry and not self.check_geometry_type_match(request, layer):
                 raise BusinessValidationException(
                     "Тип обновляемой геометрии не соответствует типу геометрии слоя"
                 )
-
-            current_feature = None
-            if request.geometry is None or request.properties is None:
-                current_feature = await self.get_feature(layer_id, feature_id)
-
-            (row, model_type) = await self.layer_repository.update_feature_if_version_matches(
+            row = await self.layer_repository.update_feature_if_version_matches(
                 layer,
                 feature_id,
                 dump_feature_geometry(request.geometry) if request.geometry else None,
                 request.properties,
                 request.version,
             )
-            if row is None:
-                await self.version_error_handler(feature_id, request.version, model_type)
-
-            geometry = request.geometry or (current_feature.geometry if current_feature else None)
-            properties = request.properties or (
-                current_feature.properties if current_feature else None
-            )
-            if geometry is None or properties is None:
-                raise BusinessValidationException(
-                    f"Не удалось собрать актуальное состояние feature {feature_id} после update"
+            if row is None or row.id is None:
+                raise self.version_error(
+                    feature_id, request.version, row.current_version if row else None
                 )
-
-            feature = FeatureOut(
-                id=row.id,
+            feature = self.to_feature_out(
+                feature_id=row.id,
                 version=row.version,
-                properties=properties,
-                geometry=geometry,
+                properties=row.properties,
+                geometry_data=row.geometry_data,
             )
-        await self.publish_feature_updated(layer_id, feature)
+            extent = self.to_extent_bbox([row])
+        await self.publish_feature_updated(layer_id, feature, extent)
         return feature
 
     async def delete_feature(
@@ -184,20 +449,167 @@ class FeatureService:
     ) -> DeleteFeatureResponse:
         response: DeleteFeatureResponse
         async with self.session.begin():
-            layer = await self.layer_repository.get_layer_by_id(layer_id)
+            layer = await self.get_layer(layer_id)
             if layer is None:
                 raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
-            deleted, model_type = await self.layer_repository.delete_feature_if_version_matches(
+            row = await self.layer_repository.delete_feature_if_version_matches(
                 layer, feature_id, request.version
             )
-            if not deleted:
-                await self.version_error_handler(feature_id, request.version, model_type)
+            if row is None or row.id is None:
+                raise self.version_error(
+                    feature_id, request.version, row.current_version if row else None
+                )
             response = DeleteFeatureResponse(featureId=feature_id)
-        await self.publish_feature_deleted(layer_id, feature_id)
+            extent = self.to_extent_bbox([row])
+        await self.publish_feature_deleted(layer_id, feature_id, extent)
+        return response
+
+    async def apply_feature_batch(
+        self, layer_id: UUID, request: BatchFeaturesRequest
+    ) -> BatchFeaturesResponse:
+        self.check_batch_feature_ids(request)
+        creates = [
+            (index, operation)
+            for index, operation in enumerate(request.operations)
+            if isinstance(operation, BatchCreateOperation)
+        ]
+        updates = [
+            (index, operation)
+            for index, operation in enumerate(request.operations)
+            if isinstance(operation, BatchUpdateOperation)
+        ]
+        deletes = [
+            (index, operation)
+            for index, operation in enumerate(request.operations)
+            if isinstance(operation, BatchDeleteOperation)
+        ]
+        results: dict[int, BatchFeatureResult] = {}
+        created: list[FeatureOut] = []
+        updated: list[FeatureOut] = []
+        deleted: list[UUID] = []
+        changed_rows = []
+        response: BatchFeaturesResponse
+        async with self.session.begin():
+            layer = await self.get_layer(layer_id)
+            if layer is None:
+                raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+            for _, operation in creates + updates:
+                if operation.geometry and not self.check_geometry_type_match(operation, layer):
+                    raise BusinessValidationException(
+                        "Тип геометрии в пакете не соответствует типу геометрии слоя"
+                    )
+
+            if creates:
+                rows = await self.layer_repository.create_features(
+                    layer,
+                    [
+                        (dump_feature_geometry(operation.geometry), operation.properties)
+                        for _, operation in creates
+                    ],
+                )
+                changed_rows.extend(rows)
+                for (index, operation), row in zip(creates, rows):
+                    feature = FeatureOut(
+                        id=row.id,
+                        version=row.version,
+                        properties=operation.properties,
+                        geometry=operation.geometry,
+                    )
+                    created.append(feature)
+                    results[index] = BatchFeatureResult(
+                        index=index,
+                        op=operation.op,
+                        status="applied",
+                        featureId=row.id,
+                        feature=feature,
+                    )
+
+            model_type = None
+            if updates:
+                rows, model_type = await self.layer_repository.update_features_if_versions_match(
+                    layer,
+                    [
+                        (
+                            operation.id,
+                            operation.version,
+                            (
+                                dump_feature_geometry(operation.geometry)
+                                if operation.geometry
+                                else None
+                            ),
+                            operation.properties,
+                        )
+                        for _, operation in updates
+                    ],
+                )
+                changed_rows.extend(rows)
+                rows_by_id = {row.id: row for row in rows}
+                for index, operation in updates:
+                    row = rows_by_id.get(operation.id)
+                    if row is None:
+                        continue
+                    feature = self.to_feature_out(
+                        feature_id=row.id,
+                        version=row.version,
+                        properties=row.properties,
+                        geometry_data=row.geometry_data,
+                    )
+                    updated.append(feature)
+                    results[index] = BatchFeatureResult(
+                        index=index,
+                        op=operation.op,
+                        status="applied",
+                        featureId=row.id,
+                        feature=feature,
+                    )
+
+            if deletes:
+                rows, model_type = await self.layer_repository.delete_features_if_versions_match(
+                    layer, [(operation.id, operation.version) for _, operation in deletes]
+                )
+                changed_rows.extend(rows)
+                deleted_set = {row.id for row in rows}
+                for index, operation in deletes:
+                    if operation.id not in deleted_set:
+                        continue
+                    deleted.append(operation.id)
+                    results[index] = BatchFeatureResult(
+                        index=index, op=operation.op, status="applied", featureId=operation.id
+                    )
+
+            rejected = sorted(
+                [
+                    (index, operation)
+                    for index, operation in updates + deletes
+                    if index not in results
+                ],
+                key=lambda item: item[0],
+            )
+            if rejected:
+                current_versions = await self.layer_repository.get_current_versions(
+                    model_type, [operation.id for _, operation in rejected]
+                )
+                if request.atomic:
+                    _, operation = rejected[0]
+                    raise self.version_error(
+                        operation.id, operation.version, current_versions.get(operation.id)
+                    )
+                for index, operation in rejected:
+                    results[index] = self.to_batch_rejection(
+                        index, operation, current_versions.get(operation.id)
+                    )
+
+            response = BatchFeaturesResponse(
+                applied=len(created) + len(updated) + len(deleted),
+                failed=len(rejected),
+                results=[results[index] for index in range(len(request.operations))],
+            )
+            extent = self.to_extent_bbox(changed_rows)
+        await self.publish_features_batch(layer_id, created, updated, deleted, extent)
         return response
 
     async def get_feature(self, layer_id: UUID, feature_id: UUID) -> FeatureOut:
-        layer = await self.layer_repository.get_layer_by_id(layer_id)
+        layer = await self.get_layer(layer_id)
         if layer is None:
             raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
         row = await self.layer_repository.get_feature(layer, feature_id)
@@ -210,6 +622,17 @@ class FeatureService:
             geometry_data=row.geometry_data,
         )
 
+    async def get_feature_json(
+        self, layer_id: UUID, feature_id: UUID, rendering: GeometryRendering
+    ) -> bytes:
+        layer = await self.get_layer(layer_id)
+        if layer is None:
+            raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+        feature_json = await self.layer_repository.get_feature_json(layer, feature_id, rendering)
+        if feature_json is None:
+            raise FeatureNotFoundException(f"Feature с идентификатором {feature_id} не найдена")
+        return feature_json.encode()
+
     def normalize_limit(self, limit_value: int | None) -> int:
         if limit_value is None:
             limit_value = 500
@@ -224,42 +647,107 @@ class FeatureService:
         expected = layer.geometry_type
         return geojson_type == expected
 
-    async def version_error_handler(
-        self, feature_id: UUID, expected_version: int, model_type: type
-    ):
-        current = await self.layer_repository.get_current_version(model_type, feature_id)
-        if current is None:
-            raise FeatureNotFoundException(f"Feature с идентификатором {feature_id} не найдена")
-        raise VersionMismatchException(
+    def version_error(
+        self, feature_id: UUID, expected_version: int, current_version: int | None
+    ) -> FeatureNotFoundException | VersionMismatchException:
+        if current_version is None:
+            return FeatureNotFoundException(f"Feature с идентификатором {feature_id} не найдена")
+        return VersionMismatchException(
             feature_id=feature_id,
             request_version=expected_version,
-            current_version=current.version,
+            current_version=current_version,
             message=(
-                f"Ожидалась версия {current.version}, а получили {expected_version}. "
+                f"Ожидалась версия {current_version}, а получили {expected_version}. "
                 "Перезагрузите фичу и отредактируйте ее снова"
             ),
         )
 
-    async def publish_feature_created(self, layer_id: UUID, feature: FeatureOut) -> None:
+    def to_batch_rejection(
+        self,
+        index: int,
+        operation: BatchUpdateOperation | BatchDeleteOperation,
+        current_version: int | None,
+    ) -> BatchFeatureResult:
+        error = self.version_error(operation.id, operation.version, current_version)
+        if isinstance(error, FeatureNotFoundException):
+            return BatchFeatureResult(
+                index=index, op=operation.op, status="not_found", featureId=operation.id
+            )
+        return BatchFeatureResult(
+            index=index,
+            op=operation.op,
+            status="conflict",
+            featureId=operation.id,
+            conflict=PatchFeatureConflictResponse(
+                featureId=str(error.feature_id),
+                requestVersion=error.request_version,
+                currentVersion=error.current_version,
+                message=error.message,
+            ),
+        )
+
+    def check_batch_feature_ids(self, request: BatchFeaturesRequest) -> None:
+        seen: set[UUID] = set()
+        for operation in request.operations:
+            if isinstance(operation, BatchCreateOperation):
+                continue
+            if operation.id in seen:
+                raise BusinessValidationException(
+                    f"Feature с идентификатором {operation.id} встречается в пакете несколько раз"
+                )
+            seen.add(operation.id)
+
+    def to_extent_bbox(self, rows) -> Bbox | None:
+        # Realtime events reach only the viewports this extent intersects; an event without
+        # one goes to every subscriber of the layer.
+        extents = [row.extent for row in rows]
+        if not extents or any(extent is None for extent in extents):
+            return None
+        return union_bbox([wkb_to_bbox(extent.data) for extent in extents])
+
+    async def publish_feature_created(
+        self, layer_id: UUID, feature: FeatureOut, extent: Bbox | None = None
+    ) -> None:
         if self.realtime_publisher is None:
             return
         try:
-            await self.realtime_publisher.publish_feature_created(layer_id, feature)
+            await self.realtime_publisher.publish_feature_created(layer_id, feature, extent)
         except Exception:
             return
 
-    async def publish_feature_updated(self, layer_id: UUID, feature: FeatureOut) -> None:
+    async def publish_feature_updated(
+        self, layer_id: UUID, feature: FeatureOut, extent: Bbox | None = None
+    ) -> None:
         if self.realtime_publisher is None:
             return
         try:
-            await self.realtime_publisher.publish_feature_updated(layer_id, feature)
+            await self.realtime_publisher.publish_feature_updated(layer_id, feature, extent)
+        except Exception:
+            return
+
+    async def publish_features_batch(
+        self,
+        layer_id: UUID,
+        created: list[FeatureOut],
+        updated: list[FeatureOut],
+        deleted: list[UUID],
+        extent: Bbox | None = None,
+    ) -> None:
+        if self.realtime_publisher is None or not (created or updated or deleted):
+            return
+        try:
+            await self.realtime_publisher.publish_features_batch(
+                layer_id, created, updated, deleted, extent
+            )
         except Exception:
             return
 
-    async def publish_feature_deleted(self, layer_id: UUID, feature_id: UUID) -> None:
+    async def publish_feature_deleted(
+        self, layer_id: UUID, feature_id: UUID, extent: Bbox | None = None
+    ) -> None:
         if self.realtime_publisher is None:
             return
         try:
-            await self.realtime_publisher.publish_feature_deleted(layer_id, feature_id)
+            await self.realtime_publisher.publish_feature_deleted(layer_id, feature_id, extent)
         except Exception:
             return
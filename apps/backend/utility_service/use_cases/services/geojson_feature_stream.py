@@ -0,0 +1,213 @@
+import codecs
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Literal
+
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+
+FeatureStreamFormat = Literal["geojson", "ndjson"]
+
+JSON_WHITESPACE = " \t\n\r"
+JSON_DECODER = json.JSONDecoder()
+# Quotes, escapes and the container's own brackets: in valid JSON the depth counted over
+# just one bracket kind returns to zero only where the outermost container of that kind
+# closes, so the brackets of nested coordinate arrays never have to be visited.
+JSON_CONTAINER_STRUCTURE = {
+    "{": re.compile(r'["\\{}]'),
+    "[": re.compile(r'["\\\[\]]'),
+}
+
+
+class JsonContainerScanner:
+    # Finds where an object or array ends across chunks without decoding it.
+    def __init__(self, opener: str) -> None:
+        self.structure = JSON_CONTAINER_STRUCTURE[opener]
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str, start: int = 0) -> int | None:
+        index = start
+        if self.escaped and index < len(text):
+            index += 1
+            self.escaped = False
+        while match := self.structure.search(text, index):
+            char = match.group()
+            index = match.end()
+            if self.in_string:
+                if char == "\\":
+                    if index == len(text):
+                        self.escaped = True
+                        return None
+                    index += 1
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in "{[":
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    return index
+        return None
+
+
+class JsonStreamReader:
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        self.chunks = chunks.__aiter__()
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    async def read(self) -> str | None:
+        if self.eof:
+            return None
+        try:
+            chunk = await anext(self.chunks)
+        except StopAsyncIteration:
+            self.eof = True
+            chunk = b""
+        try:
+            return self.decoder.decode(chunk, final=self.eof)
+        except UnicodeDecodeError as e:
+            raise BusinessValidationException("Файл импорта должен быть в кодировке UTF-8") from e
+
+    async def fill(self) -> bool:
+        decoded = await self.read()
+        if decoded is None:
+            return False
+        self.text = self.text[self.pos :] + decoded
+        self.pos = 0
+        return True
+
+    async def peek(self) -> str:
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in JSON_WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not await self.fill():
+                return ""
+
+    async def expect(self, char: str) -> None:
+        if await self.peek() != char:
+            raise BusinessValidationException(
+                f"Некорректный GeoJSON: ожидался символ '{char}' в позиции {self.pos}"
+            )
+        self.pos += 1
+
+    async def value(self) -> object:
+        if await self.peek() in ("{", "["):
+            return await self.container(self.text[self.pos])
+        while True:
+            try:
+                value, end = JSON_DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as e:
+                if await self.fill():
+                    continue
+                raise BusinessValidationException(f"Некорректный GeoJSON: {e.msg}") from e
+            # A number ending exactly at the buffer edge may continue in the next chunk.
+            if end == len(self.text) and await self.fill():
+                continue
+            self.pos = end
+            return value
+
+    async def container(self, opener: str) -> object:
+        # Chunks are scanned one by one and joined once the container is complete, so a
+        # feature spanning many chunks is copied and decoded once instead of per chunk.
+        scanner = JsonContainerScanner(opener)
+        end = scanner.feed(self.text, self.pos)
+        if end is None:
+            pieces = [self.text[self.pos :]]
+            while end is None:
+                decoded = await self.read()
+                if decoded is None:
+                    break
+                pieces.append(decoded)
+                end = scanner.feed(decoded)
+            self.text = "".join(pieces)
+            self.pos = 0
+        try:
+            value, self.pos = JSON_DECODER.raw_decode(self.text, self.pos)
+        except json.JSONDecodeError as e:
+            raise BusinessValidationException(f"Некорректный GeoJSON: {e.msg}") from e
+        return value
+
+
+async def iter_feature_collection(chunks: AsyncIterable[bytes]) -> AsyncIterator[object]:
+    reader = JsonStreamReader(chunks)
+    await reader.expect("{")
+    has_features = False
+    while await reader.peek() != "}":
+        key = await reader.value()
+        await reader.expect(":")
+        if key == "features":
+            has_features = True
+            await reader.expect("[")
+            while await reader.peek() != "]":
+                yield await reader.value()
+                if await reader.peek() == ",":
+                    reader.pos += 1
+                elif await reader.peek() != "]":
+                    await reader.expect("]")
+            reader.pos += 1
+        elif key == "type":
+            if await reader.value() != "FeatureCollection":
+                raise BusinessValidationException("Файл GeoJSON должен содержать FeatureCollection")
+        else:
+            await reader.value()
+        if await reader.peek() == ",":
+            reader.pos += 1
+        elif await reader.peek() != "}":
+            await reader.expect("}")
+
+    if not has_features:
+        raise BusinessValidationException("FeatureCollection не содержит поле features")
+
+
+async def iter_ndjson_features(chunks: AsyncIterable[bytes]) -> AsyncIterator[object]:
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield parse_ndjson_line(line, line_number)
+    if buffer.strip():
+        yield parse_ndjson_line(buffer, line_number + 1)
+
+
+def parse_ndjson_line(line: bytes, line_number: int) -> object:
+    try:
+        return json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise BusinessValidationException(
+            f"Строка {line_number} файла NDJSON не является корректным JSON"
+        ) from e
+
+
+def iter_stream_features(
+    chunks: AsyncIterable[bytes], stream_format: FeatureStreamFormat
+) -> AsyncIterator[object]:
+    if stream_format == "ndjson":
+        return iter_ndjson_features(chunks)
+    return iter_feature_collection(chunks)
+
+
+async def iter_feature_chunks(
+    features: AsyncIterable[object], chunk_size: int
+) -> AsyncIterator[list[object]]:
+    chunk: list[object] = []
+    async for feature in features:
+        chunk.append(feature)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from uuid import UUID
+
+from utility_service.domain_services.feature_registry import LayerMetadata, to_layer_metadata
+from utility_service.infrastructure.postgresql.models.layer import Layer
+
+LayerLoader = Callable[[UUID], Awaitable[Layer | None]]
+
+
+class LayerRegistry:
+    # Only layer attributes that practically never change are cached; the layer
+    # revision moves with every write and is always read from the database. A layer
+    # changed through this process is invalidated right away; changes made by another
+    # process (the CLI, another worker) are picked up when the entry's TTL runs out.
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[UUID, tuple[float, LayerMetadata]] = OrderedDict()
+
+    def get(self, layer_id: UUID) -> LayerMetadata | None:
+        entry = self._entries.get(layer_id)
+        if entry is None:
+            return None
+        expires_at, metadata = entry
+        if expires_at <= self._clock():
+            del self._entries[layer_id]
+            return None
+        self._entries.move_to_end(layer_id)
+        return metadata
+
+    def put(self, layer: Layer) -> LayerMetadata:
+        metadata = to_layer_metadata(layer)
+        self._entries[layer.id] = (self._clock() + self.ttl_seconds, metadata)
+        self._entries.move_to_end(layer.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return metadata
+
+    def replace_all(self, layers: Iterable[Layer]) -> None:
+        self._entries.clear()
+        for layer in layers:
+            self.put(layer)
+
+    def invalidate(self, layer_id: UUID | None = None) -> None:
+        if layer_id is None:
+            self._entries.clear()
+            return
+        self._entries.pop(layer_id, None)
+
+    async def get_or_load(self, layer_id: UUID, load: LayerLoader) -> LayerMetadata | None:
+        metadata = self.get(layer_id)
+        if metadata is not None:
+            return metadata
+        layer = await load(layer_id)
+        if layer is None:
+            return None
+        return self.put(layer)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -10,13 +10,25 @@ from utility_service.use_cases.schemas.layer.layer_list_out import LayerListOut
 from sqlalchemy.ext.asyncio import AsyncSession
 from utility_service.infrastructure.postgresql.repositories.layer_repository import LayerRepository
 from utility_service.infrastructure.postgresql.models.layer import Layer
+from utility_service.domain_services.feature_registry import LayerMetadata
+from utility_service.use_cases.services.layer_registry import LayerRegistry
+from utility_service.domain_services.property_filter import parse_indexed_property_keys
+from utility_service.use_cases.domain.exceptions.layer_not_found_exception import (
+    LayerNotFoundException,
+)
 from uuid import UUID
 
 
 class LayerService:
-    def __init__(self, session: AsyncSession, layer_repository: LayerRepository):
+    def __init__(
+        self,
+        session: AsyncSession,
+        layer_repository: LayerRepository,
+        layer_registry: LayerRegistry | None = None,
+    ):
         self.session = session
         self.layer_repository = layer_repository
+        self.layer_registry = layer_registry
 
     def to_layer_out(self, layer: Layer) -> LayerOut:
         return LayerOut(
@@ -29,7 +41,24 @@ class LayerService:
 
     async def get_layers(self) -> LayerListOut:
         layers = await self.layer_repository.get_layers()
+        if self.layer_registry is not None:
+            self.layer_registry.replace_all(layers)
         return LayerListOut(layers=[self.to_layer_out(layer) for layer in layers])
 
-    async def get_layer_by_id(self, layer_id: UUID) -> Layer | None:
-        return await self.layer_repository.get_layer_by_id(layer_id)
+    async def get_layer_by_id(self, layer_id: UUID) -> Layer | LayerMetadata | None:
+        if self.layer_registry is None:
+            return await self.layer_repository.get_layer_by_id(layer_id)
+        return await self.layer_registry.get_or_load(
+            layer_id, self.layer_repository.get_layer_by_id
+        )
+
+    async def set_indexed_properties(self, layer_id: UUID, keys: list[str]) -> list[str]:
+        keys = parse_indexed_property_keys(keys)
+        async with self.session.begin():
+            layer = await self.layer_repository.get_layer_by_id(layer_id)
+            if layer is None:
+                raise LayerNotFoundException(f"Слой с идентификатором {layer_id} не найден")
+            await self.layer_repository.set_indexed_properties(layer, keys)
+        if self.layer_registry is not None:
+            self.layer_registry.invalidate(layer_id)
+        return keys
@@ -0,0 +1,26 @@
+from utility_service.domain_services.feature_registry import ALL_FEATURE_MODELS
+from utility_service.infrastructure.postgresql.repositories.property_index_repository import (
+    PropertyIndexRepository,
+)
+
+
+class PropertyIndexService:
+    def __init__(self, property_index_repository: PropertyIndexRepository):
+        self.property_index_repository = property_index_repository
+
+    async def sync_property_indexes(self) -> dict[str, list[str]]:
+        # An index is dropped only when no layer on its storage table still lists the key.
+        # A CONCURRENTLY build that failed leaves an invalid index behind; it is rebuilt.
+        repository = self.property_index_repository
+        indexed_keys = {}
+        for model_type in ALL_FEATURE_MODELS:
+            wanted = await repository.get_indexed_property_keys(model_type)
+            existing = await repository.get_property_indexes(model_type)
+            for key, valid in sorted(existing.items()):
+                if key not in wanted or not valid:
+                    await repository.drop_property_index(model_type, key)
+            for key in sorted(wanted):
+                if not existing.get(key):
+                    await repository.create_property_index(model_type, key)
+            indexed_keys[model_type.__tablename__] = sorted(wanted)
+        return indexed_keys
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from uuid import UUID
 
+import orjson
 from fastapi import WebSocket
 
+from utility_service.domain_services.bbox import Bbox
+from utility_service.use_cases.services.viewport_index import ViewportIndex
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_SEND_QUEUE_SIZE = 256
+
 
 @dataclass(frozen=True)
 class WebSocketUserContext:
@@ -14,39 +24,146 @@ class WebSocketUserContext:
     role: str
 
 
+@dataclass
+class WebSocketConnection:
+    user_context: WebSocketUserContext
+    queue: asyncio.Queue
+    writer: asyncio.Task | None = None
+    dropped_events: int = 0
+
+
 class WebSocketConnectionManager:
-    def __init__(self) -> None:
-        self._connections: dict[UUID, dict[WebSocket, WebSocketUserContext]] = defaultdict(dict)
+    def __init__(self, send_queue_size: int = DEFAULT_SEND_QUEUE_SIZE) -> None:
+        self.send_queue_size = send_queue_size
+        self.dropped_events = 0
+        self.resyncs = 0
+        self._connections: dict[UUID, dict[WebSocket, WebSocketConnection]] = defaultdict(dict)
+        self._viewports: dict[UUID, ViewportIndex] = defaultdict(ViewportIndex)
 
     async def connect(
         self, layer_id: UUID, websocket: WebSocket, user_context: WebSocketUserContext
     ) -> None:
         await websocket.accept()
-        self._connections[layer_id][websocket] = user_context
+        connection = WebSocketConnection(user_context, asyncio.Queue(self.send_queue_size))
+        connection.writer = asyncio.create_task(self._write(layer_id, websocket, connection))
+        self._connections[layer_id][websocket] = connection
 
     async def disconnect(self, layer_id: UUID, websocket: WebSocket) -> None:
         layer_connections = self._connections.get(layer_id)
         if not layer_connections:
             return
 
-        layer_connections.pop(websocket, None)
+        connection = layer_connections.pop(websocket, None)
+        self.set_viewport(layer_id, websocket, None)
         if not layer_connections:
             self._connections.pop(layer_id, None)
+        if connection is not None and connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
 
-    async def broadcast_to_layer(self, layer_id: UUID, event: dict[str, object]) -> None:
-        layer_connections = self._connections.get(layer_id)
-        if not layer_connections:
+    async def close(self) -> None:
+        for layer_id, layer_connections in list(self._connections.items()):
+            for websocket in list(layer_connections):
+                await self.disconnect(layer_id, websocket)
+
+    async def send_to_connection(
+        self, layer_id: UUID, websocket: WebSocket, event: dict[str, object]
+    ) -> None:
+        connection = self._connections.get(layer_id, {}).get(websocket)
+        if connection is not None:
+            self._enqueue(layer_id, connection, encode_event(event))
+
+    def set_viewport(
+        self, layer_id: UUID, websocket: WebSocket, viewport: list[Bbox] | None
+    ) -> None:
+        if viewport is not None:
+            self._viewports[layer_id].set(websocket, viewport)
             return
+        layer_viewports = self._viewports.get(layer_id)
+        if layer_viewports is not None:
+            layer_viewports.remove(websocket)
+            if not layer_viewports:
+                self._viewports.pop(layer_id, None)
 
-        stale_connections: list[WebSocket] = []
-        for websocket in list(layer_connections):
-            try:
-                await websocket.send_json(event)
-            except Exception:
-                stale_connections.append(websocket)
+    async def broadcast_to_layer(
+        self, layer_id: UUID, event: dict[str, object], extent: Bbox | None = None
+    ) -> None:
+        if self._connections.get(layer_id):
+            self.broadcast_frame_to_layer(layer_id, encode_event(event), extent)
 
-        for websocket in stale_connections:
-            await self.disconnect(layer_id, websocket)
+    def broadcast_frame_to_layer(
+        self, layer_id: UUID, frame: str, extent: Bbox | None = None
+    ) -> None:
+        # Broadcasting only enqueues: every connection has its own writer task, so a slow
+        # client holds up neither the other subscribers nor the request that published.
+        # The event is encoded once and the same text frame is queued for every subscriber.
+        layer_connections = self._connections.get(layer_id, {})
+        layer_viewports = self._viewports.get(layer_id)
+        if extent is None or layer_viewports is None:
+            targets = list(layer_connections)
+        else:
+            # Clients that sent a viewport only receive events whose extent intersects it.
+            matched = layer_viewports.query(extent)
+            targets = [
+                websocket
+                for websocket in layer_connections
+                if websocket not in layer_viewports or websocket in matched
+            ]
+        for websocket in targets:
+            self._enqueue(layer_id, layer_connections[websocket], frame)
 
     def get_connection_count(self, layer_id: UUID) -> int:
         return len(self._connections.get(layer_id, {}))
+
+    def get_queue_depths(self, layer_id: UUID) -> list[int]:
+        return [
+            connection.queue.qsize() for connection in self._connections.get(layer_id, {}).values()
+        ]
+
+    def resync_all(self) -> None:
+        # Used when events may have been lost before reaching this worker at all, e.g.
+        # while the event bus was reconnecting: every client is told to reload its layer.
+        for layer_id, layer_connections in self._connections.items():
+            for connection in layer_connections.values():
+                self._resync(layer_id, connection, connection.queue.qsize())
+
+    def _enqueue(self, layer_id: UUID, connection: WebSocketConnection, frame: str) -> None:
+        try:
+            connection.queue.put_nowait(frame)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        # The client fell a whole queue behind: its pending events are discarded and it is
+        # told to reload the layer instead of receiving an incomplete stream.
+        dropped = connection.queue.qsize() + 1
+        self._resync(layer_id, connection, dropped)
+        _logger.warning(
+            "Очередь WebSocket-клиента слоя %s переполнена, отброшено событий: %s",
+            layer_id,
+            dropped,
+        )
+
+    def _resync(self, layer_id: UUID, connection: WebSocketConnection, dropped: int) -> None:
+        while not connection.queue.empty():
+            connection.queue.get_nowait()
+        connection.queue.put_nowait(
+            encode_event({"type": "resync_required", "layerId": str(layer_id)})
+        )
+        connection.dropped_events += dropped
+        self.dropped_events += dropped
+        self.resyncs += 1
+
+    async def _write(
+        self, layer_id: UUID, websocket: WebSocket, connection: WebSocketConnection
+    ) -> None:
+        while True:
+            frame = await connection.queue.get()
+            try:
+                await websocket.send_text(frame)
+            except Exception:
+                await self.disconnect(layer_id, websocket)
+                return
+
+
+def encode_event(event: dict[str, object]) -> str:
+    return orjson.dumps(event).decode()
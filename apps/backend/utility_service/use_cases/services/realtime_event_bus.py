@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from utility_service.domain_services.bbox import Bbox
+
+from utility_service.infrastructure.postgresql.repositories.realtime_event_repository import (
+    RealtimeEventRepository,
+)
+from utility_service.use_cases.services.realtime_connection_manager import (
+    WebSocketConnectionManager,
+    encode_event,
+)
+
+_logger = logging.getLogger(__name__)
+
+REALTIME_EVENTS_CHANNEL = "realtime_events"
+# NOTIFY payloads are capped at 8000 bytes; larger frames are stored in realtime_events
+# and only their id is sent through the channel.
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+EVENT_FRAME_RETENTION = timedelta(minutes=5)
+LISTENER_HEALTH_CHECK_INTERVAL = 30.0
+LISTENER_RECONNECT_DELAYS = (0.5, 1.0, 2.0, 5.0)
+PUBLISH_QUEUE_SIZE = 1000
+PUBLISH_DRAIN_TIMEOUT = 5.0
+
+
+class RealtimeEventBus(Protocol):
+    async def start(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def broadcast_to_layer(
+        self, layer_id: UUID, event: dict[str, object], extent: Bbox | None = None
+    ) -> None: ...
+
+
+class LocalRealtimeEventBus:
+    def __init__(self, connection_manager: WebSocketConnectionManager):
+        self.connection_manager = connection_manager
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def broadcast_to_layer(
+        self, layer_id: UUID, event: dict[str, object], extent: Bbox | None = None
+    ) -> None:
+        await self.connection_manager.broadcast_to_layer(layer_id, event, extent)
+
+
+# A connection kept open for the whole life of the worker and used by a single task, so
+# it needs no lock. A failed connection is dropped and reopened on the next use.
+class DedicatedConnection:
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self._connection: AsyncConnection | None = None
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        if self._connection is None:
+            self._connection = await self.engine.connect()
+        try:
+            async with AsyncSession(bind=self._connection) as session:
+                yield session
+                await session.commit()
+        except Exception:
+            connection, self._connection = self._connection, None
+            try:
+                await connection.invalidate()
+            except Exception:
+                pass
+            raise
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+
+# Every worker listens on the channel, including the one that published, so all of them
+# deliver an event to their local sockets in the same order. The engine should not be the
+# request pool: the listener, the publisher and the relay each hold a connection for the
+# whole life of the worker.
+class PostgresRealtimeEventBus:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        connection_manager: WebSocketConnectionManager,
+        channel: str = REALTIME_EVENTS_CHANNEL,
+    ):
+        self.engine = engine
+        self.connection_manager = connection_manager
+        self.channel = channel
+        self._listener_connection: AsyncConnection | None = None
+        self._listener_driver_connection = None
+        self._listener_lost = asyncio.Event()
+        self._notifications: asyncio.Queue[str] = asyncio.Queue()
+        self._relay: asyncio.Task | None = None
+        self._watcher: asyncio.Task | None = None
+        self._publishes: asyncio.Queue[tuple[UUID, str, Bbox | None]] = asyncio.Queue(
+            PUBLISH_QUEUE_SIZE
+        )
+        self._lost_layers: set[UUID] = set()
+        self._publisher: asyncio.Task | None = None
+        self._publisher_connection = DedicatedConnection(engine)
+        self._relay_connection = DedicatedConnection(engine)
+
+    async def start(self) -> None:
+        await self._listen()
+        self._publisher = asyncio.create_task(self._publish_events())
+        self._relay = asyncio.create_task(self._relay_notifications())
+        self._watcher = asyncio.create_task(self._watch_listener())
+
+    async def close(self) -> None:
+        # Events already accepted from this worker are still sent if the database lets
+        # them through in time; whatever is left after that is lost.
+        if self._publisher is not None:
+            try:
+                await asyncio.wait_for(self._publishes.join(), PUBLISH_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                _logger.warning(
+                    "Не отправлено событий в канал %s: %s", self.channel, self._publishes.qsize()
+                )
+        tasks = [task for task in (self._watcher, self._relay, self._publisher) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._watcher = None
+        self._relay = None
+        self._publisher = None
+        if self._listener_connection is not None:
+            connection, self._listener_connection = self._listener_connection, None
+            self._listener_driver_connection = None
+            try:
+                raw_connection = await connection.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                driver_connection.remove_termination_listener(self._on_listener_terminated)
+                await driver_connection.remove_listener(self.channel, self._on_notification)
+            finally:
+                await connection.close()
+        await self._publisher_connection.close()
+        await self._relay_connection.close()
+        await self.engine.dispose()
+
+    async def broadcast_to_layer(
+        self, layer_id: UUID, event: dict[str, object], extent: Bbox | None = None
+    ) -> None:
+        # Returns as soon as the event is queued: the request that changed the features
+        # never waits for the database round trips of the publish.
+        try:
+            self._publishes.put_nowait((layer_id, encode_event(event), extent))
+        except asyncio.QueueFull:
+            self._lost_layers.add(layer_id)
+            _logger.warning(
+                "Очередь публикации событий переполнена, событие слоя %s отброшено", layer_id
+            )
+
+    async def publish(self, layer_id: UUID, frame: str, extent: Bbox | None = None) -> None:
+        async with self._publisher_connection.session() as session:
+            repository = RealtimeEventRepository(session)
+            payload = format_notification(layer_id, extent, frame=frame)
+            if len(payload.encode()) > MAX_NOTIFY_PAYLOAD_BYTES:
+                event_id = await repository.add_event_frame(layer_id, frame)
+                await repository.delete_event_frames_before(
+                    datetime.now(timezone.utc) - EVENT_FRAME_RETENTION
+                )
+                payload = format_notification(layer_id, extent, event_id=event_id)
+            await repository.notify(self.channel, payload)
+
+    async def relay_notification(self, payload: str) -> None:
+        layer_id, extent, frame, event_id = parse_notification(payload)
+        if self.connection_manager.get_connection_count(layer_id) == 0:
+            return
+        if frame is None:
+            async with self._relay_connection.session() as session:
+                frame = await RealtimeEventRepository(session).get_event_frame(event_id)
+            if frame is None:
+                return
+        self.connection_manager.broadcast_frame_to_layer(layer_id, frame, extent)
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        self._notifications.put_nowait(payload)
+
+    def _on_listener_terminated(self, connection) -> None:
+        # The connection being replaced may report its termination after the new one is up.
+        if connection is self._listener_driver_connection:
+            self._listener_lost.set()
+
+    async def _listen(self) -> None:
+        self._listener_lost.clear()
+        connection = await self.engine.connect()
+        try:
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            self._listener_driver_connection = driver_connection
+            driver_connection.add_termination_listener(self._on_listener_terminated)
+            await driver_connection.add_listener(self.channel, self._on_notification)
+        except Exception:
+            self._listener_driver_connection = None
+            await connection.invalidate()
+            raise
+        self._listener_connection = connection
+
+    async def _watch_listener(self) -> None:
+        while True:
+            # A half-open TCP connection is never reported as terminated, so the listener
+            # is also probed when nothing has happened for a while.
+            try:
+                await asyncio.wait_for(self._listener_lost.wait(), LISTENER_HEALTH_CHECK_INTERVAL)
+            except asyncio.TimeoutError:
+                if await self._listener_is_alive():
+                    continue
+            await self._reconnect_listener()
+
+    async def _listener_is_alive(self) -> bool:
+        # Straight through the driver: a SQLAlchemy-level query would leave a transaction
+        # open, and notifications are not delivered to a session inside a transaction.
+        try:
+            await self._listener_driver_connection.execute("SELECT 1")
+        except Exception:
+            return False
+        return True
+
+    async def _reconnect_listener(self) -> None:
+        _logger.warning("Соединение LISTEN канала %s потеряно, переподключение", self.channel)
+        connection, self._listener_connection = self._listener_connection, None
+        self._listener_driver_connection = None
+        try:
+            await connection.invalidate()
+        except Exception:
+            pass
+
+        for attempt in itertools.count():
+            try:
+                await self._listen()
+                break
+            except Exception:
+                delay = LISTENER_RECONNECT_DELAYS[min(attempt, len(LISTENER_RECONNECT_DELAYS) - 1)]
+                _logger.warning(
+                    "Не удалось переподключиться к каналу %s, повтор через %s с",
+                    self.channel,
+                    delay,
+                    exc_info=True,
+                )
+                await asyncio.sleep(delay)
+
+        # Notifications sent while nobody was listening are gone, so every local client
+        # reloads its layer instead of silently missing them.
+        self.connection_manager.resync_all()
+
+    async def _publish_events(self) -> None:
+        # One task sends the events of this worker, in the order they were queued.
+        while True:
+            layer_id, frame, extent = await self._publishes.get()
+            try:
+                await self._publish_safely(layer_id, frame, extent)
+                # Subscribers of a layer whose events were dropped reload it, once the
+                # events queued before the loss have gone out.
+                while self._lost_layers and self._publishes.empty():
+                    lost_layer_id = self._lost_layers.pop()
+                    resync = {"type": "resync_required", "layerId": str(lost_layer_id)}
+                    await self._publish_safely(lost_layer_id, encode_event(resync))
+            finally:
+                self._publishes.task_done()
+
+    async def _publish_safely(self, layer_id: UUID, frame: str, extent: Bbox | None = None) -> None:
+        try:
+            await self.publish(layer_id, frame, extent)
+        except Exception:
+            _logger.warning("Не удалось опубликовать событие слоя %s", layer_id, exc_info=True)
+
+    async def _relay_notifications(self) -> None:
+        while True:
+            payload = await self._notifications.get()
+            try:
+                await self.relay_notification(payload)
+            except Exception:
+                _logger.warning("Не удалось доставить событие слоя подписчикам", exc_info=True)
+
+
+# "<layer id>[@<extent>]:<frame>" carries the frame inline, "<layer id>[@<extent>]#<id>"
+# refers to a row of realtime_events.
+NOTIFICATION_PATTERN = re.compile(r"([0-9a-f-]{36})(?:@([^:#]+))?([:#])(.*)", re.DOTALL)
+
+
+def format_notification(
+    layer_id: UUID,
+    extent: Bbox | None = None,
+    frame: str | None = None,
+    event_id: int | None = None,
+) -> str:
+    header = str(layer_id)
+    if extent is not None:
+        header += f"@{extent.min_lon!r},{extent.min_lat!r},{extent.max_lon!r},{extent.max_lat!r}"
+    if frame is not None:
+        return f"{header}:{frame}"
+    return f"{header}#{event_id}"
+
+
+def parse_notification(payload: str) -> tuple[UUID, Bbox | None, str | None, int | None]:
+    layer_id, raw_extent, kind, body = NOTIFICATION_PATTERN.fullmatch(payload).groups()
+    extent = Bbox(*map(float, raw_extent.split(","))) if raw_extent else None
+    if kind == ":":
+        return UUID(layer_id), extent, body, None
+    return UUID(layer_id), extent, None, int(body)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Hashable, Iterator
+
+from utility_service.domain_services.bbox import Bbox, bboxes_intersect
+
+# Subscriptions are bucketed into cells of the coarsest frontend grid step; a viewport
+# spanning more cells than this is kept aside and checked against every event instead.
+VIEWPORT_INDEX_STEP = 0.2
+MAX_INDEXED_CELLS = 4096
+
+
+class ViewportIndex:
+    def __init__(self, step: float = VIEWPORT_INDEX_STEP) -> None:
+        self.step = step
+        self._viewports: dict[Hashable, list[Bbox]] = {}
+        self._cells: dict[tuple[int, int], set[Hashable]] = defaultdict(set)
+        self._wide: set[Hashable] = set()
+
+    def set(self, key: Hashable, viewport: list[Bbox]) -> None:
+        self.remove(key)
+        self._viewports[key] = viewport
+        if sum(self._count_cells(bbox) for bbox in viewport) > MAX_INDEXED_CELLS:
+            self._wide.add(key)
+            return
+        for cell in {cell for bbox in viewport for cell in self._iter_cells(bbox)}:
+            self._cells[cell].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        viewport = self._viewports.pop(key, None)
+        if viewport is None:
+            return
+        if key in self._wide:
+            self._wide.discard(key)
+            return
+        for cell in {cell for bbox in viewport for cell in self._iter_cells(bbox)}:
+            keys = self._cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+
+    def query(self, extent: Bbox) -> set[Hashable]:
+        if self._count_cells(extent) > len(self._cells):
+            candidates = set(self._viewports)
+        else:
+            candidates = set(self._wide)
+            for cell in self._iter_cells(extent):
+                candidates.update(self._cells.get(cell, ()))
+        return {
+            key
+            for key in candidates
+            if any(bboxes_intersect(bbox, extent) for bbox in self._viewports[key])
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._viewports
+
+    def __len__(self) -> int:
+        return len(self._viewports)
+
+    def _cell_range(self, bbox: Bbox) -> tuple[range, range]:
+        return (
+            range(math.floor(bbox.min_lon / self.step), math.floor(bbox.max_lon / self.step) + 1),
+            range(math.floor(bbox.min_lat / self.step), math.floor(bbox.max_lat / self.step) + 1),
+        )
+
+    def _count_cells(self, bbox: Bbox) -> int:
+        xs, ys = self._cell_range(bbox)
+        return len(xs) * len(ys)
+
+    def _iter_cells(self, bbox: Bbox) -> Iterator[tuple[int, int]]:
+        xs, ys = self._cell_range(bbox)
+        return ((x, y) for x in xs for y in ys)
@@ -20,6 +20,7 @@ from utility_service.use_cases.domain.exceptions.websocket_ticket_error import (
 )
 from utility_service.use_cases.dtos import AuthUserDTO
 from utility_service.use_cases.schemas.realtime import WebSocketTicketOut
+from utility_service.use_cases.services.layer_registry import LayerRegistry
 from utility_service.use_cases.services.realtime_connection_manager import WebSocketUserContext
 from utility_service.utils.settings import settings
 
@@ -39,11 +40,13 @@ class WebSocketTicketService:
         layer_repository: LayerRepository,
         user_repository: UserRepository,
         ticket_ttl_seconds: int | None = None,
+        layer_registry: LayerRegistry | None = None,
     ):
         self.session = session
         self.ticket_repository = ticket_repository
         self.layer_repository = layer_repository
         self.user_repository = user_repository
+        self.layer_registry = layer_registry
         self.ticket_ttl_seconds = (
             ticket_ttl_seconds
             if ticket_ttl_seconds is not None
@@ -65,7 +68,12 @@ class WebSocketTicketService:
             )
 
         async with self.session.begin():
-            layer = await self.layer_repository.get_layer_by_id(layer_id)
+            if self.layer_registry is None:
+                layer = await self.layer_repository.get_layer_by_id(layer_id)
+            else:
+                layer = await self.layer_registry.get_or_load(
+                    layer_id, self.layer_repository.get_layer_by_id
+                )
             if layer is None:
                 raise AuthApiError(
                     status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,89 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from utility_service.domain_services.bbox import Bbox
+from utility_service.use_cases.schemas.feature.feature_out import FeatureOut
+from utility_service.use_cases.services.feature_event_coalescer import FeatureEventCoalescer
+from utility_service.use_cases.services.feature_realtime_publisher import FeatureRealtimePublisher
+
+POINT_GEOMETRY = {"type": "Point", "coordinates": (37.6, 55.7)}
+
+
+def build_feature(feature_id=None, version: int = 1) -> FeatureOut:
+    return FeatureOut(
+        id=feature_id or uuid4(),
+        version=version,
+        properties={"version": version},
+        geometry=POINT_GEOMETRY,
+    )
+
+
+def test_coalescer_sends_latest_update_of_each_feature_as_one_batch() -> None:
+    event_bus = AsyncMock()
+    coalescer = FeatureEventCoalescer(FeatureRealtimePublisher(event_bus), window_seconds=0.01)
+    publisher = FeatureRealtimePublisher(event_bus, coalescer)
+    layer_id = uuid4()
+    feature_id = uuid4()
+
+    async def scenario() -> None:
+        for version in range(1, 6):
+            await publisher.publish_feature_updated(
+                layer_id, build_feature(feature_id, version), Bbox(37.0, 55.0, 37.1, 55.1)
+            )
+        event_bus.broadcast_to_layer.assert_not_awaited()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+
+    event_bus.broadcast_to_layer.assert_awaited_once()
+    sent_layer_id, event, extent = event_bus.broadcast_to_layer.await_args.args
+    assert sent_layer_id == layer_id
+    assert event["type"] == "features_batch"
+    assert [feature["version"] for feature in event["updated"]] == [5]
+    assert event["created"] == []
+    assert event["deleted"] == []
+    assert extent == Bbox(37.0, 55.0, 37.1, 55.1)
+
+
+def test_coalescer_folds_updates_and_deletes_into_created_features() -> None:
+    publisher = AsyncMock()
+    coalescer = FeatureEventCoalescer(publisher, window_seconds=60)
+    layer_id = uuid4()
+    created = build_feature()
+    transient = build_feature()
+    updated = build_feature(version=2)
+
+    async def scenario() -> None:
+        coalescer.add(layer_id, created=[created, transient], extent=Bbox(1.0, 1.0, 2.0, 2.0))
+        coalescer.add(layer_id, updated=[build_feature(created.id, 2), updated])
+        coalescer.add(layer_id, deleted=[transient.id, updated.id], extent=Bbox(0.0, 0.0, 1.0, 1.0))
+        await coalescer.close()
+
+    asyncio.run(scenario())
+
+    publisher.publish_features_batch.assert_awaited_once()
+    _, sent_created, sent_updated, sent_deleted, extent = (
+        publisher.publish_features_batch.await_args.args
+    )
+    assert [(feature.id, feature.version) for feature in sent_created] == [(created.id, 2)]
+    assert sent_updated == []
+    assert sent_deleted == [updated.id]
+    # The update came without an extent, so the batch goes to every subscriber.
+    assert extent is None
+
+
+def test_coalescer_drops_window_when_all_changes_cancel_out() -> None:
+    publisher = AsyncMock()
+    coalescer = FeatureEventCoalescer(publisher, window_seconds=60)
+    layer_id = uuid4()
+    feature = build_feature()
+
+    async def scenario() -> None:
+        coalescer.add(layer_id, created=[feature])
+        coalescer.add(layer_id, deleted=[feature.id])
+        await coalescer.close()
+
+    asyncio.run(scenario())
+
+    publisher.publish_features_batch.assert_not_awaited()
@@ -0,0 +1,85 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from utility_service.infrastructure.postgresql.repositories.layer_repository import LayerRepository
+from utility_service.use_cases.domain.exceptions.layer_not_found_exception import (
+    LayerNotFoundException,
+)
+from utility_service.use_cases.services.feature_export_service import FeatureExportService
+
+
+class DummySession:
+    opened = 0
+
+    def __init__(self):
+        DummySession.opened += 1
+        self.execution_options = None
+        self.closed = False
+
+    async def connection(self, execution_options=None):
+        self.execution_options = execution_options
+
+    async def close(self):
+        self.closed = True
+
+
+def test_export_features_reads_revision_and_rows_in_one_snapshot(monkeypatch) -> None:
+    layer = SimpleNamespace(id=uuid4(), name="parcels", revision=42, storage_table="feature_points")
+    batches = [
+        [SimpleNamespace(feature_json='{"id":"a"}'), SimpleNamespace(feature_json='{"id":"b"}')],
+        [SimpleNamespace(feature_json='{"id":"c"}')],
+    ]
+
+    sessions = []
+
+    async def get_layer_by_id(self, layer_id):
+        sessions.append(self.session)
+        return layer
+
+    async def stream_layer_features(self, streamed_layer, fetch_rows):
+        assert self.session is sessions[0]
+        assert streamed_layer is layer
+        assert fetch_rows == 2
+        for batch in batches:
+            yield batch
+
+    monkeypatch.setattr(LayerRepository, "get_layer_by_id", get_layer_by_id)
+    monkeypatch.setattr(LayerRepository, "stream_layer_features", stream_layer_features)
+    DummySession.opened = 0
+    service = FeatureExportService(DummySession, fetch_rows=2)
+
+    async def run():
+        export = await service.export_features(layer.id)
+        chunks = [chunk async for chunk in export.content]
+        await export.close()
+        return export, chunks
+
+    export, chunks = asyncio.run(run())
+
+    assert export.layer_name == "parcels"
+    assert export.revision == 42
+    assert chunks == [b'{"id":"a"}\n{"id":"b"}\n', b'{"id":"c"}\n']
+    assert DummySession.opened == 1
+    assert sessions[0].execution_options == {"isolation_level": "REPEATABLE READ"}
+    assert sessions[0].closed is True
+
+
+def test_export_features_raises_layer_not_found_before_streaming(monkeypatch) -> None:
+    async def get_layer_by_id(self, layer_id):
+        return None
+
+    sessions = []
+
+    def session_factory():
+        sessions.append(DummySession())
+        return sessions[-1]
+
+    monkeypatch.setattr(LayerRepository, "get_layer_by_id", get_layer_by_id)
+    layer_id = uuid4()
+
+    with pytest.raises(LayerNotFoundException, match=str(layer_id)):
+        asyncio.run(FeatureExportService(session_factory).export_features(layer_id))
+    assert sessions[0].closed is True
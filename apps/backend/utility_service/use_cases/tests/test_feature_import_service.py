@@ -0,0 +1,95 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+from utility_service.use_cases.domain.exceptions.layer_not_found_exception import (
+    LayerNotFoundException,
+)
+from utility_service.use_cases.services.feature_import_service import FeatureImportService
+
+
+class DummyTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class DummySession:
+    def begin(self):
+        return DummyTransaction()
+
+
+def point_feature(n: int) -> dict[str, object]:
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [float(n), 1.0]},
+        "properties": {"n": n},
+    }
+
+
+async def stream(features):
+    for feature in features:
+        yield feature
+
+
+def build_service(chunk_size: int) -> tuple[FeatureImportService, AsyncMock, SimpleNamespace]:
+    layer = SimpleNamespace(id=uuid4(), geometry_type="Point", revision=3)
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.record_imported_feature_changes.return_value = 8
+    return FeatureImportService(DummySession(), repository, chunk_size), repository, layer
+
+
+def test_import_features_copies_stream_in_bounded_chunks() -> None:
+    service, repository, layer = build_service(chunk_size=2)
+
+    result = asyncio.run(
+        service.import_features(layer.id, stream(point_feature(n) for n in range(5)))
+    )
+
+    assert result.imported == 5
+    assert result.revision == 8
+    chunk_sizes = [len(call.args[1]) for call in repository.copy_features.await_args_list]
+    assert chunk_sizes == [2, 2, 1]
+    assert all(call.args[0] is layer for call in repository.copy_features.await_args_list)
+    repository.create_import_staging.assert_awaited_once()
+    repository.record_imported_feature_changes.assert_awaited_once_with(layer.id, 5)
+    assert repository.mock_calls[-1].args == (layer.id, 5)
+
+
+def test_import_features_keeps_layer_revision_for_empty_stream() -> None:
+    service, repository, layer = build_service(chunk_size=2)
+
+    result = asyncio.run(service.import_features(layer.id, stream([])))
+
+    assert result.imported == 0
+    assert result.revision == 3
+    repository.copy_features.assert_not_awaited()
+    repository.record_imported_feature_changes.assert_not_awaited()
+
+
+def test_import_features_numbers_rejected_feature_across_chunks() -> None:
+    service, repository, layer = build_service(chunk_size=2)
+    features = [point_feature(0), point_feature(1), {"type": "Feature", "geometry": None}]
+
+    with pytest.raises(BusinessValidationException, match="объекта №3"):
+        asyncio.run(service.import_features(layer.id, stream(features)))
+
+    assert repository.copy_features.await_count == 1
+    repository.record_imported_feature_changes.assert_not_awaited()
+
+
+def test_import_features_raises_layer_not_found() -> None:
+    service, repository, layer = build_service(chunk_size=2)
+    repository.get_layer_by_id.return_value = None
+
+    with pytest.raises(LayerNotFoundException, match=str(layer.id)):
+        asyncio.run(service.import_features(layer.id, stream([point_feature(0)])))
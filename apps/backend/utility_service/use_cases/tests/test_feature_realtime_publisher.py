@@ -74,3 +74,22 @@ def test_publish_feature_deleted_sends_expected_payload() -> None:
     assert payload["type"] == "feature_deleted"
     assert payload["featureId"] == str(feature_id)
     assert_common_event_fields(payload, layer_id)
+
+
+def test_publish_features_batch_sends_single_event_with_all_changes() -> None:
+    layer_id = uuid4()
+    created = build_feature()
+    updated = build_feature()
+    deleted_id = uuid4()
+    connection_manager = AsyncMock()
+    publisher = FeatureRealtimePublisher(connection_manager)
+
+    asyncio.run(publisher.publish_features_batch(layer_id, [created], [updated], [deleted_id]))
+
+    connection_manager.broadcast_to_layer.assert_awaited_once()
+    payload = connection_manager.broadcast_to_layer.await_args.args[1]
+    assert payload["type"] == "features_batch"
+    assert payload["created"] == [created.model_dump(mode="json")]
+    assert payload["updated"] == [updated.model_dump(mode="json")]
+    assert payload["deleted"] == [str(deleted_id)]
+    assert_common_event_fields(payload, layer_id)
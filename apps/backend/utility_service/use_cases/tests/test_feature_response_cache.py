@@ -0,0 +1,51 @@
+from uuid import uuid4
+
+from utility_service.domain_services.feature_grid import GridCell
+from utility_service.domain_services.geometry_rendering import FULL_GEOMETRY
+from utility_service.use_cases.services.feature_response_cache import (
+    FeatureResponseCache,
+    FeatureResponseKey,
+)
+
+
+def build_key(layer_id=None, x: int = 0) -> FeatureResponseKey:
+    return FeatureResponseKey(layer_id or uuid4(), GridCell(0.2, x, 0), 500, None, FULL_GEOMETRY)
+
+
+def test_put_replaces_entry_and_tracks_size_in_bytes() -> None:
+    cache = FeatureResponseCache(max_bytes=100)
+    key = build_key()
+
+    cache.put(key, 1, b"a" * 10)
+    cache.put(key, 2, b"b" * 20)
+
+    entry = cache.get(key)
+    assert entry.revision == 2
+    assert entry.content == b"b" * 20
+    assert cache.size_bytes == 20
+    assert len(cache) == 1
+
+
+def test_put_evicts_least_recently_used_entries_over_byte_budget() -> None:
+    cache = FeatureResponseCache(max_bytes=25)
+    first, second, third = build_key(x=1), build_key(x=2), build_key(x=3)
+    cache.put(first, 1, b"a" * 10)
+    cache.put(second, 1, b"b" * 10)
+    cache.get(first)
+
+    cache.put(third, 1, b"c" * 10)
+
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+    assert cache.get(third) is not None
+    assert cache.size_bytes == 20
+
+
+def test_put_skips_response_larger_than_budget() -> None:
+    cache = FeatureResponseCache(max_bytes=5)
+    key = build_key()
+
+    cache.put(key, 1, b"a" * 10)
+
+    assert cache.get(key) is None
+    assert cache.size_bytes == 0
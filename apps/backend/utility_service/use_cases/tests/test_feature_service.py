@@ -1,20 +1,46 @@
 ﻿import asyncio
+import json
+from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
+import shapely
 
 from utility_service.domain_services.bbox import Bbox
+from utility_service.domain_services.feature_aggregation import AggregationGrid
+from utility_service.domain_services.feature_order import ID_ORDER, FeatureOrder
+from utility_service.domain_services.geometry_rendering import FULL_GEOMETRY, GeometryRendering
+from utility_service.domain_services.nearest_query import NearestQuery
+from utility_service.domain_services.property_filter import PropertyFilter
+from utility_service.domain_services.spatial_filter import SpatialFilter
+from utility_service.domain_services.tile import TileCoordinates
+from utility_service.use_cases.domain.exceptions.change_log_pruned_exception import (
+    ChangeLogPrunedException,
+)
 from utility_service.use_cases.domain.exceptions.feature_not_found_exception import (
     FeatureNotFoundException,
 )
+from utility_service.use_cases.domain.exceptions.layer_not_found_exception import (
+    LayerNotFoundException,
+)
 from utility_service.use_cases.domain.exceptions.version_mismatch_exception import (
     VersionMismatchException,
 )
+from utility_service.use_cases.schemas.feature.batch_features_request import BatchFeaturesRequest
 from utility_service.use_cases.schemas.feature.create_feature_in import CreateFeatureIn
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
 from utility_service.use_cases.schemas.feature.delete_feature_request import DeleteFeatureRequest
+from utility_service.use_cases.schemas.feature.feature_changes_out import FeatureChangesOut
+from utility_service.use_cases.schemas.feature.feature_collection_out import FeatureCollectionOut
+from utility_service.use_cases.schemas.feature.layer_feature_collections_out import (
+    LayerFeatureCollectionsOut,
+)
 from utility_service.use_cases.schemas.feature.patch_feature_request import PatchFeatureRequest
+from utility_service.use_cases.services.feature_response_cache import FeatureResponseCache
 from utility_service.use_cases.services.feature_service import FeatureService
 
 
@@ -41,6 +67,17 @@ UPDATED_POLYGON_GEOMETRY = {
 }
 
 
+def feature_json_row(feature_id, version: int, properties: dict[str, object]) -> SimpleNamespace:
+    feature = {
+        "id": str(feature_id),
+        "type": "Feature",
+        "version": version,
+        "geometry": POLYGON_GEOMETRY,
+        "properties": properties,
+    }
+    return SimpleNamespace(id=feature_id, feature_json=json.dumps(feature))
+
+
 def test_get_feature_raises_feature_not_found_when_repository_returns_none() -> None:
     layer_id = uuid4()
     feature_id = uuid4()
@@ -58,6 +95,24 @@ def test_get_feature_raises_feature_not_found_when_repository_returns_none() ->
         asyncio.run(service.get_feature(layer_id, feature_id))
 
 
+def test_get_feature_json_returns_projected_feature_or_raises_not_found() -> None:
+    layer = SimpleNamespace(id=uuid4(), geometry_type="Point", storage_table="feature_points")
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.get_feature_json.return_value = '{"geometry":null,"properties":{"dn":110}}'
+    service = FeatureService(session=None, layer_repository=repository)
+    rendering = GeometryRendering(geometry=False, fields=("dn",))
+    feature_id = uuid4()
+
+    content = asyncio.run(service.get_feature_json(layer.id, feature_id, rendering))
+
+    repository.get_feature_json.assert_awaited_once_with(layer, feature_id, rendering)
+    assert json.loads(content) == {"geometry": None, "properties": {"dn": 110}}
+    repository.get_feature_json.return_value = None
+    with pytest.raises(FeatureNotFoundException, match=str(feature_id)):
+        asyncio.run(service.get_feature_json(layer.id, feature_id, rendering))
+
+
 def test_get_features_from_bbox_returns_meta_with_truncation_flag() -> None:
     layer_id = uuid4()
     layer = SimpleNamespace(
@@ -66,18 +121,15 @@ def test_get_features_from_bbox_returns_meta_with_truncation_flag() -> None:
         storage_table="polygon_features",
     )
     bbox = Bbox(min_lon=10.0, min_lat=20.0, max_lon=30.0, max_lat=40.0)
-    row = SimpleNamespace(
-        id=uuid4(),
-        version=2,
-        properties={"name": "A"},
-        geometry_data=POLYGON_GEOMETRY,
-    )
+    row = feature_json_row(uuid4(), version=2, properties={"name": "A"})
     repository = AsyncMock()
     repository.get_layer_by_id.return_value = layer
     repository.list_features_bbox.return_value = ([row], True, str(row.id))
     service = FeatureService(session=None, layer_repository=repository)
 
-    result = asyncio.run(service.get_features_from_bbox(layer_id, bbox, 500))
+    result = FeatureCollectionOut.model_validate_json(
+        asyncio.run(service.get_features_from_bbox(layer_id, bbox, 500))
+    )
 
     assert result.meta.bbox == (10.0, 20.0, 30.0, 40.0)
     assert result.meta.limit == 500
@@ -88,6 +140,36 @@ def test_get_features_from_bbox_returns_meta_with_truncation_flag() -> None:
     assert len(result.features) == 1
 
 
+def test_get_features_from_bbox_splices_database_feature_json_without_reencoding() -> None:
+    layer_id = uuid4()
+    layer = SimpleNamespace(
+        id=layer_id,
+        geometry_type="Polygon",
+        storage_table="polygon_features",
+    )
+    bbox = Bbox(min_lon=10.0, min_lat=20.0, max_lon=30.0, max_lat=40.0)
+    first = feature_json_row(uuid4(), version=1, properties={"name": "A"})
+    second = feature_json_row(uuid4(), version=4, properties={"name": "B"})
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.list_features_bbox.return_value = ([first, second], False, None)
+    service = FeatureService(session=None, layer_repository=repository)
+
+    content = asyncio.run(service.get_features_from_bbox(layer_id, bbox, None))
+
+    assert content.startswith(
+        f'{{"type":"FeatureCollection","features":[{first.feature_json},'
+        f"{second.feature_json}]".encode()
+    )
+    payload = json.loads(content)
+    assert [feature["properties"] for feature in payload["features"]] == [
+        {"name": "A"},
+        {"name": "B"},
+    ]
+    assert payload["meta"]["returned"] == 2
+    assert payload["meta"]["limit"] == 500
+
+
 def test_get_features_from_bbox_passes_after_id_to_repository() -> None:
     layer_id = uuid4()
     after_id = uuid4()
@@ -104,7 +186,387 @@ def test_get_features_from_bbox_passes_after_id_to_repository() -> None:
 
     asyncio.run(service.get_features_from_bbox(layer_id, bbox, 250, after_id))
 
-    repository.list_features_bbox.assert_awaited_once_with(layer, bbox, 250, after_id)
+    repository.list_features_bbox.assert_awaited_once_with(
+        layer, bbox, 250, after_id, FULL_GEOMETRY, (), ID_ORDER
+    )
+
+
+def test_get_layers_features_from_bbox_splices_collection_per_layer() -> None:
+    first = SimpleNamespace(id=uuid4(), geometry_type="Point", storage_table="feature_points")
+    second = SimpleNamespace(id=uuid4(), geometry_type="Polygon", storage_table="feature_polygons")
+    row = feature_json_row(uuid4(), version=1, properties={"name": "A"})
+    after_id = uuid4()
+    bbox = Bbox(min_lon=10.0, min_lat=20.0, max_lon=30.0, max_lat=40.0)
+    repository = AsyncMock()
+    repository.get_layer_by_id.side_effect = [first, second]
+    repository.list_layers_features_bbox.return_value = {
+        first.id: ([row], True, str(row.id)),
+        second.id: ([], False, None),
+    }
+    service = FeatureService(session=None, layer_repository=repository)
+
+    content = asyncio.run(
+        service.get_layers_features_from_bbox([first.id, second.id], bbox, 1, {second.id: after_id})
+    )
+
+    repository.list_layers_features_bbox.assert_awaited_once_with(
+        [first, second], bbox, 1, {second.id: after_id}, FULL_GEOMETRY
+    )
+    result = LayerFeatureCollectionsOut.model_validate_json(content)
+    assert result.layers[first.id].meta.next_cursor == f"{first.id}:{row.id}"
+    assert result.layers[second.id].meta.next_cursor is None
+    assert result.layers[first.id].features[0].id == row.id
+    assert result.layers[second.id].meta.returned == 0
+
+
+def test_get_layers_features_from_bbox_raises_layer_not_found_for_missing_layer() -> None:
+    missing_id = uuid4()
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = None
+    service = FeatureService(session=None, layer_repository=repository)
+    bbox = Bbox(min_lon=10.0, min_lat=20.0, max_lon=30.0, max_lat=40.0)
+
+    with pytest.raises(LayerNotFoundException, match=str(missing_id)):
+        asyncio.run(service.get_layers_features_from_bbox([missing_id], bbox, None))
+
+    repository.list_layers_features_bbox.assert_not_awaited()
+
+
+def test_get_feature_aggregate_builds_cells_and_totals() -> None:
+    layer = SimpleNamespace(id=uuid4(), geometry_type="Point", storage_table="feature_points")
+    row = SimpleNamespace(
+        x=150,
+        y=102,
+        count=4,
+        min_lon=31.0,
+        min_lat=53.0,
+        max_lon=32.0,
+        max_lat=54.0,
+        lon=31.5,
+        lat=53.5,
+    )
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.aggregate_features_bbox.return_value = [row]
+    service = FeatureService(session=None, layer_repository=repository)
+    bbox = Bbox(min_lon=30.0, min_lat=50.0, max_lon=40.0, max_lat=60.0)
+    grid = AggregationGrid(zoom=6, cell_size=1.40625)
+
+    result = asyncio.run(service.get_feature_aggregate(layer.id, bbox, grid))
+
+    repository.aggregate_features_bbox.assert_awaited_once_with(layer, bbox, grid)
+    assert result.cells[0].extent == (31.0, 53.0, 32.0, 54.0)
+    assert result.cells[0].point == (31.5, 53.5)
+    assert result.meta.cells == 1
+    assert result.meta.features == 4
+    assert result.meta.cell_size == 1.40625
+
+
+def test_get_features_in_filter_reports_filter_bounds_as_bbox() -> None:
+    layer = SimpleNamespace(id=uuid4(), geometry_type="Point", storage_table="feature_points")
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.list_features_filter.return_value = ([], False, None)
+    service = FeatureService(session=None, layer_repository=repository)
+    spatial_filter = SpatialFilter(b"wkb", 100.0, Bbox(30.0, 50.0, 32.0, 53.0))
+
+    result = json.loads(asyncio.run(service.get_features_in_filter(layer.id, spatial_filter, None)))
+
+    repository.list_features_filter.assert_awaited_once_with(
+        layer, spatial_filter, 500, None, FULL_GEOMETRY, ()
+    )
+    assert result["meta"]["bbox"] == [30.0, 50.0, 32.0, 53.0]
+    assert result["features"] == []
+
+
+def test_get_nearest_features_splices_rows_and_lists_distances() -> None:
+    layer = SimpleNamespace(id=uuid4(), geometry_type="Point", storage_table="feature_points")
+    rows = [
+        SimpleNamespace(id=uuid4(), feature_json='{"type":"Feature","id":"a"}', distance=3.5),
+        SimpleNamespace(id=uuid4(), feature_json='{"type":"Feature","id":"b"}', distance=12.0),
+    ]
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.list_nearest_features.return_value = rows
+    service = FeatureService(session=None, layer_repository=repository)
+    query = NearestQuery(lon=37.6, lat=55.7, k=2, max_distance=100.0)
+
+    result = json.loads(asyncio.run(service.get_nearest_features(layer.id, query)))
+
+    repository.list_nearest_features.assert_awaited_once_with(layer, query)
+    assert [feature["id"] for feature in result["features"]] == ["a", "b"]
+    assert result["meta"]["distances"] == [3.5, 12.0]
+    assert result["meta"]["sort"] == "distance:asc"
+    assert result["meta"]["point"] == [37.6, 55.7]
+
+
+def build_cached_bbox_service(revision: int) -> tuple[FeatureService, AsyncMock, SimpleNamespace]:
+    layer = SimpleNamespace(
+        id=uuid4(),
+        geometry_type="Polygon",
+        storage_table="polygon_features",
+    )
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.get_layer_revision.return_value = revision
+    repository.list_features_bbox.return_value = ([], False, None)
+    service = FeatureService(
+        session=None,
+        layer_repository=repository,
+        response_cache=FeatureResponseCache(max_bytes=1024 * 1024),
+    )
+    return service, repository, layer
+
+
+GRID_BBOX = Bbox(min_lon=37.6, min_lat=55.6, max_lon=37.8, max_lat=55.8)
+
+
+def test_get_features_from_bbox_serves_grid_cell_from_cache_for_same_revision() -> None:
+    service, repository, layer = build_cached_bbox_service(revision=5)
+
+    first = asyncio.run(service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=5))
+    second = asyncio.run(service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=5))
+
+    assert first == second
+    repository.list_features_bbox.assert_awaited_once()
+    repository.has_feature_changes_bbox.assert_not_awaited()
+
+
+def test_get_features_from_bbox_caches_filtered_cells_under_their_own_key() -> None:
+    service, repository, layer = build_cached_bbox_service(revision=5)
+    active = (PropertyFilter("status", "eq", ("active",)),)
+
+    asyncio.run(service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=5))
+    asyncio.run(
+        service.get_features_from_bbox(
+            layer.id, GRID_BBOX, 500, revision=5, property_filters=active
+        )
+    )
+    asyncio.run(
+        service.get_features_from_bbox(
+            layer.id, GRID_BBOX, 500, revision=5, property_filters=active
+        )
+    )
+
+    assert repository.list_features_bbox.await_count == 2
+    assert repository.list_features_bbox.await_args.args[-2] == active
+
+
+def test_get_features_from_bbox_restamps_cached_cell_without_intersecting_changes() -> None:
+    service, repository, layer = build_cached_bbox_service(revision=5)
+    repository.has_feature_changes_bbox.return_value = False
+    asyncio.run(service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=5))
+
+    asyncio.run(service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=8))
+    asyncio.run(service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=8))
+
+    repository.list_features_bbox.assert_awaited_once()
+    repository.has_feature_changes_bbox.assert_awaited_once_with(layer, GRID_BBOX, 5, 8)
+
+
+def test_get_features_from_bbox_reloads_cached_cell_after_intersecting_change() -> None:
+    service, repository, layer = build_cached_bbox_service(revision=5)
+    repository.has_feature_changes_bbox.return_value = True
+    asyncio.run(service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=5))
+
+    asyncio.run(service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=6))
+
+    assert repository.list_features_bbox.await_count == 2
+
+
+def test_get_features_from_bbox_does_not_cache_bbox_outside_grid() -> None:
+    service, repository, layer = build_cached_bbox_service(revision=5)
+    bbox = Bbox(min_lon=37.61, min_lat=55.6, max_lon=37.8, max_lat=55.8)
+
+    asyncio.run(service.get_features_from_bbox(layer.id, bbox, 500, revision=5))
+    asyncio.run(service.get_features_from_bbox(layer.id, bbox, 500, revision=5))
+
+    assert repository.list_features_bbox.await_count == 2
+    assert len(service.response_cache) == 0
+
+
+def test_get_features_from_bbox_caches_spatial_order_separately() -> None:
+    service, repository, layer = build_cached_bbox_service(revision=5)
+    spatial = FeatureOrder("spatial")
+
+    asyncio.run(service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=5))
+    result = FeatureCollectionOut.model_validate_json(
+        asyncio.run(
+            service.get_features_from_bbox(layer.id, GRID_BBOX, 500, revision=5, order=spatial)
+        )
+    )
+
+    assert repository.list_features_bbox.await_count == 2
+    assert repository.list_features_bbox.await_args.args[-1] == spatial
+    assert result.meta.sort == "spatial:asc"
+
+
+def test_get_features_from_bbox_marks_simplified_geometry_in_meta() -> None:
+    layer_id = uuid4()
+    layer = SimpleNamespace(
+        id=layer_id,
+        geometry_type="Polygon",
+        storage_table="polygon_features",
+    )
+    bbox = Bbox(min_lon=10.0, min_lat=20.0, max_lon=30.0, max_lat=40.0)
+    rendering = GeometryRendering(tolerance=0.001, precision=6)
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.list_features_bbox.return_value = ([], False, None)
+    service = FeatureService(session=None, layer_repository=repository)
+
+    result = FeatureCollectionOut.model_validate_json(
+        asyncio.run(service.get_features_from_bbox(layer_id, bbox, 250, None, rendering))
+    )
+
+    repository.list_features_bbox.assert_awaited_once_with(
+        layer, bbox, 250, None, rendering, (), ID_ORDER
+    )
+    assert result.meta.simplified is True
+    assert result.meta.tolerance == 0.001
+    assert result.meta.precision == 6
+
+
+def test_get_layer_tile_returns_tile_built_by_repository() -> None:
+    layer_id = uuid4()
+    layer = SimpleNamespace(
+        id=layer_id,
+        geometry_type="Polygon",
+        storage_table="polygon_features",
+    )
+    tile = TileCoordinates(z=13, x=5700, y=2600)
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.get_layer_tile.return_value = b"mvt"
+    service = FeatureService(session=None, layer_repository=repository)
+
+    result = asyncio.run(service.get_layer_tile(layer_id, tile))
+
+    assert result == b"mvt"
+    repository.get_layer_tile.assert_awaited_once_with(layer, tile)
+
+
+def test_get_layer_tile_raises_layer_not_found_for_unknown_layer() -> None:
+    layer_id = uuid4()
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = None
+    service = FeatureService(session=None, layer_repository=repository)
+
+    with pytest.raises(LayerNotFoundException, match=str(layer_id)):
+        asyncio.run(service.get_layer_tile(layer_id, TileCoordinates(z=0, x=0, y=0)))
+
+    repository.get_layer_tile.assert_not_awaited()
+
+
+def test_get_feature_changes_splits_changed_features_and_tombstones() -> None:
+    layer_id = uuid4()
+    changed_id = uuid4()
+    deleted_id = uuid4()
+    layer = SimpleNamespace(id=layer_id)
+    changed_row = feature_json_row(changed_id, 2, {"name": "Changed"})
+    changed_row.revision = 7
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.get_layer_revision.return_value = 9
+    repository.get_pruned_revision.return_value = 0
+    repository.list_feature_changes_bbox.return_value = (
+        [changed_row, SimpleNamespace(id=deleted_id, revision=8, feature_json=None)],
+        False,
+    )
+    service = FeatureService(session=None, layer_repository=repository)
+    bbox = Bbox(10.0, 20.0, 30.0, 40.0)
+
+    result = asyncio.run(service.get_feature_changes(layer_id, bbox, 5, None, None))
+
+    changes = FeatureChangesOut.model_validate_json(result)
+    assert [feature.id for feature in changes.features] == [changed_id]
+    assert changes.deleted == [deleted_id]
+    assert changes.meta.since_revision == 5
+    assert changes.meta.revision == 9
+    repository.list_feature_changes_bbox.assert_awaited_once_with(layer, bbox, 5, 500)
+
+
+def test_get_feature_changes_continues_from_last_revision_when_truncated() -> None:
+    layer_id = uuid4()
+    since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    layer = SimpleNamespace(id=layer_id)
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.get_layer_revision.return_value = 20
+    repository.get_revision_at.return_value = 3
+    repository.get_pruned_revision.return_value = 2
+    repository.list_feature_changes_bbox.return_value = (
+        [SimpleNamespace(id=uuid4(), revision=4, feature_json=None)],
+        True,
+    )
+    service = FeatureService(session=None, layer_repository=repository)
+
+    result = asyncio.run(
+        service.get_feature_changes(layer_id, Bbox(10.0, 20.0, 30.0, 40.0), None, since, 1)
+    )
+
+    changes = FeatureChangesOut.model_validate_json(result)
+    assert changes.meta.truncated is True
+    assert changes.meta.since_revision == 3
+    assert changes.meta.revision == 4
+    repository.get_revision_at.assert_awaited_once_with(layer_id, since)
+
+
+def test_get_feature_changes_requires_resync_when_log_was_pruned_past_cursor() -> None:
+    layer_id = uuid4()
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = SimpleNamespace(id=layer_id)
+    repository.get_layer_revision.return_value = 40
+    repository.get_pruned_revision.return_value = 12
+    service = FeatureService(session=None, layer_repository=repository)
+
+    with pytest.raises(ChangeLogPrunedException) as error:
+        asyncio.run(
+            service.get_feature_changes(layer_id, Bbox(10.0, 20.0, 30.0, 40.0), 11, None, None)
+        )
+
+    assert error.value.pruned_revision == 12
+    repository.list_feature_changes_bbox.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ("since_revision", "since"),
+    [(None, None), (1, datetime(2026, 1, 1, tzinfo=timezone.utc)), (-1, None)],
+)
+def test_get_feature_changes_requires_single_valid_cursor(
+    since_revision: int | None, since: datetime | None
+) -> None:
+    repository = AsyncMock()
+    service = FeatureService(session=None, layer_repository=repository)
+
+    with pytest.raises(BusinessValidationException):
+        asyncio.run(
+            service.get_feature_changes(
+                uuid4(), Bbox(10.0, 20.0, 30.0, 40.0), since_revision, since, None
+            )
+        )
+
+    repository.list_feature_changes_bbox.assert_not_awaited()
+
+
+def test_get_layer_revision_returns_revision_from_repository() -> None:
+    layer_id = uuid4()
+    repository = AsyncMock()
+    repository.get_layer_revision.return_value = 42
+    service = FeatureService(session=None, layer_repository=repository)
+
+    assert asyncio.run(service.get_layer_revision(layer_id)) == 42
+    repository.get_layer_revision.assert_awaited_once_with(layer_id)
+
+
+def test_get_layer_revision_raises_layer_not_found_for_unknown_layer() -> None:
+    layer_id = uuid4()
+    repository = AsyncMock()
+    repository.get_layer_revision.return_value = None
+    service = FeatureService(session=None, layer_repository=repository)
+
+    with pytest.raises(LayerNotFoundException, match=str(layer_id)):
+        asyncio.run(service.get_layer_revision(layer_id))
 
 
 def test_create_feature_returns_geometry_and_properties_from_request() -> None:
@@ -117,7 +579,7 @@ def test_create_feature_returns_geometry_and_properties_from_request() -> None:
     )
     repository = AsyncMock()
     repository.get_layer_by_id.return_value = layer
-    repository.create_feature.return_value = SimpleNamespace(id=created_id, version=1)
+    repository.create_feature.return_value = SimpleNamespace(id=created_id, version=1, extent=None)
     service = FeatureService(session=DummySession(), layer_repository=repository)
     request = CreateFeatureIn(geometry=POLYGON_GEOMETRY, properties={"name": "Created"})
 
@@ -139,7 +601,7 @@ def test_create_feature_publishes_created_event_after_success() -> None:
     )
     repository = AsyncMock()
     repository.get_layer_by_id.return_value = layer
-    repository.create_feature.return_value = SimpleNamespace(id=created_id, version=1)
+    repository.create_feature.return_value = SimpleNamespace(id=created_id, version=1, extent=None)
     publisher = AsyncMock()
     service = FeatureService(
         session=DummySession(),
@@ -151,7 +613,7 @@ def test_create_feature_publishes_created_event_after_success() -> None:
     result = asyncio.run(service.create_feature(layer_id, request))
 
     assert result.id == created_id
-    publisher.publish_feature_created.assert_awaited_once_with(layer_id, result)
+    publisher.publish_feature_created.assert_awaited_once_with(layer_id, result, None)
 
 
 def test_create_feature_does_not_fail_when_realtime_publish_raises() -> None:
@@ -164,7 +626,7 @@ def test_create_feature_does_not_fail_when_realtime_publish_raises() -> None:
     )
     repository = AsyncMock()
     repository.get_layer_by_id.return_value = layer
-    repository.create_feature.return_value = SimpleNamespace(id=created_id, version=1)
+    repository.create_feature.return_value = SimpleNamespace(id=created_id, version=1, extent=None)
     publisher = AsyncMock()
     publisher.publish_feature_created.side_effect = RuntimeError("socket down")
     service = FeatureService(
@@ -180,7 +642,7 @@ def test_create_feature_does_not_fail_when_realtime_publish_raises() -> None:
     publisher.publish_feature_created.assert_awaited_once()
 
 
-def test_update_feature_uses_current_feature_for_missing_geometry() -> None:
+def test_update_feature_builds_feature_from_returned_post_update_state() -> None:
     layer_id = uuid4()
     feature_id = uuid4()
     layer = SimpleNamespace(
@@ -190,15 +652,13 @@ def test_update_feature_uses_current_feature_for_missing_geometry() -> None:
     )
     repository = AsyncMock()
     repository.get_layer_by_id.return_value = layer
-    repository.get_feature.return_value = SimpleNamespace(
+    repository.update_feature_if_version_matches.return_value = SimpleNamespace(
+        current_version=2,
         id=feature_id,
-        version=2,
-        properties={"name": "Before"},
+        version=3,
+        properties={"name": "After"},
         geometry_data=UPDATED_POLYGON_GEOMETRY,
-    )
-    repository.update_feature_if_version_matches.return_value = (
-        SimpleNamespace(id=feature_id, version=3),
-        object,
+        extent=None,
     )
     service = FeatureService(session=DummySession(), layer_repository=repository)
     request = PatchFeatureRequest(version=2, geometry=None, properties={"name": "After"})
@@ -209,6 +669,7 @@ def test_update_feature_uses_current_feature_for_missing_geometry() -> None:
     assert result.version == 3
     assert result.properties == {"name": "After"}
     assert result.geometry.model_dump(mode="python") == UPDATED_POLYGON_GEOMETRY
+    repository.get_feature.assert_not_awaited()
 
 
 def test_update_feature_publishes_updated_event_after_success() -> None:
@@ -221,15 +682,13 @@ def test_update_feature_publishes_updated_event_after_success() -> None:
     )
     repository = AsyncMock()
     repository.get_layer_by_id.return_value = layer
-    repository.get_feature.return_value = SimpleNamespace(
+    repository.update_feature_if_version_matches.return_value = SimpleNamespace(
+        current_version=2,
         id=feature_id,
-        version=2,
-        properties={"name": "Before"},
+        version=3,
+        properties={"name": "After"},
         geometry_data=UPDATED_POLYGON_GEOMETRY,
-    )
-    repository.update_feature_if_version_matches.return_value = (
-        SimpleNamespace(id=feature_id, version=3),
-        object,
+        extent=None,
     )
     publisher = AsyncMock()
     service = FeatureService(
@@ -242,7 +701,7 @@ def test_update_feature_publishes_updated_event_after_success() -> None:
     result = asyncio.run(service.update_feature(layer_id, feature_id, request))
 
     assert result.id == feature_id
-    publisher.publish_feature_updated.assert_awaited_once_with(layer_id, result)
+    publisher.publish_feature_updated.assert_awaited_once_with(layer_id, result, None)
 
 
 def test_delete_feature_publishes_deleted_event_after_success() -> None:
@@ -255,7 +714,9 @@ def test_delete_feature_publishes_deleted_event_after_success() -> None:
     )
     repository = AsyncMock()
     repository.get_layer_by_id.return_value = layer
-    repository.delete_feature_if_version_matches.return_value = (True, object)
+    repository.delete_feature_if_version_matches.return_value = SimpleNamespace(
+        current_version=3, id=feature_id, extent=None
+    )
     publisher = AsyncMock()
     service = FeatureService(
         session=DummySession(),
@@ -268,7 +729,7 @@ def test_delete_feature_publishes_deleted_event_after_success() -> None:
     )
 
     assert result.featureId == feature_id
-    publisher.publish_feature_deleted.assert_awaited_once_with(layer_id, feature_id)
+    publisher.publish_feature_deleted.assert_awaited_once_with(layer_id, feature_id, None)
 
 
 def test_update_feature_does_not_publish_event_on_version_mismatch() -> None:
@@ -281,14 +742,9 @@ def test_update_feature_does_not_publish_event_on_version_mismatch() -> None:
     )
     repository = AsyncMock()
     repository.get_layer_by_id.return_value = layer
-    repository.get_feature.return_value = SimpleNamespace(
-        id=feature_id,
-        version=2,
-        properties={"name": "Before"},
-        geometry_data=UPDATED_POLYGON_GEOMETRY,
+    repository.update_feature_if_version_matches.return_value = SimpleNamespace(
+        current_version=5, id=None
     )
-    repository.update_feature_if_version_matches.return_value = (None, object)
-    repository.get_current_version.return_value = SimpleNamespace(version=5)
     publisher = AsyncMock()
     service = FeatureService(
         session=DummySession(),
@@ -301,3 +757,150 @@ def test_update_feature_does_not_publish_event_on_version_mismatch() -> None:
         asyncio.run(service.update_feature(layer_id, feature_id, request))
 
     publisher.publish_feature_updated.assert_not_awaited()
+
+
+def test_update_feature_raises_feature_not_found_when_statement_finds_no_row() -> None:
+    layer = SimpleNamespace(id=uuid4(), geometry_type="Polygon", storage_table="polygon_features")
+    feature_id = uuid4()
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.update_feature_if_version_matches.return_value = None
+    service = FeatureService(session=DummySession(), layer_repository=repository)
+    request = PatchFeatureRequest(version=2, geometry=None, properties={"name": "After"})
+
+    with pytest.raises(FeatureNotFoundException, match=str(feature_id)):
+        asyncio.run(service.update_feature(layer.id, feature_id, request))
+
+    repository.get_feature.assert_not_awaited()
+
+
+def test_delete_feature_raises_version_mismatch_with_current_version() -> None:
+    layer = SimpleNamespace(id=uuid4(), geometry_type="Polygon", storage_table="polygon_features")
+    feature_id = uuid4()
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    repository.delete_feature_if_version_matches.return_value = SimpleNamespace(
+        current_version=4, id=None
+    )
+    service = FeatureService(session=DummySession(), layer_repository=repository)
+
+    with pytest.raises(VersionMismatchException) as error:
+        asyncio.run(service.delete_feature(layer.id, feature_id, DeleteFeatureRequest(version=3)))
+
+    assert error.value.current_version == 4
+
+
+def wkb_extent(min_lon: float, min_lat: float, max_lon: float, max_lat: float):
+    # Mirrors the hex WKBElement GeoAlchemy returns for ST_Envelope.
+    return SimpleNamespace(
+        data=shapely.to_wkb(shapely.box(min_lon, min_lat, max_lon, max_lat), hex=True)
+    )
+
+
+def build_batch_service(publisher=None):
+    layer = SimpleNamespace(id=uuid4(), geometry_type="Polygon", storage_table="polygon_features")
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    service = FeatureService(
+        session=DummySession(), layer_repository=repository, realtime_publisher=publisher
+    )
+    return service, repository, layer
+
+
+def test_apply_feature_batch_reports_per_item_results_and_publishes_once() -> None:
+    publisher = AsyncMock()
+    service, repository, layer = build_batch_service(publisher)
+    created_id, updated_id, conflict_id, deleted_id, missing_id = (uuid4() for _ in range(5))
+    repository.create_features.return_value = [
+        SimpleNamespace(id=created_id, version=1, extent=wkb_extent(10.0, 10.0, 20.0, 20.0))
+    ]
+    repository.update_features_if_versions_match.return_value = (
+        [
+            SimpleNamespace(
+                id=updated_id,
+                version=3,
+                properties={"name": "Kept"},
+                geometry_data=UPDATED_POLYGON_GEOMETRY,
+                extent=wkb_extent(15.0, 5.0, 25.0, 30.0),
+            )
+        ],
+        object,
+    )
+    repository.delete_features_if_versions_match.return_value = (
+        [SimpleNamespace(id=deleted_id, extent=wkb_extent(-5.0, 12.0, 0.0, 14.0))],
+        object,
+    )
+    repository.get_current_versions.return_value = {conflict_id: 7}
+    request = BatchFeaturesRequest(
+        operations=[
+            {"op": "create", "geometry": POLYGON_GEOMETRY, "properties": {"name": "New"}},
+            {
+                "op": "update",
+                "id": str(updated_id),
+                "version": 2,
+                "geometry": UPDATED_POLYGON_GEOMETRY,
+            },
+            {"op": "update", "id": str(conflict_id), "version": 5, "properties": {"a": 1}},
+            {"op": "delete", "id": str(deleted_id), "version": 1},
+            {"op": "delete", "id": str(missing_id), "version": 1},
+        ]
+    )
+
+    result = asyncio.run(service.apply_feature_batch(layer.id, request))
+
+    assert (result.applied, result.failed) == (3, 2)
+    assert [item.status for item in result.results] == [
+        "applied",
+        "applied",
+        "conflict",
+        "applied",
+        "not_found",
+    ]
+    assert result.results[0].featureId == created_id
+    assert result.results[1].feature.properties == {"name": "Kept"}
+    assert result.results[2].conflict.currentVersion == 7
+    assert result.results[2].conflict.requestVersion == 5
+    update_args = repository.update_features_if_versions_match.await_args.args[1]
+    assert update_args[0] == (updated_id, 2, UPDATED_POLYGON_GEOMETRY, None)
+    assert update_args[1] == (conflict_id, 5, None, {"a": 1})
+    repository.get_current_versions.assert_awaited_once_with(object, [conflict_id, missing_id])
+    publisher.publish_features_batch.assert_awaited_once()
+    _, created, updated, deleted, extent = publisher.publish_features_batch.await_args.args
+    assert [feature.id for feature in created] == [created_id]
+    assert [feature.id for feature in updated] == [updated_id]
+    assert deleted == [deleted_id]
+    assert extent == Bbox(-5.0, 5.0, 25.0, 30.0)
+    publisher.publish_feature_created.assert_not_awaited()
+
+
+def test_apply_feature_batch_raises_first_conflict_when_atomic() -> None:
+    publisher = AsyncMock()
+    service, repository, layer = build_batch_service(publisher)
+    conflict_id = uuid4()
+    repository.delete_features_if_versions_match.return_value = ([], object)
+    repository.get_current_versions.return_value = {conflict_id: 4}
+    request = BatchFeaturesRequest(
+        atomic=True, operations=[{"op": "delete", "id": str(conflict_id), "version": 3}]
+    )
+
+    with pytest.raises(VersionMismatchException) as error:
+        asyncio.run(service.apply_feature_batch(layer.id, request))
+
+    assert error.value.current_version == 4
+    publisher.publish_features_batch.assert_not_awaited()
+
+
+def test_apply_feature_batch_rejects_repeated_feature_ids() -> None:
+    service, repository, layer = build_batch_service()
+    feature_id = str(uuid4())
+    request = BatchFeaturesRequest(
+        operations=[
+            {"op": "update", "id": feature_id, "version": 1, "properties": {}},
+            {"op": "delete", "id": feature_id, "version": 2},
+        ]
+    )
+
+    with pytest.raises(BusinessValidationException, match="несколько раз"):
+        asyncio.run(service.apply_feature_batch(layer.id, request))
+
+    repository.get_layer_by_id.assert_not_awaited()
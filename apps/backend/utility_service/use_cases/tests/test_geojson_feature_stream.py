@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+import pytest
+
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
+from utility_service.use_cases.services import geojson_feature_stream
+from utility_service.use_cases.services.geojson_feature_stream import (
+    iter_feature_chunks,
+    iter_stream_features,
+)
+
+FEATURES = [
+    {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [37.6175, 55.7512]},
+        "properties": {"name": "Кремль", "floors": 12345},
+    },
+    {"type": "Feature", "geometry": {"type": "Point", "coordinates": [30.3, 59.9]}},
+]
+
+
+async def split(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def read(data: bytes, stream_format: str, size: int = 4096) -> list[object]:
+    async def collect():
+        return [feature async for feature in iter_stream_features(split(data, size), stream_format)]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 4096])
+def test_feature_collection_is_read_across_chunk_boundaries(size: int) -> None:
+    data = json.dumps(
+        {
+            "type": "FeatureCollection",
+            "name": "parcels",
+            "features": FEATURES,
+            "crs": {"type": "name", "properties": {"name": "EPSG:4326"}},
+        },
+        ensure_ascii=False,
+        indent=2,
+    ).encode()
+
+    assert read(data, "geojson", size) == FEATURES
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_ndjson_skips_blank_lines_and_reads_last_line_without_newline(size: int) -> None:
+    data = "\n".join(json.dumps(feature, ensure_ascii=False) for feature in FEATURES).encode()
+
+    assert read(b"\n" + data.replace(b"\n", b"\n\n"), "ndjson", size) == FEATURES
+
+
+def test_large_feature_is_decoded_once_across_many_chunks(monkeypatch) -> None:
+    ring = [[float(i), float(i % 7)] for i in range(2000)]
+    feature = {
+        "type": "Feature",
+        "geometry": {"type": "MultiPolygon", "coordinates": [[ring], [ring]]},
+        "properties": {"note": 'скобки ]}{[ и \\"кавычки\\" в строке'},
+    }
+    data = json.dumps({"type": "FeatureCollection", "features": [feature, FEATURES[1]]}).encode()
+    calls = []
+    decoder = geojson_feature_stream.JSON_DECODER
+
+    class CountingDecoder:
+        def raw_decode(self, text: str, pos: int):
+            calls.append(text[pos])
+            return decoder.raw_decode(text, pos)
+
+    monkeypatch.setattr(geojson_feature_stream, "JSON_DECODER", CountingDecoder())
+
+    assert read(data, "geojson", 64) == [feature, FEATURES[1]]
+    # Two keys, the collection type and each feature once, with no retries per chunk.
+    assert calls == ['"', '"', '"', "{", "{"]
+
+
+def test_empty_feature_collection_yields_nothing() -> None:
+    assert read(b'{"type": "FeatureCollection", "features": []}', "geojson") == []
+
+
+@pytest.mark.parametrize(
+    ("data", "stream_format", "message"),
+    [
+        (b'{"type": "Feature", "features": []}', "geojson", "должен содержать FeatureCollection"),
+        (b'{"type": "FeatureCollection"}', "geojson", "не содержит поле features"),
+        (b'{"type": "FeatureCollection", "features": [{"a": 1}', "geojson", "Некорректный GeoJSON"),
+        (b'{"type": "FeatureCollection", "features": [{} {}]}', "geojson", "Некорректный GeoJSON"),
+        (b'{"a": 1}\n{broken\n', "ndjson", "Строка 2 файла NDJSON"),
+    ],
+)
+def test_malformed_stream_raises_business_validation(
+    data: bytes, stream_format: str, message: str
+) -> None:
+    with pytest.raises(BusinessValidationException, match=message):
+        read(data, stream_format)
+
+
+def test_iter_feature_chunks_groups_features_by_chunk_size() -> None:
+    async def features():
+        for n in range(5):
+            yield n
+
+    async def collect():
+        return [chunk async for chunk in iter_feature_chunks(features(), 2)]
+
+    assert asyncio.run(collect()) == [[0, 1], [2, 3], [4]]
@@ -0,0 +1,124 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from utility_service.domain_services.feature_registry import get_layer_feature_model
+from utility_service.infrastructure.postgresql.models.feature_point import FeaturePoint
+from utility_service.use_cases.services.feature_service import FeatureService
+from utility_service.use_cases.services.layer_registry import LayerRegistry
+from utility_service.use_cases.services.layer_service import LayerService
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_layer(storage_table: str = "feature_points") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        name="points",
+        title="Points",
+        geometry_type="Point",
+        srid=4326,
+        storage_table=storage_table,
+    )
+
+
+def test_get_or_load_reads_layer_once_and_memoizes_feature_model() -> None:
+    layer = build_layer()
+    load = AsyncMock(return_value=layer)
+    registry = LayerRegistry(ttl_seconds=60, max_size=10)
+
+    first = asyncio.run(registry.get_or_load(layer.id, load))
+    second = asyncio.run(registry.get_or_load(layer.id, load))
+
+    assert first is second
+    assert first.storage_table == "feature_points"
+    assert get_layer_feature_model(first) is FeaturePoint
+    load.assert_awaited_once_with(layer.id)
+
+
+def test_get_or_load_does_not_cache_missing_layers() -> None:
+    layer_id = uuid4()
+    load = AsyncMock(return_value=None)
+    registry = LayerRegistry(ttl_seconds=60, max_size=10)
+
+    assert asyncio.run(registry.get_or_load(layer_id, load)) is None
+    assert asyncio.run(registry.get_or_load(layer_id, load)) is None
+    assert load.await_count == 2
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    layer = build_layer()
+    registry = LayerRegistry(ttl_seconds=30, max_size=10, clock=clock)
+    registry.put(layer)
+
+    clock.now = 29.0
+    assert registry.get(layer.id) is not None
+    clock.now = 30.0
+    assert registry.get(layer.id) is None
+    assert len(registry) == 0
+
+
+def test_least_recently_used_entry_is_evicted_when_full() -> None:
+    first, second, third = build_layer(), build_layer(), build_layer()
+    registry = LayerRegistry(ttl_seconds=60, max_size=2)
+    registry.put(first)
+    registry.put(second)
+    registry.get(first.id)
+
+    registry.put(third)
+
+    assert registry.get(first.id) is not None
+    assert registry.get(second.id) is None
+    assert registry.get(third.id) is not None
+
+
+def test_invalidate_drops_single_layer_or_everything() -> None:
+    first, second = build_layer(), build_layer()
+    registry = LayerRegistry(ttl_seconds=60, max_size=10)
+    registry.replace_all([first, second])
+
+    registry.invalidate(first.id)
+    assert registry.get(first.id) is None
+    assert registry.get(second.id) is not None
+
+    registry.invalidate()
+    assert len(registry) == 0
+
+
+def test_feature_service_uses_registry_instead_of_repository_lookup() -> None:
+    layer = build_layer()
+    registry = LayerRegistry(ttl_seconds=60, max_size=10)
+    registry.put(layer)
+    repository = AsyncMock()
+    repository.get_layer_tile.return_value = b"mvt"
+    service = FeatureService(session=None, layer_repository=repository, layer_registry=registry)
+
+    asyncio.run(service.get_layer_tile(layer.id, SimpleNamespace(z=0, x=0, y=0)))
+
+    repository.get_layer_by_id.assert_not_awaited()
+    cached_layer = repository.get_layer_tile.await_args.args[0]
+    assert cached_layer.id == layer.id
+
+
+def test_layer_service_invalidates_registry_after_changing_layer() -> None:
+    layer = build_layer()
+    registry = LayerRegistry(ttl_seconds=60, max_size=10)
+    registry.put(layer)
+    session = MagicMock()
+    session.begin.return_value.__aenter__ = AsyncMock()
+    session.begin.return_value.__aexit__ = AsyncMock(return_value=False)
+    repository = AsyncMock()
+    repository.get_layer_by_id.return_value = layer
+    service = LayerService(session, repository, registry)
+
+    asyncio.run(service.set_indexed_properties(layer.id, ["diameter"]))
+
+    assert registry.get(layer.id) is None
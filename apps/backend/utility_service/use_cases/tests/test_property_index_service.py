@@ -0,0 +1,44 @@
+import asyncio
+
+from utility_service.infrastructure.postgresql.models.feature_point import FeaturePoint
+from utility_service.use_cases.services.property_index_service import PropertyIndexService
+
+
+class FakePropertyIndexRepository:
+    def __init__(self, wanted: set[str], existing: dict[str, bool]) -> None:
+        self.wanted = wanted
+        self.existing = existing
+        self.calls: list[tuple[str, str]] = []
+
+    async def get_indexed_property_keys(self, model_type):
+        return self.wanted if model_type is FeaturePoint else set()
+
+    async def get_property_indexes(self, model_type):
+        return dict(self.existing) if model_type is FeaturePoint else {}
+
+    async def create_property_index(self, model_type, key):
+        self.calls.append(("create", key))
+
+    async def drop_property_index(self, model_type, key):
+        self.calls.append(("drop", key))
+
+
+def test_sync_keeps_index_still_listed_by_another_layer_of_the_table() -> None:
+    # "status" stays declared by another point layer, "depth" is no longer declared by any.
+    repository = FakePropertyIndexRepository(
+        wanted={"status", "diameter"}, existing={"status": True, "depth": True}
+    )
+
+    indexed = asyncio.run(PropertyIndexService(repository).sync_property_indexes())
+
+    assert repository.calls == [("drop", "depth"), ("create", "diameter")]
+    assert indexed["feature_points"] == ["diameter", "status"]
+    assert indexed["feature_polygons"] == []
+
+
+def test_sync_rebuilds_index_left_invalid_by_failed_concurrent_build() -> None:
+    repository = FakePropertyIndexRepository(wanted={"status"}, existing={"status": False})
+
+    asyncio.run(PropertyIndexService(repository).sync_property_indexes())
+
+    assert repository.calls == [("drop", "status"), ("create", "status")]
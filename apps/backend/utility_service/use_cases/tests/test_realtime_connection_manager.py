@@ -1,25 +1,46 @@
 import asyncio
+import json
 from uuid import uuid4
 
+from utility_service.domain_services.bbox import Bbox
+
+from utility_service.use_cases.services import realtime_connection_manager
 from utility_service.use_cases.services.realtime_connection_manager import (
     WebSocketConnectionManager,
     WebSocketUserContext,
+    encode_event,
 )
 
 
 class DummyWebSocket:
-    def __init__(self, fail_on_send: bool = False) -> None:
+    def __init__(self, fail_on_send: bool = False, blocked: bool = False) -> None:
         self.accepted = False
         self.sent_json: list[dict[str, object]] = []
+        self.sent_text: list[str] = []
         self.fail_on_send = fail_on_send
+        self.blocked = blocked
+        self.release: asyncio.Event | None = None
 
     async def accept(self) -> None:
         self.accepted = True
+        self.release = asyncio.Event()
+        if not self.blocked:
+            self.release.set()
 
-    async def send_json(self, payload: dict[str, object]) -> None:
+    async def send_text(self, payload: str) -> None:
         if self.fail_on_send:
             raise RuntimeError("connection lost")
-        self.sent_json.append(payload)
+        await self.release.wait()
+        self.sent_text.append(payload)
+        self.sent_json.append(json.loads(payload))
+
+
+async def wait_until_sent(manager: WebSocketConnectionManager, layer_id) -> None:
+    while any(manager.get_queue_depths(layer_id)):
+        await asyncio.sleep(0)
+    # Let the writers finish sending the events they have just taken from the queues.
+    for _ in range(3):
+        await asyncio.sleep(0)
 
 
 def build_user_context() -> WebSocketUserContext:
@@ -72,9 +93,13 @@ def test_broadcast_targets_only_requested_layer() -> None:
     second_websocket = DummyWebSocket()
     event = {"type": "connected"}
 
-    asyncio.run(manager.connect(first_layer_id, first_websocket, build_user_context()))
-    asyncio.run(manager.connect(second_layer_id, second_websocket, build_user_context()))
-    asyncio.run(manager.broadcast_to_layer(first_layer_id, event))
+    async def scenario() -> None:
+        await manager.connect(first_layer_id, first_websocket, build_user_context())
+        await manager.connect(second_layer_id, second_websocket, build_user_context())
+        await manager.broadcast_to_layer(first_layer_id, event)
+        await wait_until_sent(manager, first_layer_id)
+
+    asyncio.run(scenario())
 
     assert first_websocket.sent_json == [event]
     assert second_websocket.sent_json == []
@@ -85,7 +110,144 @@ def test_broadcast_removes_stale_connections() -> None:
     layer_id = uuid4()
     stale_websocket = DummyWebSocket(fail_on_send=True)
 
-    asyncio.run(manager.connect(layer_id, stale_websocket, build_user_context()))
-    asyncio.run(manager.broadcast_to_layer(layer_id, {"type": "connected"}))
+    async def scenario() -> None:
+        await manager.connect(layer_id, stale_websocket, build_user_context())
+        await manager.broadcast_to_layer(layer_id, {"type": "connected"})
+        await wait_until_sent(manager, layer_id)
+
+    asyncio.run(scenario())
 
     assert manager.get_connection_count(layer_id) == 0
+
+
+def test_broadcast_does_not_wait_for_slow_connection() -> None:
+    manager = WebSocketConnectionManager()
+    layer_id = uuid4()
+    slow_websocket = DummyWebSocket(blocked=True)
+    fast_websocket = DummyWebSocket()
+    event = {"type": "feature_deleted"}
+
+    async def scenario() -> None:
+        await manager.connect(layer_id, slow_websocket, build_user_context())
+        await manager.connect(layer_id, fast_websocket, build_user_context())
+        await asyncio.wait_for(manager.broadcast_to_layer(layer_id, event), timeout=1)
+        await asyncio.wait_for(manager.broadcast_to_layer(layer_id, event), timeout=1)
+        while len(fast_websocket.sent_json) < 2:
+            await asyncio.sleep(0)
+        assert sorted(manager.get_queue_depths(layer_id)) == [0, 1]
+        await manager.close()
+
+    asyncio.run(scenario())
+
+    assert fast_websocket.sent_json == [event, event]
+    assert slow_websocket.sent_json == []
+
+
+def test_broadcast_replaces_overflowed_queue_with_resync_event() -> None:
+    manager = WebSocketConnectionManager(send_queue_size=2)
+    layer_id = uuid4()
+    slow_websocket = DummyWebSocket(blocked=True)
+
+    async def scenario() -> None:
+        await manager.connect(layer_id, slow_websocket, build_user_context())
+        await manager.broadcast_to_layer(layer_id, {"type": "feature_deleted", "n": 0})
+        await asyncio.sleep(0)
+        for index in range(1, 4):
+            await manager.broadcast_to_layer(layer_id, {"type": "feature_deleted", "n": index})
+        assert manager.get_queue_depths(layer_id) == [1]
+        slow_websocket.release.set()
+        await wait_until_sent(manager, layer_id)
+        await manager.close()
+
+    asyncio.run(scenario())
+
+    # The first event was already being sent when the queue overflowed.
+    assert slow_websocket.sent_json == [
+        {"type": "feature_deleted", "n": 0},
+        {"type": "resync_required", "layerId": str(layer_id)},
+    ]
+    assert manager.dropped_events == 3
+    assert manager.resyncs == 1
+
+
+def test_resync_all_replaces_pending_events_of_every_connection() -> None:
+    manager = WebSocketConnectionManager()
+    first_layer_id = uuid4()
+    second_layer_id = uuid4()
+    first_websocket = DummyWebSocket(blocked=True)
+    second_websocket = DummyWebSocket()
+
+    async def scenario() -> None:
+        await manager.connect(first_layer_id, first_websocket, build_user_context())
+        await manager.connect(second_layer_id, second_websocket, build_user_context())
+        await manager.broadcast_to_layer(first_layer_id, {"type": "feature_deleted", "n": 0})
+        await asyncio.sleep(0)
+        await manager.broadcast_to_layer(first_layer_id, {"type": "feature_deleted", "n": 1})
+        manager.resync_all()
+        first_websocket.release.set()
+        await wait_until_sent(manager, first_layer_id)
+        await wait_until_sent(manager, second_layer_id)
+        await manager.close()
+
+    asyncio.run(scenario())
+
+    assert first_websocket.sent_json == [
+        {"type": "feature_deleted", "n": 0},
+        {"type": "resync_required", "layerId": str(first_layer_id)},
+    ]
+    assert second_websocket.sent_json == [
+        {"type": "resync_required", "layerId": str(second_layer_id)}
+    ]
+    assert manager.resyncs == 2
+
+
+def test_broadcast_encodes_event_once_for_all_connections(monkeypatch) -> None:
+    manager = WebSocketConnectionManager()
+    layer_id = uuid4()
+    websockets = [DummyWebSocket() for _ in range(3)]
+    encoded: list[dict[str, object]] = []
+
+    def counting_encode_event(event: dict[str, object]) -> str:
+        encoded.append(event)
+        return encode_event(event)
+
+    monkeypatch.setattr(realtime_connection_manager, "encode_event", counting_encode_event)
+
+    async def scenario() -> None:
+        for websocket in websockets:
+            await manager.connect(layer_id, websocket, build_user_context())
+        await manager.broadcast_to_layer(layer_id, {"type": "feature_deleted", "featureId": "f"})
+        await wait_until_sent(manager, layer_id)
+        await manager.close()
+
+    asyncio.run(scenario())
+
+    assert len(encoded) == 1
+    assert [websocket.sent_text for websocket in websockets] == [
+        ['{"type":"feature_deleted","featureId":"f"}']
+    ] * 3
+
+
+def test_broadcast_with_extent_skips_connections_outside_their_viewport() -> None:
+    manager = WebSocketConnectionManager()
+    layer_id = uuid4()
+    inside = DummyWebSocket()
+    outside = DummyWebSocket()
+    everywhere = DummyWebSocket()
+    event = {"type": "feature_updated"}
+
+    async def scenario() -> None:
+        for websocket in (inside, outside, everywhere):
+            await manager.connect(layer_id, websocket, build_user_context())
+        manager.set_viewport(layer_id, inside, [Bbox(37.5, 55.7, 37.6, 55.8)])
+        manager.set_viewport(layer_id, outside, [Bbox(49.0, 55.7, 49.2, 55.9)])
+        await manager.broadcast_to_layer(layer_id, event, Bbox(37.55, 55.75, 37.56, 55.76))
+        await manager.broadcast_to_layer(layer_id, {"type": "feature_deleted"})
+        await wait_until_sent(manager, layer_id)
+        await manager.close()
+
+    asyncio.run(scenario())
+
+    assert inside.sent_json == [event, {"type": "feature_deleted"}]
+    assert outside.sent_json == [{"type": "feature_deleted"}]
+    assert everywhere.sent_json == [event, {"type": "feature_deleted"}]
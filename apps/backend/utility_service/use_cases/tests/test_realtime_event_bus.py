@@ -0,0 +1,374 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from utility_service.domain_services.bbox import Bbox
+from utility_service.use_cases.services import realtime_event_bus
+from utility_service.use_cases.services.realtime_event_bus import (
+    PostgresRealtimeEventBus,
+    encode_event,
+    format_notification,
+    parse_notification,
+)
+
+
+class FakeSession:
+    instances: list["FakeSession"] = []
+
+    def __init__(self, bind) -> None:
+        self.bind = bind
+        self.committed = False
+        self.instances.append(self)
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+class FakeRealtimeEventRepository:
+    frames: dict[int, str] = {}
+    notifications: list[tuple[str, str]] = []
+    fail_next_notify = False
+    notify_gate: asyncio.Event | None = None
+
+    def __init__(self, session: FakeSession) -> None:
+        self.session = session
+
+    async def add_event_frame(self, layer_id, frame: str) -> int:
+        event_id = len(self.frames) + 1
+        self.frames[event_id] = frame
+        return event_id
+
+    async def get_event_frame(self, event_id: int) -> str | None:
+        return self.frames.get(event_id)
+
+    async def delete_event_frames_before(self, created_before) -> None:
+        return None
+
+    async def notify(self, channel: str, payload: str) -> None:
+        if self.notify_gate is not None:
+            await self.notify_gate.wait()
+        if self.fail_next_notify:
+            FakeRealtimeEventRepository.fail_next_notify = False
+            raise ConnectionResetError
+        self.notifications.append((channel, payload))
+
+
+class FakeDriverConnection:
+    def __init__(self) -> None:
+        self.listeners: list[tuple[str, object]] = []
+        self.termination_listeners: list[object] = []
+
+    async def add_listener(self, channel: str, callback) -> None:
+        self.listeners.append((channel, callback))
+
+    async def remove_listener(self, channel: str, callback) -> None:
+        self.listeners.remove((channel, callback))
+
+    def add_termination_listener(self, callback) -> None:
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback) -> None:
+        self.termination_listeners.remove(callback)
+
+    async def execute(self, query: str) -> None:
+        return None
+
+    def terminate(self) -> None:
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.driver_connection = FakeDriverConnection()
+        self.invalidated = False
+        self.closed = False
+
+    async def get_raw_connection(self) -> "FakeConnection":
+        return self
+
+    async def invalidate(self) -> None:
+        self.invalidated = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeEngine:
+    def __init__(self, failed_connects: int = 0) -> None:
+        self.failed_connects = failed_connects
+        self.connections: list[FakeConnection] = []
+        self.disposed = False
+
+    async def connect(self) -> FakeConnection:
+        if self.failed_connects:
+            self.failed_connects -= 1
+            raise OSError("connection refused")
+        self.connections.append(FakeConnection())
+        return self.connections[-1]
+
+    async def dispose(self) -> None:
+        self.disposed = True
+
+
+class FakeConnectionManager:
+    def __init__(self, connection_count: int = 1) -> None:
+        self.connection_count = connection_count
+        self.frames: list[tuple[object, str]] = []
+        self.resyncs = 0
+
+    def get_connection_count(self, layer_id) -> int:
+        return self.connection_count
+
+    def broadcast_frame_to_layer(self, layer_id, frame: str, extent=None) -> None:
+        self.frames.append((layer_id, frame))
+
+    def resync_all(self) -> None:
+        self.resyncs += 1
+
+
+async def wait_for_connections(engine: FakeEngine, count: int) -> None:
+    while len(engine.connections) < count:
+        await asyncio.sleep(0)
+
+
+def build_bus(
+    monkeypatch,
+    connection_manager: FakeConnectionManager | None = None,
+    engine: FakeEngine | None = None,
+):
+    monkeypatch.setattr(FakeRealtimeEventRepository, "frames", {})
+    monkeypatch.setattr(FakeRealtimeEventRepository, "notifications", [])
+    monkeypatch.setattr(FakeRealtimeEventRepository, "fail_next_notify", False)
+    monkeypatch.setattr(FakeRealtimeEventRepository, "notify_gate", None)
+    monkeypatch.setattr(realtime_event_bus, "RealtimeEventRepository", FakeRealtimeEventRepository)
+    monkeypatch.setattr(FakeSession, "instances", [])
+    monkeypatch.setattr(realtime_event_bus, "AsyncSession", FakeSession)
+    engine = engine or FakeEngine()
+    bus = PostgresRealtimeEventBus(
+        engine=engine,
+        connection_manager=connection_manager or FakeConnectionManager(),
+    )
+    return bus, engine
+
+
+def test_notification_round_trips_inline_frame_reference_and_extent() -> None:
+    layer_id = uuid4()
+    extent = Bbox(37.5, 55.7, 37.6000001, 55.8)
+
+    assert parse_notification(format_notification(layer_id, frame='{"a":"b:c#d"}')) == (
+        layer_id,
+        None,
+        '{"a":"b:c#d"}',
+        None,
+    )
+    assert parse_notification(format_notification(layer_id, extent, event_id=42)) == (
+        layer_id,
+        extent,
+        None,
+        42,
+    )
+
+
+def test_publish_sends_small_event_inline_through_notify(monkeypatch) -> None:
+    bus, _ = build_bus(monkeypatch)
+    layer_id = uuid4()
+
+    asyncio.run(bus.publish(layer_id, encode_event({"type": "feature_deleted"})))
+
+    assert FakeRealtimeEventRepository.notifications == [
+        ("realtime_events", f'{layer_id}:{{"type":"feature_deleted"}}')
+    ]
+    assert FakeRealtimeEventRepository.frames == {}
+    assert FakeSession.instances[0].committed is True
+
+
+def test_publish_passes_large_event_by_reference(monkeypatch) -> None:
+    bus, _ = build_bus(monkeypatch)
+    layer_id = uuid4()
+    event = {"type": "feature_updated", "feature": {"properties": {"note": "x" * 10000}}}
+
+    asyncio.run(bus.publish(layer_id, encode_event(event)))
+
+    assert FakeRealtimeEventRepository.notifications == [("realtime_events", f"{layer_id}#1")]
+    assert FakeRealtimeEventRepository.frames[1].startswith('{"type":"feature_updated"')
+    assert FakeSession.instances[0].committed is True
+
+
+def test_broadcasts_are_published_in_order_over_one_connection(monkeypatch) -> None:
+    bus, engine = build_bus(monkeypatch)
+    layer_id = uuid4()
+
+    async def scenario() -> None:
+        await bus.start()
+        for n in range(3):
+            await bus.broadcast_to_layer(layer_id, {"type": "feature_deleted", "n": n})
+        await bus.close()
+
+    asyncio.run(scenario())
+
+    listener, publisher = engine.connections
+    assert {id(session.bind) for session in FakeSession.instances} == {id(publisher)}
+    assert publisher.closed is True
+    assert [payload for _, payload in FakeRealtimeEventRepository.notifications] == [
+        f'{layer_id}:{{"type":"feature_deleted","n":{n}}}' for n in range(3)
+    ]
+
+
+def test_broadcast_does_not_wait_for_the_database(monkeypatch) -> None:
+    bus, _ = build_bus(monkeypatch)
+    layer_id = uuid4()
+
+    async def scenario() -> None:
+        FakeRealtimeEventRepository.notify_gate = asyncio.Event()
+        await bus.start()
+        await asyncio.wait_for(bus.broadcast_to_layer(layer_id, {"type": "a"}), 1)
+        await asyncio.wait_for(bus.broadcast_to_layer(layer_id, {"type": "b"}), 1)
+        assert FakeRealtimeEventRepository.notifications == []
+        FakeRealtimeEventRepository.notify_gate.set()
+        await bus.close()
+
+    asyncio.run(scenario())
+
+    assert len(FakeRealtimeEventRepository.notifications) == 2
+
+
+def test_full_publish_queue_drops_events_and_resyncs_the_layer(monkeypatch) -> None:
+    monkeypatch.setattr(realtime_event_bus, "PUBLISH_QUEUE_SIZE", 2)
+    bus, _ = build_bus(monkeypatch)
+    layer_id = uuid4()
+
+    async def scenario() -> None:
+        for n in range(4):
+            await bus.broadcast_to_layer(layer_id, {"type": "feature_deleted", "n": n})
+        await bus.start()
+        await bus.close()
+
+    asyncio.run(scenario())
+
+    assert [payload for _, payload in FakeRealtimeEventRepository.notifications] == [
+        f'{layer_id}:{{"type":"feature_deleted","n":0}}',
+        f'{layer_id}:{{"type":"feature_deleted","n":1}}',
+        f'{layer_id}:{{"type":"resync_required","layerId":"{layer_id}"}}',
+    ]
+
+
+def test_failed_publish_drops_publisher_connection(monkeypatch) -> None:
+    bus, engine = build_bus(monkeypatch)
+    layer_id = uuid4()
+    FakeRealtimeEventRepository.fail_next_notify = True
+
+    async def scenario() -> None:
+        with pytest.raises(ConnectionResetError):
+            await bus.publish(layer_id, encode_event({"type": "feature_deleted"}))
+        await bus.publish(layer_id, encode_event({"type": "feature_deleted"}))
+
+    asyncio.run(scenario())
+
+    assert engine.connections[0].invalidated is True
+    assert len(engine.connections) == 2
+    assert len(FakeRealtimeEventRepository.notifications) == 1
+
+
+def test_relay_reads_frames_while_a_publish_is_in_flight(monkeypatch) -> None:
+    connection_manager = FakeConnectionManager()
+    bus, engine = build_bus(monkeypatch, connection_manager)
+    layer_id = uuid4()
+    FakeRealtimeEventRepository.frames[7] = '{"type":"features_batch"}'
+
+    async def scenario() -> None:
+        FakeRealtimeEventRepository.notify_gate = asyncio.Event()
+        publish = asyncio.create_task(bus.publish(layer_id, '{"type":"feature_deleted"}'))
+        await wait_for_connections(engine, 1)
+        await asyncio.wait_for(bus.relay_notification(f"{layer_id}#7"), 1)
+        FakeRealtimeEventRepository.notify_gate.set()
+        await publish
+
+    asyncio.run(scenario())
+
+    publisher, relay = engine.connections
+    assert connection_manager.frames == [(layer_id, '{"type":"features_batch"}')]
+    assert [id(session.bind) for session in FakeSession.instances] == [id(publisher), id(relay)]
+
+
+def test_relay_delivers_inline_and_referenced_frames_to_local_sockets(monkeypatch) -> None:
+    connection_manager = FakeConnectionManager()
+    bus, _ = build_bus(monkeypatch, connection_manager)
+    layer_id = uuid4()
+    FakeRealtimeEventRepository.frames[7] = '{"type":"features_batch"}'
+
+    asyncio.run(bus.relay_notification(f'{layer_id}:{{"type":"feature_deleted"}}'))
+    asyncio.run(bus.relay_notification(f"{layer_id}#7"))
+
+    assert connection_manager.frames == [
+        (layer_id, '{"type":"feature_deleted"}'),
+        (layer_id, '{"type":"features_batch"}'),
+    ]
+
+
+def test_relay_skips_layers_without_local_subscribers(monkeypatch) -> None:
+    connection_manager = FakeConnectionManager(connection_count=0)
+    bus, _ = build_bus(monkeypatch, connection_manager)
+
+    asyncio.run(bus.relay_notification(f"{uuid4()}#7"))
+
+    assert connection_manager.frames == []
+
+
+def test_listener_reconnects_after_termination_and_requests_resync(monkeypatch) -> None:
+    monkeypatch.setattr(realtime_event_bus, "LISTENER_RECONNECT_DELAYS", (0,))
+    connection_manager = FakeConnectionManager()
+    engine = FakeEngine()
+    bus, _ = build_bus(monkeypatch, connection_manager, engine)
+
+    async def scenario() -> None:
+        await bus.start()
+        first = engine.connections[0]
+        engine.failed_connects = 2
+        first.driver_connection.terminate()
+        await asyncio.wait_for(wait_for_connections(engine, 2), 1)
+        await asyncio.sleep(0)
+        assert first.invalidated is True
+        assert connection_manager.resyncs == 1
+        # A late termination report from the replaced connection is ignored.
+        first.driver_connection.terminate()
+        await asyncio.sleep(0)
+        assert len(engine.connections) == 2
+        await bus.close()
+
+    asyncio.run(scenario())
+
+    second = engine.connections[1].driver_connection
+    assert second.listeners == []
+    assert second.termination_listeners == []
+    assert engine.connections[1].closed is True
+    assert engine.disposed is True
+
+
+def test_listener_reconnects_when_health_check_fails(monkeypatch) -> None:
+    monkeypatch.setattr(realtime_event_bus, "LISTENER_HEALTH_CHECK_INTERVAL", 0)
+    connection_manager = FakeConnectionManager()
+    engine = FakeEngine()
+    bus, _ = build_bus(monkeypatch, connection_manager, engine)
+
+    async def scenario() -> None:
+        await bus.start()
+
+        async def broken_execute(query: str) -> None:
+            raise ConnectionResetError
+
+        engine.connections[0].driver_connection.execute = broken_execute
+        await asyncio.wait_for(wait_for_connections(engine, 2), 1)
+        await asyncio.sleep(0)
+        await bus.close()
+
+    asyncio.run(scenario())
+
+    assert connection_manager.resyncs == 1
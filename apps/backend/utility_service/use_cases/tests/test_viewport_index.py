@@ -0,0 +1,39 @@
+from utility_service.domain_services.bbox import Bbox
+from utility_service.use_cases.services.viewport_index import ViewportIndex
+
+MOSCOW = Bbox(37.5, 55.7, 37.6, 55.8)
+KAZAN = Bbox(49.0, 55.7, 49.2, 55.9)
+
+
+def test_query_returns_viewports_intersecting_extent() -> None:
+    index = ViewportIndex()
+    index.set("moscow", [MOSCOW])
+    index.set("kazan", [KAZAN])
+    index.set("both", [MOSCOW, KAZAN])
+
+    assert index.query(Bbox(37.55, 55.75, 37.56, 55.76)) == {"moscow", "both"}
+    assert index.query(Bbox(49.1, 55.8, 49.1, 55.8)) == {"kazan", "both"}
+    assert index.query(Bbox(60.0, 55.0, 61.0, 56.0)) == set()
+
+
+def test_set_replaces_previous_viewport_and_remove_forgets_it() -> None:
+    index = ViewportIndex()
+    index.set("editor", [MOSCOW])
+    index.set("editor", [KAZAN])
+
+    assert index.query(MOSCOW) == set()
+    assert index.query(KAZAN) == {"editor"}
+
+    index.remove("editor")
+
+    assert index.query(KAZAN) == set()
+    assert len(index) == 0
+
+
+def test_query_matches_world_viewport_and_world_extent() -> None:
+    index = ViewportIndex()
+    index.set("world", [Bbox(-180.0, -90.0, 180.0, 90.0)])
+    index.set("moscow", [MOSCOW])
+
+    assert index.query(KAZAN) == {"world"}
+    assert index.query(Bbox(-180.0, -90.0, 180.0, 90.0)) == {"world", "moscow"}
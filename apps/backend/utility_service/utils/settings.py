@@ -1,5 +1,6 @@
 from functools import lru_cache
 import json
+from typing import Literal
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -36,6 +37,16 @@ class Settings(BaseSettings):
     )
     dev_auth_enabled: bool = Field(False, alias="DEV_MODE")
     legacy_gis_api_enabled: bool = Field(False, alias="LEGACY_GIS_API_ENABLED")
+    layer_registry_ttl_seconds: int = Field(300, alias="LAYER_REGISTRY_TTL_SECONDS")
+    layer_registry_max_size: int = Field(1024, alias="LAYER_REGISTRY_MAX_SIZE")
+    feature_import_chunk_size: int = Field(5000, alias="FEATURE_IMPORT_CHUNK_SIZE")
+    feature_changes_retention_days: int = Field(30, alias="FEATURE_CHANGES_RETENTION_DAYS")
+    feature_response_cache_max_bytes: int = Field(
+        64 * 1024 * 1024, alias="FEATURE_RESPONSE_CACHE_MAX_BYTES"
+    )
+    websocket_send_queue_size: int = Field(256, alias="WEBSOCKET_SEND_QUEUE_SIZE")
+    realtime_event_bus: Literal["local", "postgres"] = Field("local", alias="REALTIME_EVENT_BUS")
+    realtime_coalesce_window_ms: int = Field(0, alias="REALTIME_COALESCE_WINDOW_MS")
 
     @model_validator(mode="after")
     def validate_security_settings(self) -> "Settings":
@@ -0,0 +1,40 @@
+from hashlib import sha256
+from uuid import UUID
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+LAYER_REVISION_HEADER = "X-Layer-Revision"
+
+
+def layer_revision_etag(request: Request, revision: int) -> str:
+    representation = f"{request.url.path}?{request.url.query}"
+    digest = sha256(representation.encode("utf-8")).hexdigest()[:16]
+    return f'"r{revision}-{digest}"'
+
+
+def layers_revision_etag(request: Request, revisions: dict[UUID, int]) -> str:
+    revision_list = ",".join(f"{layer_id}:{revisions[layer_id]}" for layer_id in sorted(revisions))
+    representation = f"{request.url.path}?{request.url.query}#{revision_list}"
+    digest = sha256(representation.encode("utf-8")).hexdigest()[:16]
+    return f'"m{sum(revisions.values())}-{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cache_validation_headers(etag: str, revision: int | None = None) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if revision is not None:
+        headers[LAYER_REVISION_HEADER] = str(revision)
+    return headers
+
+
+def not_modified_response(headers: dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -5,6 +5,9 @@ from utility_service.use_cases.domain.exceptions.auth_api_error import AuthApiEr
 from utility_service.use_cases.domain.exceptions.business_validation_exception import (
     BusinessValidationException,
 )
+from utility_service.use_cases.domain.exceptions.change_log_pruned_exception import (
+    ChangeLogPrunedException,
+)
 from utility_service.use_cases.domain.exceptions.feature_not_found_exception import (
     FeatureNotFoundException,
 )
@@ -110,6 +113,17 @@ def install_exception_handlers(app: FastAPI) -> None:
     async def business_validation_error(_: Request, e: BusinessValidationException):
         return JSONResponse(status_code=422, content={"error": str(e)})
 
+    @app.exception_handler(ChangeLogPrunedException)
+    async def change_log_pruned(_: Request, e: ChangeLogPrunedException):
+        return JSONResponse(
+            status_code=410,
+            content={
+                "error": e.message,
+                "resyncRequired": True,
+                "prunedRevision": e.pruned_revision,
+            },
+        )
+
     @app.exception_handler(UnknownStorageTableError)
     async def unknown_storage_table_error(_: Request, e: UnknownStorageTableError):
         return JSONResponse(status_code=422, content={"error": str(e)})
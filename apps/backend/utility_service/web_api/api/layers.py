@@ -5,10 +5,27 @@ Created on Sat Jan 10 17:32:50 2026
 @author: dimon
 """
 
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import Response
+import re
+from datetime import datetime
+from urllib.parse import quote
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+from utility_service.use_cases.schemas.feature.batch_features_request import BatchFeaturesRequest
+from utility_service.use_cases.schemas.feature.batch_features_response import (
+    BatchFeaturesResponse,
+)
+from utility_service.use_cases.schemas.feature.feature_aggregate_out import FeatureAggregateOut
+from utility_service.use_cases.schemas.feature.feature_changes_out import FeatureChangesOut
 from utility_service.use_cases.schemas.feature.feature_collection_out import FeatureCollectionOut
+from utility_service.use_cases.schemas.feature.feature_filter_in import FeatureFilterIn
+from utility_service.use_cases.schemas.feature.feature_import_out import FeatureImportOut
+from utility_service.use_cases.schemas.feature.feature_nearest_out import FeatureNearestOut
 from utility_service.use_cases.schemas.feature.feature_out import FeatureOut
+from utility_service.use_cases.schemas.feature.layer_feature_collections_out import (
+    LayerFeatureCollectionsOut,
+)
 from utility_service.use_cases.schemas.feature.create_feature_in import CreateFeatureIn
 from utility_service.use_cases.schemas.feature.patch_feature_request import PatchFeatureRequest
 from utility_service.use_cases.schemas.feature.patch_feature_succes_response import (
@@ -16,14 +33,50 @@ from utility_service.use_cases.schemas.feature.patch_feature_succes_response imp
 )
 from utility_service.use_cases.schemas.feature.delete_feature_request import DeleteFeatureRequest
 from utility_service.use_cases.schemas.feature.delete_feature_response import DeleteFeatureResponse
+from utility_service.use_cases.schemas.geojson.geojson import dump_feature_geometry
 from utility_service.use_cases.schemas.layer.layer_list_out import LayerListOut
+from utility_service.use_cases.deps import get_feature_export_service
+from utility_service.use_cases.deps import get_feature_import_service
 from utility_service.use_cases.deps import get_feature_service
 from utility_service.use_cases.deps import get_layer_service
+from utility_service.use_cases.services.feature_export_service import (
+    FeatureExportFormat,
+    FeatureExportService,
+)
+from utility_service.use_cases.services.feature_import_service import FeatureImportService
 from utility_service.use_cases.services.feature_service import FeatureService
+from utility_service.use_cases.services.geojson_feature_stream import (
+    FeatureStreamFormat,
+    iter_stream_features,
+)
 from utility_service.use_cases.services.layer_service import LayerService
 from utility_service.domain_services.bbox import parse_bbox
+from utility_service.domain_services.feature_aggregation import parse_aggregation_grid
+from utility_service.domain_services.feature_order import FeatureSort, parse_feature_order
+from utility_service.domain_services.geometry_rendering import (
+    FULL_GEOMETRY,
+    parse_feature_projection,
+    parse_geometry_rendering,
+)
+from utility_service.domain_services.layer_selection import parse_layer_cursors, parse_layer_ids
+from utility_service.domain_services.nearest_query import parse_nearest_query
+from utility_service.domain_services.property_filter import parse_property_filters
+from utility_service.domain_services.spatial_filter import parse_spatial_filter
+from utility_service.domain_services.tile import parse_tile_coordinates
 from uuid import UUID
 from .auth import require_legacy_gis_editor
+from .conditional_requests import (
+    LAYER_REVISION_HEADER,
+    cache_validation_headers,
+    is_not_modified,
+    layer_revision_etag,
+    layers_revision_etag,
+    not_modified_response,
+)
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ATTACHMENT_FALLBACK_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
 
 layers_router = APIRouter(
     prefix="/api/v1/layers",
@@ -37,16 +90,191 @@ async def get_layers(layer_service: LayerService = Depends(get_layer_service)) -
     return await layer_service.get_layers()
 
 
+@layers_router.get("/features", response_model=LayerFeatureCollectionsOut)
+async def get_layers_features_from_bbox(
+    layer_ids: str,
+    bbox: str,
+    request: Request,
+    limit: int | None = None,
+    after: list[str] = Query(default=[]),
+    zoom: int | None = None,
+    tolerance: float | None = None,
+    precision: int | None = None,
+    feature_service: FeatureService = Depends(get_feature_service),
+) -> Response:
+    ids = parse_layer_ids(layer_ids)
+    after_ids = parse_layer_cursors(after, ids)
+    bb = parse_bbox(bbox)
+    rendering = parse_geometry_rendering(zoom, tolerance, precision)
+    revisions = await feature_service.get_layer_revisions(ids)
+    headers = cache_validation_headers(layers_revision_etag(request, revisions))
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+    content = await feature_service.get_layers_features_from_bbox(
+        ids, bb, limit, after_ids, rendering
+    )
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 @layers_router.get("/{layer_id}/features", response_model=FeatureCollectionOut)
 async def get_layer_features_from_bbox(
     layer_id: UUID,
     bbox: str,
+    request: Request,
+    limit: int | None = None,
+    after_id: UUID | None = None,
+    zoom: int | None = None,
+    tolerance: float | None = None,
+    precision: int | None = None,
+    filter: list[str] = Query(default=[]),
+    fields: str | None = None,
+    geometry: bool = True,
+    sort: FeatureSort = "id",
+    after: str | None = None,
+    feature_service: FeatureService = Depends(get_feature_service),
+) -> Response:
+    bb = parse_bbox(bbox)
+    rendering = parse_feature_projection(
+        parse_geometry_rendering(zoom, tolerance, precision), fields, geometry
+    )
+    property_filters = parse_property_filters(filter)
+    order, after_id = parse_feature_order(sort, after_id, after)
+    revision, headers = await get_layer_cache_validation(request, layer_id, feature_service)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+    content = await feature_service.get_features_from_bbox(
+        layer_id, bb, limit, after_id, rendering, revision, property_filters, order
+    )
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@layers_router.post("/{layer_id}/features:query", response_model=FeatureCollectionOut)
+async def query_layer_features(
+    layer_id: UUID,
+    request: FeatureFilterIn,
     limit: int | None = None,
     after_id: UUID | None = None,
+    zoom: int | None = None,
+    tolerance: float | None = None,
+    precision: int | None = None,
+    filter: list[str] = Query(default=[]),
+    feature_service: FeatureService = Depends(get_feature_service),
+) -> Response:
+    spatial_filter = parse_spatial_filter(dump_feature_geometry(request.geometry), request.buffer)
+    rendering = parse_geometry_rendering(zoom, tolerance, precision)
+    property_filters = parse_property_filters(filter)
+    content = await feature_service.get_features_in_filter(
+        layer_id, spatial_filter, limit, after_id, rendering, property_filters
+    )
+    return Response(content=content, media_type="application/json")
+
+
+@layers_router.get(
+    "/{layer_id}/tiles/{z}/{x}/{y}.mvt",
+    response_class=Response,
+    responses={200: {"content": {MVT_MEDIA_TYPE: {}}}},
+)
+async def get_layer_tile(
+    layer_id: UUID,
+    z: int,
+    x: int,
+    y: int,
+    request: Request,
+    feature_service: FeatureService = Depends(get_feature_service),
+) -> Response:
+    tile = parse_tile_coordinates(z, x, y)
+    _, headers = await get_layer_cache_validation(request, layer_id, feature_service)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+    content = await feature_service.get_layer_tile(layer_id, tile)
+    return Response(content=content, media_type=MVT_MEDIA_TYPE, headers=headers)
+
+
+@layers_router.get("/{layer_id}/features/aggregate", response_model=FeatureAggregateOut)
+async def get_layer_feature_aggregate(
+    layer_id: UUID,
+    bbox: str,
+    zoom: int,
+    request: Request,
+    response: Response,
     feature_service: FeatureService = Depends(get_feature_service),
-) -> FeatureCollectionOut:
+) -> FeatureAggregateOut | Response:
     bb = parse_bbox(bbox)
-    return await feature_service.get_features_from_bbox(layer_id, bb, limit, after_id)
+    grid = parse_aggregation_grid(zoom, bb)
+    _, headers = await get_layer_cache_validation(request, layer_id, feature_service)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+    aggregate = await feature_service.get_feature_aggregate(layer_id, bb, grid)
+    response.headers.update(headers)
+    return aggregate
+
+
+@layers_router.get("/{layer_id}/features/nearest", response_model=FeatureNearestOut)
+async def get_layer_nearest_features(
+    layer_id: UUID,
+    lon: float,
+    lat: float,
+    request: Request,
+    k: int | None = None,
+    max_distance: float | None = None,
+    feature_service: FeatureService = Depends(get_feature_service),
+) -> Response:
+    query = parse_nearest_query(lon, lat, k, max_distance)
+    _, headers = await get_layer_cache_validation(request, layer_id, feature_service)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+    content = await feature_service.get_nearest_features(layer_id, query)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@layers_router.get(
+    "/{layer_id}/features:export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_features(
+    layer_id: UUID,
+    format: FeatureExportFormat = "ndjson",
+    feature_export_service: FeatureExportService = Depends(get_feature_export_service),
+) -> StreamingResponse:
+    export = await feature_export_service.export_features(layer_id)
+    headers = {
+        "Content-Disposition": attachment_content_disposition(export.layer_name, format),
+        LAYER_REVISION_HEADER: str(export.revision),
+    }
+    # The background task also runs when the client disconnects before the body is read.
+    return StreamingResponse(
+        export.content,
+        media_type=NDJSON_MEDIA_TYPE,
+        headers=headers,
+        background=BackgroundTask(export.close),
+    )
+
+
+def attachment_content_disposition(name: str, extension: str) -> str:
+    # Layer names are user input and often Cyrillic: the quoted filename gets an ASCII
+    # fallback, the real name goes into the RFC 5987 filename* parameter.
+    fallback = ATTACHMENT_FALLBACK_UNSAFE.sub("_", name).strip("._") or "layer"
+    filename = quote(f"{name}.{extension}", safe="")
+    return f"attachment; filename=\"{fallback}.{extension}\"; filename*=UTF-8''{filename}"
+
+
+@layers_router.get("/{layer_id}/features/changes", response_model=FeatureChangesOut)
+async def get_layer_feature_changes(
+    layer_id: UUID,
+    bbox: str,
+    request: Request,
+    since_revision: int | None = None,
+    since: datetime | None = None,
+    limit: int | None = None,
+    feature_service: FeatureService = Depends(get_feature_service),
+) -> Response:
+    bb = parse_bbox(bbox)
+    _, headers = await get_layer_cache_validation(request, layer_id, feature_service)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+    content = await feature_service.get_feature_changes(layer_id, bb, since_revision, since, limit)
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @layers_router.post(
@@ -65,6 +293,26 @@ async def create_feature(
     return feature
 
 
+@layers_router.post("/{layer_id}/features:batch", response_model=BatchFeaturesResponse)
+async def apply_feature_batch(
+    layer_id: UUID,
+    request: BatchFeaturesRequest,
+    feature_service: FeatureService = Depends(get_feature_service),
+) -> BatchFeaturesResponse:
+    return await feature_service.apply_feature_batch(layer_id, request)
+
+
+@layers_router.post("/{layer_id}/features:import", response_model=FeatureImportOut)
+async def import_features(
+    layer_id: UUID,
+    request: Request,
+    format: FeatureStreamFormat = "geojson",
+    feature_import_service: FeatureImportService = Depends(get_feature_import_service),
+) -> FeatureImportOut:
+    features = iter_stream_features(request.stream(), format)
+    return await feature_import_service.import_features(layer_id, features)
+
+
 @layers_router.patch(
     "/{layer_id}/features/{feature_id}",
     response_model=PatchFeatureSuccesResponse,
@@ -94,7 +342,32 @@ async def delete_feature(
 
 @layers_router.get("/{layer_id}/features/{feature_id}", response_model=FeatureOut)
 async def get_feature(
-    layer_id: UUID, feature_id: UUID, feature_service: FeatureService = Depends(get_feature_service)
-) -> FeatureOut:
+    layer_id: UUID,
+    feature_id: UUID,
+    request: Request,
+    response: Response,
+    fields: str | None = None,
+    geometry: bool = True,
+    feature_service: FeatureService = Depends(get_feature_service),
+) -> FeatureOut | Response:
+    rendering = parse_feature_projection(FULL_GEOMETRY, fields, geometry)
+    _, headers = await get_layer_cache_validation(request, layer_id, feature_service)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified_response(headers)
+    if rendering.projected:
+        # A projected feature may have no geometry, so it is returned as built by PostGIS
+        # instead of being validated through FeatureOut.
+        content = await feature_service.get_feature_json(layer_id, feature_id, rendering)
+        return Response(content=content, media_type="application/json", headers=headers)
     feature = await feature_service.get_feature(layer_id, feature_id)
+    response.headers.update(headers)
     return feature
+
+
+async def get_layer_cache_validation(
+    request: Request, layer_id: UUID, feature_service: FeatureService
+) -> tuple[int, dict[str, str]]:
+    # The revision is read before the data, so a concurrent write can only make the
+    # body newer than its ETag and never serve stale data under a fresh validator.
+    revision = await feature_service.get_layer_revision(layer_id)
+    return (revision, cache_validation_headers(layer_revision_etag(request, revision), revision))
@@ -5,16 +5,39 @@ Created on Wed Jan  7 16:18:42 2026
 @author: dimon
 """
 
+import logging
+
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
-from utility_service.use_cases.deps import close_runtime_resources
-from utility_service.use_cases.services.realtime_connection_manager import (
-    WebSocketConnectionManager,
+from utility_service.use_cases.deps import (
+    close_runtime_resources,
+    create_feature_event_coalescer,
+    create_feature_response_cache,
+    create_layer_registry,
+    create_realtime_event_bus,
+    create_websocket_connection_manager,
+    preload_layer_registry,
 )
 
+_logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.state.websocket_connection_manager = WebSocketConnectionManager()
+    app.state.websocket_connection_manager = create_websocket_connection_manager()
+    app.state.realtime_event_bus = create_realtime_event_bus(app.state.websocket_connection_manager)
+    await app.state.realtime_event_bus.start()
+    app.state.feature_event_coalescer = create_feature_event_coalescer(app.state.realtime_event_bus)
+    app.state.layer_registry = create_layer_registry()
+    app.state.feature_response_cache = create_feature_response_cache()
+    try:
+        await preload_layer_registry(app.state.layer_registry)
+    except Exception:
+        # The registry fills lazily on demand, so a cold start must not depend on it.
+        _logger.warning("Не удалось предзагрузить реестр слоев", exc_info=True)
     yield
+    if app.state.feature_event_coalescer is not None:
+        await app.state.feature_event_coalescer.close()
+    await app.state.realtime_event_bus.close()
+    await app.state.websocket_connection_manager.close()
     await close_runtime_resources()
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import json
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, WebSocketException, status
 
+from utility_service.domain_services.viewport import parse_viewport_message
 from utility_service.use_cases.deps import (
     get_layer_service,
     get_websocket_connection_manager,
     get_websocket_ticket_service,
 )
+from utility_service.use_cases.domain.exceptions.business_validation_exception import (
+    BusinessValidationException,
+)
 from utility_service.use_cases.dtos import AuthUserDTO
 from utility_service.web_api.api.auth import require_legacy_gis_editor
 from utility_service.utils.websocket_ticket_auth import authenticate_websocket_ticket
@@ -26,6 +31,28 @@ def _websocket_route_error(reason: str) -> WebSocketException:
     return WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=reason)
 
 
+async def _handle_client_message(
+    connection_manager: WebSocketConnectionManager,
+    layer_id: UUID,
+    websocket: WebSocket,
+    message: dict[str, object],
+) -> None:
+    try:
+        payload = json.loads(message.get("text") or "null")
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict) or payload.get("type") != "viewport":
+        return
+    try:
+        viewport = parse_viewport_message(payload)
+    except BusinessValidationException as e:
+        await connection_manager.send_to_connection(
+            layer_id, websocket, {"type": "viewport_rejected", "message": str(e)}
+        )
+        return
+    connection_manager.set_viewport(layer_id, websocket, viewport)
+
+
 @ws_layers_router.post(
     "/api/v1/ws/layers/{layer_id}/ticket",
     response_model=WebSocketTicketOut,
@@ -55,11 +82,14 @@ async def subscribe_to_layer_updates(
 
     await connection_manager.connect(layer_id, websocket, user_context)
     try:
-        await websocket.send_json({"type": "connected", "layerId": str(layer_id)})
+        await connection_manager.send_to_connection(
+            layer_id, websocket, {"type": "connected", "layerId": str(layer_id)}
+        )
         while True:
             message = await websocket.receive()
             if message["type"] == "websocket.disconnect":
                 break
+            await _handle_client_message(connection_manager, layer_id, websocket, message)
     except WebSocketDisconnect:
         pass
     finally:
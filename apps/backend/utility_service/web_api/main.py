@@ -5,6 +5,7 @@ from utility_service.web_api.api.auth import auth_router
 from utility_service.web_api.api.exception_handlers import install_exception_handlers
 from utility_service.web_api.api.secure_router import secure_router
 from utility_service.web_api.api.utility_network import utility_network_router
+from utility_service.web_api.api.conditional_requests import LAYER_REVISION_HEADER
 from utility_service.web_api.api.layers import layers_router
 from utility_service.web_api.api.ws_layers import ws_layers_router
 from utility_service.web_api.api.work_orders import work_orders_router
@@ -37,6 +38,6 @@ app = CORSMiddleware(
     allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Authorization", "Content-Type"],
-    expose_headers=[CORRELATION_ID_HEADER],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=[CORRELATION_ID_HEADER, "ETag", LAYER_REVISION_HEADER],
 )
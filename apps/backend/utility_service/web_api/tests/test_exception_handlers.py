@@ -10,6 +10,9 @@ from utility_service.use_cases.domain.exceptions.auth_api_error import AuthApiEr
 from utility_service.use_cases.domain.exceptions.business_validation_exception import (
     BusinessValidationException,
 )
+from utility_service.use_cases.domain.exceptions.change_log_pruned_exception import (
+    ChangeLogPrunedException,
+)
 from utility_service.use_cases.domain.exceptions.utility_network_api_error import (
     UtilityNetworkApiError,
 )
@@ -31,6 +34,12 @@ def create_test_app():
     def business_validation() -> None:
         raise BusinessValidationException("Некорректный bbox")
 
+    @api.get("/change-log-pruned")
+    def change_log_pruned() -> None:
+        raise ChangeLogPrunedException(
+            UUID("00000000-0000-0000-0000-000000000001"), 12, "Журнал изменений очищен"
+        )
+
     @api.get("/unexpected-value-error")
     def unexpected_value_error() -> None:
         raise ValueError("Это программистская ошибка")
@@ -82,6 +91,19 @@ def test_business_validation_exception_returns_422() -> None:
     UUID(response.headers[CORRELATION_ID_HEADER])
 
 
+def test_change_log_pruned_exception_returns_410_with_resync_flag() -> None:
+    client = TestClient(create_test_app(), raise_server_exceptions=False)
+
+    response = client.get("/change-log-pruned")
+
+    assert response.status_code == 410
+    assert response.json() == {
+        "error": "Журнал изменений очищен",
+        "resyncRequired": True,
+        "prunedRevision": 12,
+    }
+
+
 def test_unexpected_value_error_returns_500() -> None:
     client = TestClient(create_test_app(), raise_server_exceptions=False)
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from types import SimpleNamespace
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi import FastAPI
@@ -10,9 +11,14 @@ from fastapi.testclient import TestClient
 
 from utility_service.use_cases.deps import (
     get_auth_service,
+    get_feature_export_service,
+    get_feature_import_service,
     get_feature_service,
     get_layer_service,
 )
+from utility_service.use_cases.schemas.feature.batch_features_response import (
+    BatchFeaturesResponse,
+)
 from utility_service.use_cases.schemas.feature.delete_feature_response import (
     DeleteFeatureResponse,
 )
@@ -20,6 +26,11 @@ from utility_service.use_cases.schemas.feature.feature_collection_out import (
     FeatureCollectionMetaOut,
     FeatureCollectionOut,
 )
+from utility_service.use_cases.schemas.feature.feature_aggregate_out import (
+    FeatureAggregateMetaOut,
+    FeatureAggregateOut,
+)
+from utility_service.use_cases.schemas.feature.feature_import_out import FeatureImportOut
 from utility_service.use_cases.schemas.feature.feature_out import FeatureOut
 from utility_service.use_cases.schemas.layer.layer_list_out import LayerListOut
 from utility_service.use_cases.schemas.layer.layer_out import LayerOut
@@ -55,6 +66,43 @@ LEGACY_LAYER_REQUESTS = [
         "GET",
         f"/api/v1/layers/{LAYER_ID}/features/{FEATURE_ID}",
     ),
+    LegacyLayerRequest(
+        "GET",
+        f"/api/v1/layers/{LAYER_ID}/features/aggregate",
+        params={"bbox": "0,0,1,1", "zoom": "5"},
+    ),
+    LegacyLayerRequest(
+        "GET",
+        f"/api/v1/layers/{LAYER_ID}/features/nearest",
+        params={"lon": "1", "lat": "2"},
+    ),
+    LegacyLayerRequest("GET", f"/api/v1/layers/{LAYER_ID}/features:export"),
+    LegacyLayerRequest(
+        "POST",
+        f"/api/v1/layers/{LAYER_ID}/features:query",
+        json={"geometry": {"type": "Point", "coordinates": [1.0, 2.0]}, "buffer": 10},
+    ),
+    LegacyLayerRequest(
+        "POST",
+        f"/api/v1/layers/{LAYER_ID}/features:import",
+        params={"format": "ndjson"},
+    ),
+    LegacyLayerRequest(
+        "GET",
+        "/api/v1/layers/features",
+        params={"layer_ids": str(LAYER_ID), "bbox": "0,0,1,1"},
+    ),
+    LegacyLayerRequest(
+        "GET",
+        f"/api/v1/layers/{LAYER_ID}/features/changes",
+        params={"bbox": "0,0,1,1", "since_revision": "0"},
+    ),
+    LegacyLayerRequest("GET", f"/api/v1/layers/{LAYER_ID}/tiles/3/4/2.mvt"),
+    LegacyLayerRequest(
+        "POST",
+        f"/api/v1/layers/{LAYER_ID}/features:batch",
+        json={"operations": [{"op": "delete", "id": str(FEATURE_ID), "version": 1}]},
+    ),
     LegacyLayerRequest(
         "POST",
         f"/api/v1/layers/{LAYER_ID}/features",
@@ -102,19 +150,80 @@ class FakeLayerService:
 class FakeFeatureService:
     def __init__(self):
         self.calls: list[tuple[str, UUID]] = []
+        self.revision = 7
 
-    async def get_features_from_bbox(self, layer_id, bbox, limit, after_id):
+    async def get_layer_revision(self, layer_id):
+        return self.revision
+
+    async def get_features_from_bbox(
+        self, layer_id, bbox, limit, after_id, rendering, revision, property_filters, order
+    ):
         self.calls.append(("get_features_from_bbox", layer_id))
-        return FeatureCollectionOut(
-            features=[],
-            meta=FeatureCollectionMetaOut(
+        self.property_filters = property_filters
+        self.order = order
+        self.after_id = after_id
+        self.rendering = rendering
+        self.passed_revision = revision
+        return (
+            FeatureCollectionOut(
+                features=[],
+                meta=FeatureCollectionMetaOut(
+                    bbox=(bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat),
+                    limit=limit or 500,
+                    returned=0,
+                    truncated=False,
+                ),
+            )
+            .model_dump_json()
+            .encode()
+        )
+
+    async def get_layer_revisions(self, layer_ids):
+        return {layer_id: self.revision for layer_id in layer_ids}
+
+    async def get_layers_features_from_bbox(self, layer_ids, bbox, limit, after_ids, rendering):
+        self.calls.append(("get_layers_features_from_bbox", layer_ids[0]))
+        self.layer_ids = layer_ids
+        self.after_ids = after_ids
+        return b'{"type":"LayerFeatureCollections","layers":{}}'
+
+    async def get_feature_aggregate(self, layer_id, bbox, grid):
+        self.calls.append(("get_feature_aggregate", layer_id))
+        self.grid = grid
+        return FeatureAggregateOut(
+            cells=[],
+            meta=FeatureAggregateMetaOut(
                 bbox=(bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat),
-                limit=limit or 500,
-                returned=0,
-                truncated=False,
+                zoom=grid.zoom,
+                cell_size=grid.cell_size,
+                cells=0,
+                features=0,
             ),
         )
 
+    async def get_features_in_filter(
+        self, layer_id, spatial_filter, limit, after_id, rendering, property_filters
+    ):
+        self.calls.append(("get_features_in_filter", layer_id))
+        self.property_filters = property_filters
+        self.spatial_filter = spatial_filter
+        self.rendering = rendering
+        return b'{"type":"FeatureCollection","features":[]}'
+
+    async def get_nearest_features(self, layer_id, query):
+        self.calls.append(("get_nearest_features", layer_id))
+        self.nearest_query = query
+        return b'{"type":"FeatureCollection","features":[],"meta":{"distances":[]}}'
+
+    async def get_feature_changes(self, layer_id, bbox, since_revision, since, limit):
+        self.calls.append(("get_feature_changes", layer_id))
+        self.since_revision = since_revision
+        return b'{"type":"FeatureCollection","features":[],"deleted":[]}'
+
+    async def get_layer_tile(self, layer_id, tile):
+        self.calls.append(("get_layer_tile", layer_id))
+        return b"\x1a\x00"
+
     async def create_feature(self, layer_id, request):
         self.calls.append(("create_feature", layer_id))
         return feature_out(version=1, properties=request.properties)
@@ -127,10 +236,19 @@ class FakeFeatureService:
         self.calls.append(("delete_feature", layer_id))
         return DeleteFeatureResponse(featureId=feature_id)
 
+    async def apply_feature_batch(self, layer_id, request):
+        self.calls.append(("apply_feature_batch", layer_id))
+        return BatchFeaturesResponse(applied=0, failed=0, results=[])
+
     async def get_feature(self, layer_id, feature_id):
         self.calls.append(("get_feature", layer_id))
         return feature_out(version=1, properties={"name": "Existing"})
 
+    async def get_feature_json(self, layer_id, feature_id, rendering):
+        self.calls.append(("get_feature_json", layer_id))
+        self.rendering = rendering
+        return f'{{"id":"{feature_id}","geometry":null,"properties":{{}}}}'.encode()
+
 
 def feature_out(version: int, properties: dict[str, object]) -> FeatureOut:
     return FeatureOut(
@@ -141,7 +259,38 @@ def feature_out(version: int, properties: dict[str, object]) -> FeatureOut:
     )
 
 
-def build_app(role: str, layer_service: FakeLayerService, feature_service: FakeFeatureService):
+class FakeFeatureImportService:
+    def __init__(self):
+        self.features: list[object] = []
+
+    async def import_features(self, layer_id, features):
+        self.features = [feature async for feature in features]
+        return FeatureImportOut(imported=len(self.features), revision=9)
+
+
+class FakeFeatureExportService:
+    layer_name = "points"
+    closed = 0
+
+    async def export_features(self, layer_id):
+        async def content():
+            yield b'{"id":"a"}\n'
+            yield b'{"id":"b"}\n'
+
+        async def close():
+            FakeFeatureExportService.closed += 1
+
+        return SimpleNamespace(
+            layer_name=self.layer_name, revision=11, content=content(), close=close
+        )
+
+
+def build_app(
+    role: str,
+    layer_service: FakeLayerService,
+    feature_service: FakeFeatureService,
+    feature_import_service: FakeFeatureImportService | None = None,
+):
     user = auth_user(role, user_id=USER_ID)
 
     async def get_user_by_id(_user_id):
@@ -156,6 +305,10 @@ def build_app(role: str, layer_service: FakeLayerService, feature_service: FakeF
     )
     app.dependency_overrides[get_layer_service] = lambda: layer_service
     app.dependency_overrides[get_feature_service] = lambda: feature_service
+    app.dependency_overrides[get_feature_export_service] = FakeFeatureExportService
+    app.dependency_overrides[get_feature_import_service] = lambda: (
+        feature_import_service or FakeFeatureImportService()
+    )
     return app
 
 
@@ -237,3 +390,535 @@ def test_legacy_layers_enabled_allows_editor_to_list_layers(monkeypatch) -> None
         ]
     }
     assert layer_service.get_layers_calls == 1
+
+
+def test_layer_tile_returns_mapbox_vector_tile_bytes(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/tiles/3/4/2.mvt", headers=auth_headers("editor")
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.mapbox-vector-tile"
+    assert response.content == b"\x1a\x00"
+    assert feature_service.calls == [("get_layer_tile", LAYER_ID)]
+
+
+def test_layer_tile_returns_not_modified_for_matching_etag(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+    url = f"/api/v1/layers/{LAYER_ID}/tiles/3/4/2.mvt"
+
+    first = client.get(url, headers=auth_headers("editor"))
+    etag = first.headers["etag"]
+    second = client.get(url, headers={**auth_headers("editor"), "If-None-Match": f"W/{etag}"})
+
+    assert etag.startswith('"r7-')
+    assert first.headers["x-layer-revision"] == "7"
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert feature_service.calls == [("get_layer_tile", LAYER_ID)]
+
+
+def test_layer_features_etag_changes_with_revision_and_query(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+    url = f"/api/v1/layers/{LAYER_ID}/features"
+
+    etag = client.get(url, params={"bbox": "0,0,1,1"}, headers=auth_headers("editor")).headers[
+        "etag"
+    ]
+    other_bbox = client.get(
+        url,
+        params={"bbox": "0,0,2,2"},
+        headers={**auth_headers("editor"), "If-None-Match": etag},
+    )
+    feature_service.revision = 8
+    after_write = client.get(
+        url,
+        params={"bbox": "0,0,1,1"},
+        headers={**auth_headers("editor"), "If-None-Match": etag},
+    )
+
+    assert other_bbox.status_code == 200
+    assert other_bbox.headers["etag"] != etag
+    assert after_write.status_code == 200
+    assert after_write.headers["etag"].startswith('"r8-')
+
+
+def test_layer_feature_changes_route_is_not_treated_as_feature_id(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features/changes",
+        params={"bbox": "0,0,1,1", "since_revision": 3},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["deleted"] == []
+    assert response.headers["x-layer-revision"] == "7"
+    assert feature_service.since_revision == 3
+    assert feature_service.calls == [("get_feature_changes", LAYER_ID)]
+
+
+def test_get_feature_returns_not_modified_for_matching_etag(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+    url = f"/api/v1/layers/{LAYER_ID}/features/{FEATURE_ID}"
+
+    first = client.get(url, headers=auth_headers("editor"))
+    second = client.get(
+        url, headers={**auth_headers("editor"), "If-None-Match": first.headers["etag"]}
+    )
+
+    assert first.status_code == 200
+    assert first.json()["properties"] == {"name": "Existing"}
+    assert second.status_code == 304
+    assert feature_service.calls == [("get_feature", LAYER_ID)]
+
+
+def test_get_feature_with_projection_returns_feature_json_from_service(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features/{FEATURE_ID}",
+        params={"geometry": "false", "fields": ""},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["geometry"] is None
+    assert response.headers["etag"].startswith('"r7-')
+    assert feature_service.calls == [("get_feature_json", LAYER_ID)]
+    assert feature_service.rendering.fields == ()
+
+
+def test_layer_features_pass_projection_to_service(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features",
+        params={"bbox": "0,0,1,1", "zoom": "8", "fields": "name,dn", "geometry": "false"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert feature_service.rendering.fields == ("name", "dn")
+    assert feature_service.rendering.geometry is False
+    assert feature_service.rendering.tolerance == pytest.approx(360 / (256 * 256))
+
+
+def test_layer_features_pass_spatial_order_and_cursor_to_service(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features",
+        params={"bbox": "0,0,1,1", "sort": "spatial", "after": f"s000pbpcbpcb:{FEATURE_ID}"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert feature_service.order.spatial
+    assert feature_service.order.after_key == "s000pbpcbpcb"
+    assert feature_service.after_id == FEATURE_ID
+
+
+def test_layer_features_reject_spatial_cursor_with_id_order(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features",
+        params={"bbox": "0,0,1,1", "after": f"s000pbpcbpcb:{FEATURE_ID}"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 422
+    assert feature_service.calls == []
+
+
+def test_layer_tile_rejects_coordinates_outside_zoom_grid(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/tiles/2/4/0.mvt", headers=auth_headers("editor")
+    )
+
+    assert response.status_code == 422
+    assert feature_service.calls == []
+
+
+def test_layer_features_return_feature_collection_bytes_from_service(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features",
+        params={"bbox": "0,0,1,1", "limit": "10"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["type"] == "FeatureCollection"
+    assert body["meta"]["bbox"] == [0.0, 0.0, 1.0, 1.0]
+    assert body["meta"]["limit"] == 10
+    assert feature_service.calls == [("get_features_from_bbox", LAYER_ID)]
+    assert feature_service.passed_revision == 7
+
+
+def test_layer_features_pass_zoom_based_rendering_to_service(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features",
+        params={"bbox": "0,0,1,1", "zoom": "8", "precision": "6"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert feature_service.rendering.tolerance == pytest.approx(360 / (256 * 256))
+    assert feature_service.rendering.precision == 6
+
+
+def test_layer_features_pass_property_filters_to_service(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features",
+        params=[("bbox", "0,0,1,1"), ("filter", "status:eq:active"), ("filter", "dn:lt:200")],
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert [(f.key, f.op, f.values) for f in feature_service.property_filters] == [
+        ("status", "eq", ("active",)),
+        ("dn", "lt", (200,)),
+    ]
+
+
+def test_layer_features_reject_unknown_filter_operator(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features",
+        params={"bbox": "0,0,1,1", "filter": "status:like:act%"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 422
+    assert feature_service.calls == []
+
+
+def test_layer_features_reject_zoom_together_with_tolerance(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features",
+        params={"bbox": "0,0,1,1", "zoom": "8", "tolerance": "0.01"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 422
+    assert feature_service.calls == []
+
+
+def test_feature_batch_route_passes_request_to_service(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.post(
+        f"/api/v1/layers/{LAYER_ID}/features:batch",
+        json={"operations": [{"op": "delete", "id": str(FEATURE_ID), "version": 1}]},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"applied": 0, "failed": 0, "results": []}
+    assert feature_service.calls == [("apply_feature_batch", LAYER_ID)]
+
+
+def test_feature_batch_rejects_unknown_operation(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.post(
+        f"/api/v1/layers/{LAYER_ID}/features:batch",
+        json={"operations": [{"op": "upsert", "id": str(FEATURE_ID), "version": 1}]},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 422
+    assert feature_service.calls == []
+
+
+def test_layers_features_read_several_layers_with_per_layer_cursors(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+    other_layer_id = uuid4()
+
+    response = client.get(
+        "/api/v1/layers/features",
+        params=[
+            ("layer_ids", f"{LAYER_ID},{other_layer_id},{LAYER_ID}"),
+            ("bbox", "0,0,1,1"),
+            ("after", f"{other_layer_id}:{FEATURE_ID}"),
+        ],
+        headers=auth_headers("editor"),
+    )
+    second = client.get(
+        "/api/v1/layers/features",
+        params=[
+            ("layer_ids", f"{LAYER_ID},{other_layer_id},{LAYER_ID}"),
+            ("bbox", "0,0,1,1"),
+            ("after", f"{other_layer_id}:{FEATURE_ID}"),
+        ],
+        headers={**auth_headers("editor"), "If-None-Match": response.headers["etag"]},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["type"] == "LayerFeatureCollections"
+    assert response.headers["etag"].startswith('"m14-')
+    assert "x-layer-revision" not in response.headers
+    assert feature_service.layer_ids == [LAYER_ID, other_layer_id]
+    assert feature_service.after_ids == {other_layer_id: FEATURE_ID}
+    assert second.status_code == 304
+    assert feature_service.calls == [("get_layers_features_from_bbox", LAYER_ID)]
+
+
+def test_layers_features_reject_cursor_for_layer_outside_request(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        "/api/v1/layers/features",
+        params={"layer_ids": str(LAYER_ID), "bbox": "0,0,1,1", "after": f"{uuid4()}:{FEATURE_ID}"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 422
+    assert feature_service.calls == []
+
+
+def test_layer_feature_aggregate_returns_cells_with_revision_etag(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+    url = f"/api/v1/layers/{LAYER_ID}/features/aggregate"
+    params = {"bbox": "30,50,40,60", "zoom": "6"}
+
+    first = client.get(url, params=params, headers=auth_headers("editor"))
+    second = client.get(
+        url,
+        params=params,
+        headers={**auth_headers("editor"), "If-None-Match": first.headers["etag"]},
+    )
+
+    assert first.status_code == 200
+    assert first.json()["type"] == "FeatureAggregate"
+    assert first.headers["etag"].startswith('"r7-')
+    assert feature_service.grid.zoom == 6
+    assert second.status_code == 304
+    assert feature_service.calls == [("get_feature_aggregate", LAYER_ID)]
+
+
+def test_layer_feature_aggregate_rejects_bbox_with_too_many_cells(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features/aggregate",
+        params={"bbox": "-180,-90,180,90", "zoom": "12"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 422
+    assert feature_service.calls == []
+
+
+def test_query_layer_features_parses_buffered_line_filter(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.post(
+        f"/api/v1/layers/{LAYER_ID}/features:query",
+        params={"zoom": "12"},
+        json={
+            "geometry": {"type": "LineString", "coordinates": [[30.0, 50.0], [32.0, 53.0]]},
+            "buffer": 250,
+        },
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert feature_service.calls == [("get_features_in_filter", LAYER_ID)]
+    assert feature_service.spatial_filter.buffer == 250.0
+    assert feature_service.rendering.simplified is True
+
+
+def test_query_layer_features_rejects_line_without_buffer(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.post(
+        f"/api/v1/layers/{LAYER_ID}/features:query",
+        json={"geometry": {"type": "LineString", "coordinates": [[30.0, 50.0], [32.0, 53.0]]}},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 422
+    assert feature_service.calls == []
+
+
+def test_layer_nearest_features_passes_query_and_returns_revision_etag(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features/nearest",
+        params={"lon": "37.6", "lat": "55.7", "k": "3", "max_distance": "250"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["type"] == "FeatureCollection"
+    assert response.headers["etag"].startswith('"r7-')
+    assert feature_service.calls == [("get_nearest_features", LAYER_ID)]
+    assert feature_service.nearest_query.k == 3
+    assert feature_service.nearest_query.max_distance == 250.0
+
+
+def test_layer_nearest_features_rejects_too_many_neighbours(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_service = FakeFeatureService()
+    client = TestClient(build_app("editor", FakeLayerService(), feature_service))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features/nearest",
+        params={"lon": "37.6", "lat": "55.7", "k": "1000"},
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 422
+    assert feature_service.calls == []
+
+
+def test_import_features_streams_request_body_to_service(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    feature_import_service = FakeFeatureImportService()
+    client = TestClient(
+        build_app("editor", FakeLayerService(), FakeFeatureService(), feature_import_service)
+    )
+    feature = {"type": "Feature", "geometry": {"type": "Point", "coordinates": [1.0, 2.0]}}
+
+    response = client.post(
+        f"/api/v1/layers/{LAYER_ID}/features:import",
+        params={"format": "ndjson"},
+        content="\n".join(json.dumps(feature) for _ in range(3)),
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"imported": 3, "revision": 9}
+    assert feature_import_service.features == [feature] * 3
+
+
+def test_import_features_rejects_unknown_format(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    client = TestClient(build_app("editor", FakeLayerService(), FakeFeatureService()))
+
+    response = client.post(
+        f"/api/v1/layers/{LAYER_ID}/features:import",
+        params={"format": "csv"},
+        content=b"",
+        headers=auth_headers("editor"),
+    )
+
+    assert response.status_code == 422
+
+
+def test_export_features_streams_ndjson_attachment(monkeypatch) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    monkeypatch.setattr(FakeFeatureExportService, "closed", 0)
+    client = TestClient(build_app("editor", FakeLayerService(), FakeFeatureService()))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features:export", headers=auth_headers("editor")
+    )
+
+    assert FakeFeatureExportService.closed == 1
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == (
+        "attachment; filename=\"points.ndjson\"; filename*=UTF-8''points.ndjson"
+    )
+    assert response.headers["x-layer-revision"] == "11"
+    assert response.content == b'{"id":"a"}\n{"id":"b"}\n'
+
+
+@pytest.mark.parametrize(
+    ("layer_name", "content_disposition"),
+    [
+        (
+            'pipes "north"',
+            'attachment; filename="pipes_north.ndjson"; '
+            "filename*=UTF-8''pipes%20%22north%22.ndjson",
+        ),
+        (
+            "Трубы",
+            'attachment; filename="layer.ndjson"; '
+            "filename*=UTF-8''%D0%A2%D1%80%D1%83%D0%B1%D1%8B.ndjson",
+        ),
+    ],
+)
+def test_export_features_escapes_layer_name_in_content_disposition(
+    monkeypatch, layer_name: str, content_disposition: str
+) -> None:
+    monkeypatch.setattr(auth_api.settings, "legacy_gis_api_enabled", True)
+    monkeypatch.setattr(FakeFeatureExportService, "layer_name", layer_name)
+    client = TestClient(build_app("editor", FakeLayerService(), FakeFeatureService()))
+
+    response = client.get(
+        f"/api/v1/layers/{LAYER_ID}/features:export", headers=auth_headers("editor")
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == content_disposition
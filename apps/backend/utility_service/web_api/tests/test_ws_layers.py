@@ -254,6 +254,40 @@ def test_ws_layer_subscription_accepts_valid_editor_ticket() -> None:
     assert connection_manager.get_connection_count(layer_id) == 0
 
 
+def test_ws_layer_subscription_answers_invalid_viewport_and_keeps_connection() -> None:
+    layer_id = uuid4()
+    ticket = "editor-ticket"
+    ticket_service = FakeWebSocketTicketService(ticket=ticket)
+    ticket_service.user_context = WebSocketUserContext(
+        user_id=uuid4(), email="editor@example.com", role="editor"
+    )
+
+    async def get_user_by_id(_user_id):
+        return None
+
+    async def get_layer_by_id(_layer_id):
+        return SimpleNamespace(id=layer_id)
+
+    auth_service = SimpleNamespace(get_user_by_id=get_user_by_id)
+    layer_service = SimpleNamespace(get_layer_by_id=get_layer_by_id)
+    connection_manager = WebSocketConnectionManager()
+    app = create_test_app(auth_service, layer_service, connection_manager, ticket_service)
+
+    with TestClient(app) as client:
+        with client.websocket_connect(f"/api/v1/ws/layers/{layer_id}?ticket={ticket}") as websocket:
+            websocket.receive_json()
+            websocket.send_json({"type": "viewport", "bbox": [37.6, 55.7, 37.5, 55.8]})
+            rejected = websocket.receive_json()
+            websocket.send_json({"type": "viewport", "bbox": [37.5, 55.7, 37.6, 55.8]})
+            websocket.send_json({"type": "ping"})
+            assert connection_manager.get_connection_count(layer_id) == 1
+
+    assert rejected == {
+        "type": "viewport_rejected",
+        "message": "Минимальная долгота должна быть меньше максимальной",
+    }
+
+
 def test_ws_layer_subscription_rejects_missing_ticket() -> None:
     layer_id = uuid4()
     ticket_service = FakeWebSocketTicketService()
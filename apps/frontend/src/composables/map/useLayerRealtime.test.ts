@@ -238,6 +238,29 @@ describe("useLayerRealtime", () => {
     expect(realtime.isReconnecting.value).toBe(false);
   });
 
+  it("resyncs the layer when the server reports dropped events", async () => {
+    const onReconnectSynced = vi.fn();
+    const { useLayerRealtime } =
+      await import("@/composables/map/useLayerRealtime");
+    const realtime = useLayerRealtime({
+      onReconnectSynced,
+    });
+
+    await realtime.connectToLayer("layer-1");
+    const socket = getSocketAt(0);
+    socket.emitOpen();
+    socket.emitMessage({ type: "connected", layerId: "layer-1" });
+    await flushPromises();
+    expect(onReconnectSynced).not.toHaveBeenCalled();
+
+    socket.emitMessage({ type: "resync_required", layerId: "layer-1" });
+    await flushPromises();
+
+    expect(onReconnectSynced).toHaveBeenCalledWith("layer-1");
+    expect(FakeWebSocket.instances).toHaveLength(1);
+    expect(realtime.isConnected.value).toBe(true);
+  });
+
   it("does not reconnect after intentional disconnect", async () => {
     const { useLayerRealtime } =
       await import("@/composables/map/useLayerRealtime");
@@ -5,6 +5,7 @@ import {
   parseLayerRealtimeEvent,
   type FeatureCreatedEvent,
   type FeatureDeletedEvent,
+  type FeaturesBatchEvent,
   type FeatureUpdatedEvent,
 } from "@/contracts/realtime";
 import type { ApiFeature } from "@/contracts/geojson";
@@ -166,6 +167,11 @@ export function useLayerRealtime(options: UseLayerRealtimeOptions = {}) {
         return;
       }
 
+      if (parsed.type === "resync_required") {
+        void syncLayer(generation, layerId);
+        return;
+      }
+
       if (parsed.type === "feature_created") {
         void routeCreatedEvent(parsed);
         return;
@@ -176,6 +182,11 @@ export function useLayerRealtime(options: UseLayerRealtimeOptions = {}) {
         return;
       }
 
+      if (parsed.type === "features_batch") {
+        void routeBatchEvent(parsed);
+        return;
+      }
+
       void routeDeletedEvent(parsed);
     });
 
@@ -227,6 +238,16 @@ export function useLayerRealtime(options: UseLayerRealtimeOptions = {}) {
     }
 
     reconnectAttempt = 0;
+    await syncLayer(generation, layerId);
+  }
+
+  // Runs after a reconnect and when the server reports that it dropped events for
+  // this client (resync_required): either way local state may have missed changes.
+  async function syncLayer(generation: number, layerId: string): Promise<void> {
+    if (generation !== activeGeneration) {
+      return;
+    }
+
     isSyncingAfterReconnect.value = true;
     try {
       await options.onReconnectSynced?.(layerId);
@@ -275,6 +296,18 @@ export function useLayerRealtime(options: UseLayerRealtimeOptions = {}) {
     await options.onFeatureDeleted?.(event.layerId, event.featureId);
   }
 
+  async function routeBatchEvent(event: FeaturesBatchEvent): Promise<void> {
+    for (const feature of event.created) {
+      await options.onFeatureCreated?.(event.layerId, feature);
+    }
+    for (const feature of event.updated) {
+      await options.onFeatureUpdated?.(event.layerId, feature);
+    }
+    for (const featureId of event.deleted) {
+      await options.onFeatureDeleted?.(event.layerId, featureId);
+    }
+  }
+
   function closeActiveSocketIfNeeded(): void {
     if (!socket.value) {
       return;
@@ -39,6 +39,15 @@ describe("realtime contracts", () => {
     });
   });
 
+  it("accepts resync required events", () => {
+    expect(
+      isLayerRealtimeEvent({
+        type: "resync_required",
+        layerId: "layer-1",
+      }),
+    ).toBe(true);
+  });
+
   it("accepts feature update events with full feature payload", () => {
     expect(
       isLayerRealtimeEvent({
@@ -51,6 +60,20 @@ describe("realtime contracts", () => {
     ).toBe(true);
   });
 
+  it("accepts batch events with created, updated and deleted features", () => {
+    expect(
+      isLayerRealtimeEvent({
+        type: "features_batch",
+        eventId: "evt_123",
+        occurredAt: "2026-04-14T10:20:30Z",
+        layerId: "layer-1",
+        created: [feature],
+        updated: [],
+        deleted: ["feature-2"],
+      }),
+    ).toBe(true);
+  });
+
   it("rejects invalid realtime payloads", () => {
     expect(
       isLayerRealtimeEvent({
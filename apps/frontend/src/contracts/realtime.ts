@@ -7,6 +7,11 @@ export type RealtimeConnectedEvent = {
   layerId: string;
 };
 
+export type RealtimeResyncRequiredEvent = {
+  type: "resync_required";
+  layerId: string;
+};
+
 export type FeatureCreatedEvent = {
   type: "feature_created";
   eventId: string;
@@ -31,11 +36,23 @@ export type FeatureDeletedEvent = {
   featureId: string;
 };
 
+export type FeaturesBatchEvent = {
+  type: "features_batch";
+  eventId: string;
+  occurredAt: string;
+  layerId: string;
+  created: ApiFeature[];
+  updated: ApiFeature[];
+  deleted: string[];
+};
+
 export type LayerRealtimeEvent =
   | RealtimeConnectedEvent
+  | RealtimeResyncRequiredEvent
   | FeatureCreatedEvent
   | FeatureUpdatedEvent
-  | FeatureDeletedEvent;
+  | FeatureDeletedEvent
+  | FeaturesBatchEvent;
 
 export function parseLayerRealtimeEvent(
   raw: string | unknown,
@@ -60,12 +77,16 @@ export function isLayerRealtimeEvent(raw: unknown): raw is LayerRealtimeEvent {
   switch (raw.type) {
     case "connected":
       return isConnectedEvent(raw);
+    case "resync_required":
+      return isResyncRequiredEvent(raw);
     case "feature_created":
       return isFeatureCreatedEvent(raw);
     case "feature_updated":
       return isFeatureUpdatedEvent(raw);
     case "feature_deleted":
       return isFeatureDeletedEvent(raw);
+    case "features_batch":
+      return isFeaturesBatchEvent(raw);
     default:
       return false;
   }
@@ -88,6 +109,14 @@ function isConnectedEvent(raw: unknown): raw is RealtimeConnectedEvent {
   return isRecord(raw) && raw.type === "connected" && isString(raw.layerId);
 }
 
+function isResyncRequiredEvent(
+  raw: unknown,
+): raw is RealtimeResyncRequiredEvent {
+  return (
+    isRecord(raw) && raw.type === "resync_required" && isString(raw.layerId)
+  );
+}
+
 function isFeatureCreatedEvent(raw: unknown): raw is FeatureCreatedEvent {
   return (
     isRecord(raw) &&
@@ -114,3 +143,17 @@ function isFeatureDeletedEvent(raw: unknown): raw is FeatureDeletedEvent {
     isString(raw.featureId)
   );
 }
+
+function isFeaturesBatchEvent(raw: unknown): raw is FeaturesBatchEvent {
+  return (
+    isRecord(raw) &&
+    raw.type === "features_batch" &&
+    hasBaseFeatureRealtimeFields(raw) &&
+    Array.isArray(raw.created) &&
+    raw.created.every((feature) => isApiFeature(feature)) &&
+    Array.isArray(raw.updated) &&
+    raw.updated.every((feature) => isApiFeature(feature)) &&
+    Array.isArray(raw.deleted) &&
+    raw.deleted.every((featureId) => isString(featureId))
+  );
+}